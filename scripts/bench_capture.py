@@ -0,0 +1,95 @@
+"""캡처 grab 지연 벤치마크: 프레임별 mss 컨텍스트 vs 세션 재사용 + 링 버퍼.
+
+실제 디스플레이 없이 측정하기 위해 세션 생성/종료 비용을 흉내내는 가짜 mss를 쓴다.
+
+    python scripts/bench_capture.py [--frames 200] [--setup-ms 2.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+from aion2meter.capture.mss_capture import MssCapture
+from aion2meter.models import ROI
+
+
+class _FakeMss:
+    """mss.mss() 대역: 생성/종료 시 디스플레이 핸들 비용을 sleep으로 흉내낸다."""
+
+    def __init__(self, setup_s: float) -> None:
+        self._setup_s = setup_s
+        time.sleep(setup_s)
+
+    def grab(self, monitor: dict[str, int]) -> np.ndarray:
+        return np.zeros((monitor["height"], monitor["width"], 4), dtype=np.uint8)
+
+    def close(self) -> None:
+        time.sleep(self._setup_s / 2)
+
+    def __enter__(self) -> _FakeMss:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _grab_per_frame_context(roi: ROI) -> np.ndarray:
+    """이전 구현: 프레임마다 mss 컨텍스트를 열고 닫는다.
+
+    np.array 복사 + 비연속 뷰 → 다운스트림 cv2 호출이 다시 연속 배열로 복사한다.
+    """
+    import mss
+
+    with mss.mss() as sct:
+        raw = sct.grab(roi.as_dict())
+        image = np.array(raw)[:, :, :3]
+        return np.ascontiguousarray(image)
+
+
+def _measure(fn, frames: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(name: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{name:<24} mean={statistics.mean(samples):7.3f}ms "
+        f"p50={statistics.median(samples):7.3f}ms p95={p95:7.3f}ms"
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--frames", type=int, default=200)
+    ap.add_argument("--setup-ms", type=float, default=2.0)
+    args = ap.parse_args()
+
+    roi = ROI(left=0, top=0, width=600, height=300)
+    setup_s = args.setup_ms / 1000
+
+    with patch("mss.mss", side_effect=lambda: _FakeMss(setup_s)):
+        before = _measure(lambda: _grab_per_frame_context(roi), args.frames)
+
+        capturer = MssCapture()
+        capturer.open()
+        after = _measure(lambda: capturer.capture(roi), args.frames)
+        capturer.close()
+
+    print(f"ROI {roi.width}x{roi.height}, frames={args.frames}, fake setup={args.setup_ms}ms")
+    _report("before (context/frame)", before)
+    _report("after (persistent)", after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""프레임 변화 감지 벤치마크: 5지점 샘플링 vs FrameChangeDetector.
+
+녹화된 프레임 시퀀스(OcrDebugger 덤프의 frame_*/raw.png)를 주면 그것을, 없으면
+스크롤되는 합성 전투 로그(모서리 깜빡임 포함)를 사용해 스킵률과 프레임당 비용을 잰다.
+
+    python scripts/bench_change_detector.py [--frames-dir ~/.aion2meter/debug]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from aion2meter.preprocess.change_detector import FrameChangeDetector
+
+
+def _load_frames(frames_dir: Path) -> list[np.ndarray]:
+    frames = []
+    for path in sorted(frames_dir.glob("frame_*/raw.png")):
+        image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if image is not None:
+            frames.append(image)
+    return frames
+
+
+def _synthetic_frames(
+    count: int = 300, h: int = 250, w: int = 600,
+) -> tuple[list[np.ndarray], list[bool]]:
+    """스크롤 로그 합성 시퀀스와 프레임별 실제 변화 여부를 반환한다."""
+    rng = np.random.RandomState(0)
+    line_h = 18
+    lines = [
+        np.where(rng.random((line_h - 4, w - 20)) < 0.25, 220, 25).astype(np.uint8)
+        for _ in range(count)
+    ]
+    frames, truth = [], []
+    head = 0
+    for i in range(count):
+        changed = i == 0 or rng.random() < 0.3
+        if changed and i > 0:
+            head += 1
+        image = np.full((h, w, 3), 25, dtype=np.uint8)
+        visible = lines[head:head + h // line_h]
+        for row, strip in enumerate(visible):
+            y = row * line_h + 2
+            image[y:y + strip.shape[0], 10:10 + strip.shape[1]] = strip[:, :, None]
+        # 모서리 UI 깜빡임 (실제 로그 변화 아님)
+        if i % 2:
+            image[0:2, 0:2] = 33
+        frames.append(image)
+        truth.append(changed)
+    return frames, truth
+
+
+def _sample_points(image: np.ndarray) -> tuple:
+    """이전 구현: 5지점 픽셀 샘플."""
+    h, w = image.shape[:2]
+    points = [(0, 0), (0, w - 1), (h - 1, 0), (h - 1, w - 1), (h // 2, w // 2)]
+    return tuple(image[y, x].tobytes() for y, x in points)
+
+
+def _run_sampling(frames: list[np.ndarray]) -> tuple[list[bool], list[float]]:
+    skips, costs = [], []
+    prev = None
+    for image in frames:
+        start = time.perf_counter()
+        sample = _sample_points(image)
+        skip = prev is not None and sample == prev
+        prev = sample
+        costs.append((time.perf_counter() - start) * 1000)
+        skips.append(skip)
+    return skips, costs
+
+
+def _run_detector(frames: list[np.ndarray]) -> tuple[list[bool], list[float]]:
+    det = FrameChangeDetector()
+    skips, costs = [], []
+    for image in frames:
+        start = time.perf_counter()
+        skip = det.detect(image).identical
+        costs.append((time.perf_counter() - start) * 1000)
+        skips.append(skip)
+    return skips, costs
+
+
+def _report(name: str, skips: list[bool], costs: list[float], truth: list[bool] | None) -> None:
+    line = (
+        f"{name:<14} skip={sum(skips) / len(skips):6.1%} "
+        f"mean={statistics.mean(costs):.4f}ms p95={sorted(costs)[int(len(costs) * 0.95) - 1]:.4f}ms"
+    )
+    if truth is not None:
+        missed = sum(1 for s, t in zip(skips, truth) if s and t)
+        wasted = sum(1 for s, t in zip(skips, truth) if not s and not t)
+        line += f" missed_changes={missed} wasted_ocr={wasted}"
+    print(line)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--frames-dir", type=Path, default=None)
+    args = ap.parse_args()
+
+    truth: list[bool] | None = None
+    if args.frames_dir is not None:
+        frames = _load_frames(args.frames_dir.expanduser())
+        if not frames:
+            raise SystemExit(f"프레임이 없습니다: {args.frames_dir}")
+    else:
+        frames, truth = _synthetic_frames()
+
+    h, w = frames[0].shape[:2]
+    print(f"{len(frames)} frames, ROI {w}x{h}")
+    _report("5-point", *_run_sampling(frames), truth)
+    _report("detector", *_run_detector(frames), truth)
+
+
+if __name__ == "__main__":
+    main()
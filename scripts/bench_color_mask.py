@@ -0,0 +1,60 @@
+"""색상 마스크 벤치마크: 범위별 inRange 루프 vs 비트마스크 LUT 단일 패스.
+
+    python scripts/bench_color_mask.py [--width 1200] [--height 500] [--iterations 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import cv2
+import numpy as np
+
+from aion2meter.models import AppConfig, ColorRange
+from aion2meter.preprocess.image_proc import CombatLogPreprocessor
+
+
+def _mask_loop(image: np.ndarray, ranges: list[ColorRange]) -> np.ndarray:
+    """이전 구현: 범위마다 inRange + bitwise_or, 마지막에 np.where 이진화."""
+    combined = np.zeros(image.shape[:2], dtype=np.uint8)
+    for cr in ranges:
+        mask = cv2.inRange(image, np.array(cr.lower, np.uint8), np.array(cr.upper, np.uint8))
+        combined = cv2.bitwise_or(combined, mask)
+    return np.where(combined > 0, np.uint8(255), np.uint8(0)).astype(np.uint8)
+
+
+def _time(fn, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--width", type=int, default=1200)
+    ap.add_argument("--height", type=int, default=500)
+    ap.add_argument("--iterations", type=int, default=200)
+    args = ap.parse_args()
+
+    ranges = AppConfig.default_color_ranges()
+    image = np.random.RandomState(0).randint(0, 256, (args.height, args.width, 3), dtype=np.uint8)
+    proc = CombatLogPreprocessor(color_ranges=ranges)
+
+    assert np.array_equal(_mask_loop(image, ranges), proc._color_mask(image))
+
+    print(f"{args.width}x{args.height}, {len(ranges)} ranges")
+    for name, fn in (
+        ("inRange loop", lambda: _mask_loop(image, ranges)),
+        ("bitmask LUT", lambda: proc._color_mask(image)),
+    ):
+        samples = _time(fn, args.iterations)
+        print(f"{name:<14} mean={statistics.mean(samples):.3f}ms p50={statistics.median(samples):.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
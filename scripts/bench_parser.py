@@ -0,0 +1,175 @@
+"""전투 로그 파서 벤치마크: 패턴 순차 search vs "에게" 분할 후 디스패치.
+
+실제 전투 로그 줄과 OCR로 깨진 줄(노이즈, "에게" 없는 줄, 키워드가 빠진 줄)을 섞은
+코퍼스로 줄당 비용을 비교하고, 두 구현의 결과가 같은지도 확인한다.
+parse() 행은 키워드 필터와 OCR 보정까지 포함한 줄당 비용이다 (줄 memo 끔/켬).
+batch 행은 10줄짜리 프레임 텍스트를 parse_batch로 흘린 비용이다 (--workers면 프로세스 분산).
+
+    python scripts/bench_parser.py [--lines 20000] [--garbled 0.5] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+from aion2meter.models import DamageEvent, HitType
+from aion2meter.parser import combat_parser as cp
+from aion2meter.parser.combat_parser import KoreanCombatParser
+
+_REAL = [
+    "몬스터에게 검격을 사용해 1,234의 대미지를 줬습니다.",
+    "몬스터에게 치명타 검격을 사용해 2,468의 대미지를 줬습니다.",
+    "정예 수호병에게 강타 치명타 연속 베기를 사용해 13,702의 대미지를 줬습니다.",
+    "훈련용 허수아비에게 완벽 화염 폭발을 사용해 1,851의 대미지를 줬습니다.",
+    "몬스터에게 추가로 320의 대미지를 줬습니다.",
+    "몬스터에게 검격을 사용했지만 빗나갔습니다.",
+    "몬스터에게 마법 화살을 사용했지만 저항했습니다.",
+    "몬스터에게 검격을 사용해 출혈 효과로 1,O2l의 대미지를 줬습니다.",
+]
+
+_NOISE = "가나다라마바사아자차카타파하은는이가을를에게의 ,.:;'\"-_|/\\()[]0123456789OolIBSZ"
+
+
+def _legacy_patterns() -> list[tuple[str, re.Pattern[str]]]:
+    """이전 구현: 줄마다 "(.*?)에게"로 시작하는 패턴 6개를 차례로 search."""
+    n, s = cp._NUM, cp._NUM_START
+    return [
+        ("additional", re.compile(rf"(.*?)에게\s*추가로\s*({s}{n}*)\s*의\s*대미지를\s*줬습니다")),
+        ("miss", re.compile(r"(.*?)에게\s+(.*?)[을를]\s*사용했지만\s*빗나갔습니다")),
+        ("resist", re.compile(r"(.*?)에게\s+(.*?)[을를]\s*사용했지만\s*저항했습니다")),
+        ("modifier", re.compile(
+            rf"(.*?)에게\s*(강타\s*치명타|완벽\s*치명타|치명타|완벽|강타)\s+(.*?)[을를]\s*사용해\s*.*?({s}{n}*)\s*의\s*대미지를\s*줬습니다"
+        )),
+        ("normal", re.compile(rf"(.*?)에게\s+(.*?)[을를]\s*사용해\s*.*?({s}{n}*)\s*의\s*대미지를\s*줬습니다")),
+        ("fuzzy", re.compile(rf"(.*?)에게\s+.*?({s}{n}*)\s*의\s*대미지")),
+    ]
+
+
+_LEGACY = _legacy_patterns()
+
+
+def _legacy_parse_line(line: str, timestamp: float) -> DamageEvent | None:
+    for kind, pattern in _LEGACY:
+        m = pattern.search(line)
+        if not m:
+            continue
+        target = m.group(1).strip()
+        if kind == "additional":
+            return DamageEvent(timestamp, "", target, "", cp._parse_number(m.group(2)), HitType.NORMAL, True)
+        if kind in ("miss", "resist"):
+            hit = HitType.MISS if kind == "miss" else HitType.RESIST
+            return DamageEvent(timestamp, "", target, m.group(2).strip(), 0, hit)
+        if kind == "modifier":
+            key = re.sub(r"\s+", " ", m.group(2).strip())
+            return DamageEvent(
+                timestamp, "", target, m.group(3).strip(), cp._parse_number(m.group(4)),
+                cp._HIT_TYPE_MAP.get(key, HitType.NORMAL),
+            )
+        if kind == "normal":
+            return DamageEvent(timestamp, "", target, m.group(2).strip(), cp._parse_number(m.group(3)), HitType.NORMAL)
+        try:
+            damage = cp._parse_number(m.group(2))
+        except (ValueError, IndexError):
+            return None
+        if damage <= 0:
+            return None
+        return DamageEvent(timestamp, "", target, "", damage, HitType.NORMAL)
+    return None
+
+
+def _garble(rng: random.Random, line: str) -> str:
+    kind = rng.randrange(4)
+    if kind == 0:
+        # 완전한 노이즈
+        return "".join(rng.choice(_NOISE) for _ in range(rng.randint(10, 60)))
+    if kind == 1:
+        # "에게"가 깨진 줄
+        return line.replace("에게", rng.choice(["애게", "에계", "에 게", ""]))
+    if kind == 2:
+        # 키워드 일부가 깨진 줄
+        return line.replace("대미지", rng.choice(["대ㅁ지", "대미", "데미지"])).replace("사용", "사웅")
+    # 글자 몇 개를 노이즈로 치환
+    chars = list(line)
+    for _ in range(rng.randint(1, 5)):
+        chars[rng.randrange(len(chars))] = rng.choice(_NOISE)
+    return "".join(chars)
+
+
+def _corpus(n: int, garbled: float, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n):
+        line = rng.choice(_REAL)
+        lines.append(_garble(rng, line) if rng.random() < garbled else line)
+    return lines
+
+
+def _outcome(parse_line, line: str) -> object:
+    """파싱 결과. 깨진 숫자의 ValueError는 None과 같게 본다 (parse()는 unmatched로 센다)."""
+    try:
+        return parse_line(line, 1.0)
+    except ValueError:
+        return None
+
+
+def _run(parse_line, lines: list[str]) -> None:
+    for line in lines:
+        try:
+            parse_line(line, 1.0)
+        except ValueError:
+            pass
+
+
+def _best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--lines", type=int, default=20000)
+    ap.add_argument("--garbled", type=float, default=0.5, help="깨진 줄 비율")
+    ap.add_argument("--workers", type=int, default=0, help="parse_batch 프로세스 수")
+    args = ap.parse_args()
+
+    parser = KoreanCombatParser()
+    lines = [cp._fix_ocr_text(line) for line in _corpus(args.lines, args.garbled)]
+
+    outcomes = [_outcome(parser._parse_line, line) for line in lines]
+    mismatches = sum(o != _outcome(_legacy_parse_line, line) for o, line in zip(outcomes, lines))
+    legacy = _best_of(lambda: _run(_legacy_parse_line, lines))
+    dispatch = _best_of(lambda: _run(parser._parse_line, lines))
+    matched = sum(isinstance(o, DamageEvent) for o in outcomes)
+    raw_lines = _corpus(args.lines, args.garbled)
+    cold = KoreanCombatParser(memo_size=0)
+    full = _best_of(lambda: _run(cold.parse, raw_lines))
+    memo = _best_of(lambda: _run(parser.parse, raw_lines))
+    parser.reset_stats()
+    _run(parser.parse, raw_lines)
+
+    print(f"{len(lines)} lines ({args.garbled:.0%} garbled), {matched} events, {mismatches} mismatches")
+    print(f"{'sequential':>12} {legacy / len(lines) * 1e6:>8.2f}us/line")
+    print(f"{'dispatch':>12} {dispatch / len(lines) * 1e6:>8.2f}us/line  ({legacy / dispatch:.1f}x)")
+    print(f"{'parse()':>12} {full / len(lines) * 1e6:>8.2f}us/line  {parser.line_stats}")
+    print(f"{'memo':>12} {memo / len(lines) * 1e6:>8.2f}us/line  {parser.memo_stats}")
+
+    frames = [("\n".join(raw_lines[i : i + 10]), i / 100) for i in range(0, len(raw_lines), 10)]
+    batch_parser = KoreanCombatParser(memo_size=0)
+    batch = _best_of(lambda: sum(1 for _ in batch_parser.parse_batch(frames)), repeat=3)
+    print(f"{'batch':>12} {batch / len(lines) * 1e6:>8.2f}us/line")
+    if args.workers > 1:
+        fanned = _best_of(
+            lambda: sum(1 for _ in batch_parser.parse_batch(frames, workers=args.workers)), repeat=3,
+        )
+        print(f"{'batch x' + str(args.workers):>12} {fanned / len(lines) * 1e6:>8.2f}us/line")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""전처리 순서 비교: upscale-first vs mask-before-upscale.
+
+OcrDebugger 덤프(frame_*/raw.png + ocr.txt)의 각 프레임을 두 모드로 전처리하여
+속도, 이진 이미지 일치율, (OCR 엔진을 지정하면) ocr.txt 대비 텍스트 유사도와
+파싱된 이벤트 수를 비교한다.
+
+    python scripts/compare_preprocess_order.py ~/.aion2meter/debug [--engine tesseract]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from dataclasses import replace
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from aion2meter.models import CapturedFrame, PreprocessConfig, ROI
+from aion2meter.parser.combat_parser import KoreanCombatParser
+from aion2meter.preprocess.image_proc import CombatLogPreprocessor
+
+
+def _build_engine(name: str) -> object:
+    if name == "tesseract":
+        from aion2meter.ocr.tesseract_engine import TesseractEngine
+        return TesseractEngine()
+    if name == "winocr":
+        from aion2meter.ocr.winocr_engine import WinOcrEngine
+        return WinOcrEngine()
+    if name == "easyocr":
+        from aion2meter.ocr.easyocr_engine import EasyOcrEngine
+        return EasyOcrEngine(gpu=False)
+    raise SystemExit(f"알 수 없는 OCR 엔진: {name}")
+
+
+def _frame(image: np.ndarray) -> CapturedFrame:
+    h, w = image.shape[:2]
+    return CapturedFrame(image=image, timestamp=0.0, roi=ROI(left=0, top=0, width=w, height=h))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("frames_dir", type=Path)
+    ap.add_argument("--engine", default="", help="tesseract / winocr / easyocr (생략 시 OCR 비교 안 함)")
+    args = ap.parse_args()
+
+    frame_dirs = sorted(args.frames_dir.expanduser().glob("frame_*"))
+    samples = []
+    for d in frame_dirs:
+        image = cv2.imread(str(d / "raw.png"), cv2.IMREAD_COLOR)
+        if image is None:
+            continue
+        ref_path = d / "ocr.txt"
+        ref = ref_path.read_text(encoding="utf-8") if ref_path.exists() else ""
+        samples.append((image, ref))
+    if not samples:
+        raise SystemExit(f"raw.png 프레임이 없습니다: {args.frames_dir}")
+
+    base = PreprocessConfig()
+    modes = {
+        "upscale-first": CombatLogPreprocessor(preprocess_config=base),
+        "mask-first": CombatLogPreprocessor(
+            preprocess_config=replace(base, mask_before_upscale=True),
+        ),
+    }
+    engine = _build_engine(args.engine) if args.engine else None
+    parser = KoreanCombatParser()
+
+    outputs: dict[str, list[np.ndarray]] = {name: [] for name in modes}
+    for name, proc in modes.items():
+        costs, ratios, event_counts = [], [], []
+        for image, ref in samples:
+            start = time.perf_counter()
+            binary = proc.process(_frame(image))
+            costs.append((time.perf_counter() - start) * 1000)
+            # process()는 출력 링 버퍼를 돌려주므로 뒤 프레임에 덮어써지지 않게 복사해 둔다
+            outputs[name].append(binary.copy())
+            if engine is not None:
+                text = engine.recognize(binary).text  # type: ignore[attr-defined]
+                ratios.append(SequenceMatcher(None, text, ref).ratio())
+                event_counts.append(len(parser.parse(text, 0.0)))
+
+        line = f"{name:<14} mean={statistics.mean(costs):.3f}ms p50={statistics.median(costs):.3f}ms"
+        if engine is not None:
+            line += f" text_similarity={statistics.mean(ratios):.3f} events={sum(event_counts)}"
+        print(line)
+
+    agreement = [
+        float(np.mean(a == b)) for a, b in zip(outputs["upscale-first"], outputs["mask-first"])
+    ]
+    print(f"{len(samples)} frames, binary pixel agreement={statistics.mean(agreement):.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,15 @@
-"""python -m aion2meter 엔트리포인트."""
+"""python -m aion2meter 엔트리포인트.
+
+    python -m aion2meter             # 오버레이 앱
+    python -m aion2meter replay ...  # 녹화 프레임 헤드리스 리플레이 (Qt 없음)
+"""
+
+import sys
+
+if len(sys.argv) > 1 and sys.argv[1] == "replay":
+    from aion2meter.pipeline.replay import main as replay_main
+
+    sys.exit(replay_main(sys.argv[2:]))
 
 from aion2meter.app import main
 
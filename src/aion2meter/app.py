@@ -17,6 +17,7 @@ from aion2meter.models import AppConfig, DpsSnapshot, ROI
 from aion2meter.pipeline.pipeline import DpsPipeline
 from aion2meter.profile_manager import ProfileManager
 from aion2meter.ui.overlay import DpsOverlay
+from aion2meter.ui.pipeline_stats_panel import PipelineStatsPanel
 from aion2meter.ui.roi_selector import RoiSelector
 from aion2meter.ui.settings_dialog import SettingsDialog
 from aion2meter.ui.tag_input_dialog import TagInputDialog
@@ -49,6 +50,9 @@ class App:
         self._pipeline.combat_ended.connect(self._on_combat_ended)
 
         # UI
+        self._stats_panel = PipelineStatsPanel(opacity=self._config.overlay_opacity)
+        self._pipeline.stats_updated.connect(self._stats_panel.update_stats)
+
         self._overlay = DpsOverlay(
             opacity=self._config.overlay_opacity,
             bg_color=self._config.overlay_bg_color,
@@ -62,6 +66,7 @@ class App:
         self._tray.select_roi.connect(self._open_roi_selector)
         self._tray.reset_combat.connect(self._reset_combat)
         self._tray.toggle_breakdown.connect(self._toggle_breakdown)
+        self._tray.toggle_pipeline_stats.connect(self._toggle_pipeline_stats)
         self._tray.save_log.connect(self._save_log)
         self._tray.open_settings.connect(self._open_settings)
         self._tray.quit_app.connect(self._quit)
@@ -119,6 +124,13 @@ class App:
     def _toggle_breakdown(self) -> None:
         self._overlay.toggle_breakdown()
 
+    def _toggle_pipeline_stats(self) -> None:
+        if self._stats_panel.isVisible():
+            self._stats_panel.hide()
+        else:
+            self._stats_panel.update_stats(self._pipeline.get_pipeline_stats())
+            self._stats_panel.show()
+
     def _save_log(self) -> None:
         events = self._pipeline.get_event_history()
         if not events:
@@ -189,7 +201,10 @@ class App:
         dlg.exec()  # 모달 — 입력 완료까지 블로킹하여 경합 방지
         tag = dlg.get_tag()
 
-        self._session_repo.save_session(events, snapshot, tag=tag)
+        self._session_repo.save_session(
+            events, snapshot, tag=tag, latency=self._overlay.latency.summary(),
+        )
+        self._overlay.latency.clear()
 
         # Discord 자동 전송
         if self._config.discord_auto_send and self._config.discord_webhook_url:
@@ -213,6 +228,7 @@ class App:
         self._pipeline = DpsPipeline(config=self._config)
         self._pipeline.dps_updated.connect(self._on_dps_updated)
         self._pipeline.combat_ended.connect(self._on_combat_ended)
+        self._pipeline.stats_updated.connect(self._stats_panel.update_stats)
         if self._config.roi is not None:
             self._pipeline.start(self._config.roi)
         self._update_profile_menu()
@@ -247,7 +263,9 @@ class App:
         events = self._pipeline.get_event_history()
         if events:
             snapshot = self._pipeline.get_current_snapshot()
-            self._session_repo.save_session(events, snapshot, tag="")
+            self._session_repo.save_session(
+                events, snapshot, tag="", latency=self._overlay.latency.summary(),
+            )
 
         self._hotkey_mgr.stop()
         self._pipeline.stop()
@@ -2,28 +2,109 @@
 
 from __future__ import annotations
 
+import logging
 import time
 
+import cv2
 import mss
 import numpy as np
 
 from aion2meter.models import CapturedFrame, ROI
 
+logger = logging.getLogger(__name__)
+
+_DEFAULT_RING_SIZE = 4
+
+
+class _FrameRing:
+    """ROI 크기로 미리 할당한 BGR 프레임 버퍼 링.
+
+    캡처된 프레임은 큐(2) + 처리 중(1) 동안 참조되므로, 링 크기는 그보다 커야
+    아직 사용 중인 버퍼를 덮어쓰지 않는다.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._buffers: list[np.ndarray] = []
+        self._index = 0
+
+    @property
+    def shape(self) -> tuple[int, ...] | None:
+        return self._buffers[0].shape if self._buffers else None
+
+    def resize(self, height: int, width: int) -> None:
+        """버퍼를 (height, width, 3)으로 재할당한다."""
+        self._buffers = [
+            np.empty((height, width, 3), dtype=np.uint8) for _ in range(self._size)
+        ]
+        self._index = 0
+
+    def next(self) -> np.ndarray:
+        """다음 차례의 버퍼를 반환한다."""
+        buf = self._buffers[self._index]
+        self._index = (self._index + 1) % self._size
+        return buf
+
 
 class MssCapture:
     """mss를 이용한 화면 캡처.
 
     ScreenCapturer Protocol 구현.
+
+    mss 세션(디스플레이 핸들)은 프레임마다 새로 열지 않고 재사용한다.
+    mss 핸들은 생성한 스레드에 묶이므로 open()/close()는 캡처 스레드에서 호출해야 한다.
+
+    grab 결과(BGRA)는 복사 없이 numpy 뷰로 읽고, 미리 할당된 링 버퍼에
+    연속(contiguous) BGR로 한 번만 변환해 기록한다. 링은 ROI 크기가 바뀔 때만
+    재할당되며, 반환된 프레임 이미지는 ring_size 프레임 뒤에 재사용된다.
     """
 
+    def __init__(self, ring_size: int = _DEFAULT_RING_SIZE) -> None:
+        if ring_size < 1:
+            raise ValueError(f"ring_size는 1 이상이어야 합니다: {ring_size}")
+        self._sct: object | None = None
+        self._ring = _FrameRing(ring_size)
+
+    @property
+    def is_open(self) -> bool:
+        return self._sct is not None
+
+    def open(self) -> None:
+        """mss 세션을 연다. 이미 열려 있으면 아무것도 하지 않는다."""
+        if self._sct is None:
+            self._sct = mss.mss()
+
+    def close(self) -> None:
+        """mss 세션을 닫는다."""
+        if self._sct is None:
+            return
+        try:
+            self._sct.close()  # type: ignore[attr-defined]
+        except Exception:
+            logger.debug("mss 세션 종료 실패", exc_info=True)
+        self._sct = None
+
     def capture(self, roi: ROI) -> CapturedFrame:
-        """지정된 ROI 영역을 캡처하여 CapturedFrame을 반환한다."""
-        with mss.mss() as sct:
-            raw = sct.grab(roi.as_dict())
-            # BGRA -> BGR: 알파 채널 제거
-            image = np.array(raw)[:, :, :3]
-            return CapturedFrame(
-                image=image,
-                timestamp=time.time(),
-                roi=roi,
-            )
+        """지정된 ROI 영역을 캡처하여 CapturedFrame을 반환한다.
+
+        grab 실패 시 세션을 한 번 재연결한 뒤 재시도한다.
+        """
+        self.open()
+        try:
+            raw = self._sct.grab(roi.as_dict())  # type: ignore[union-attr]
+        except Exception:
+            logger.info("mss grab 실패, 세션 재연결", exc_info=True)
+            self.close()
+            self.open()
+            raw = self._sct.grab(roi.as_dict())  # type: ignore[union-attr]
+        # BGRA 뷰 (복사 없음) -> 링 버퍼에 BGR로 1회 변환
+        bgra = np.asarray(raw)
+        h, w = bgra.shape[:2]
+        if self._ring.shape != (h, w, 3):
+            self._ring.resize(h, w)
+        image = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._ring.next())
+        return CapturedFrame(
+            image=image,
+            timestamp=time.time(),
+            roi=roi,
+        )
@@ -49,6 +49,11 @@ class ConfigManager:
         if not color_ranges:
             color_ranges = AppConfig.default_color_ranges()
 
+        # 사용자 OCR 보정 사전 ("오타" = "교정")
+        ocr_corrections = {
+            str(wrong): str(correct) for wrong, correct in data.get("ocr_corrections", {}).items()
+        }
+
         # overlay 위치
         overlay_x = data.get("overlay_x")
         overlay_y = data.get("overlay_y")
@@ -65,15 +70,27 @@ class ConfigManager:
             sharpen=bool(preprocess_data.get("sharpen", True)),
             adaptive_threshold=bool(preprocess_data.get("adaptive_threshold", False)),
             cleanup_min_area=int(preprocess_data.get("cleanup_min_area", 10)),
+            mask_before_upscale=bool(preprocess_data.get("mask_before_upscale", False)),
+            change_block=int(preprocess_data.get("change_block", 4)),
+            change_tolerance=int(preprocess_data.get("change_tolerance", 12)),
         )
 
         return AppConfig(
             roi=roi,
             fps=int(data.get("fps", 10)),
+            capture_idle_fps=int(data.get("capture_idle_fps", 2)),
+            capture_idle_after=float(data.get("capture_idle_after", 3.0)),
+            capture_record=bool(data.get("capture_record", False)),
             ocr_engine=str(data.get("ocr_engine", "winocr")),
             ocr_fallback=str(data.get("ocr_fallback", "")),
             ocr_mode=str(data.get("ocr_mode", "failover")),
             ocr_debug=bool(data.get("ocr_debug", False)),
+            ocr_debug_sample_every=max(int(data.get("ocr_debug_sample_every", 1)), 1),
+            ocr_debug_only_empty=bool(data.get("ocr_debug_only_empty", False)),
+            ocr_deadline=float(data.get("ocr_deadline", 1.0)),
+            ocr_incremental=bool(data.get("ocr_incremental", True)),
+            ocr_workers=max(int(data.get("ocr_workers", 1)), 1),
+            ocr_cache_bytes=int(data.get("ocr_cache_bytes", 1_048_576)),
             idle_timeout=float(data.get("idle_timeout", 5.0)),
             overlay_opacity=float(data.get("overlay_opacity", 0.75)),
             overlay_width=int(data.get("overlay_width", 220)),
@@ -91,6 +108,7 @@ class ConfigManager:
             dps_alert_cooldown=float(data.get("dps_alert_cooldown", 10.0)),
             preprocess=preprocess,
             color_ranges=color_ranges,
+            ocr_corrections=ocr_corrections,
         )
 
     # ── 저장 ──────────────────────────────────────────────
@@ -115,10 +133,19 @@ class ConfigManager:
         lines: list[str] = []
 
         lines.append(f"fps = {config.fps}")
+        lines.append(f"capture_idle_fps = {config.capture_idle_fps}")
+        lines.append(f"capture_idle_after = {config.capture_idle_after}")
+        lines.append(f"capture_record = {'true' if config.capture_record else 'false'}")
         lines.append(f'ocr_engine = "{_esc(config.ocr_engine)}"')
         lines.append(f'ocr_fallback = "{_esc(config.ocr_fallback)}"')
         lines.append(f'ocr_mode = "{_esc(config.ocr_mode)}"')
         lines.append(f"ocr_debug = {'true' if config.ocr_debug else 'false'}")
+        lines.append(f"ocr_debug_sample_every = {config.ocr_debug_sample_every}")
+        lines.append(f"ocr_debug_only_empty = {'true' if config.ocr_debug_only_empty else 'false'}")
+        lines.append(f"ocr_deadline = {config.ocr_deadline}")
+        lines.append(f"ocr_incremental = {'true' if config.ocr_incremental else 'false'}")
+        lines.append(f"ocr_workers = {config.ocr_workers}")
+        lines.append(f"ocr_cache_bytes = {config.ocr_cache_bytes}")
         lines.append(f"idle_timeout = {config.idle_timeout}")
         lines.append(f"overlay_opacity = {config.overlay_opacity}")
         lines.append(f"overlay_width = {config.overlay_width}")
@@ -146,6 +173,9 @@ class ConfigManager:
         lines.append(f"sharpen = {'true' if config.preprocess.sharpen else 'false'}")
         lines.append(f"adaptive_threshold = {'true' if config.preprocess.adaptive_threshold else 'false'}")
         lines.append(f"cleanup_min_area = {config.preprocess.cleanup_min_area}")
+        lines.append(f"mask_before_upscale = {'true' if config.preprocess.mask_before_upscale else 'false'}")
+        lines.append(f"change_block = {config.preprocess.change_block}")
+        lines.append(f"change_tolerance = {config.preprocess.change_tolerance}")
 
         if config.roi is not None:
             lines.append("")
@@ -155,6 +185,12 @@ class ConfigManager:
             lines.append(f"width = {config.roi.width}")
             lines.append(f"height = {config.roi.height}")
 
+        if config.ocr_corrections:
+            lines.append("")
+            lines.append("[ocr_corrections]")
+            for wrong, correct in config.ocr_corrections.items():
+                lines.append(f'"{_esc(wrong)}" = "{_esc(correct)}"')
+
         if config.color_ranges:
             for cr in config.color_ranges:
                 lines.append("")
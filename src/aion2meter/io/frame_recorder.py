@@ -0,0 +1,219 @@
+"""캡처 프레임 녹화 파일(.a2rec) 기록/읽기.
+
+파일 구조 (리틀 엔디언):
+
+    magic "A2REC001"
+    프레임 레코드 × N:  _RECORD 헤더(timestamp, payload 길이, h, w, 채널, codec) + payload
+    인덱스:            (레코드 offset u64, timestamp f64) × N
+    footer:            인덱스 offset u64, N u64, "A2RECIDX"
+
+payload는 BGR 원본(codec 0) 또는 zlib 무손실 압축(codec 1)이다.
+footer가 없는 파일(비정상 종료)은 레코드를 처음부터 훑어 인덱스를 다시 만든다.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import queue
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"A2REC001"
+_FOOTER_MAGIC = b"A2RECIDX"
+_RECORD = struct.Struct("<dIHHBB")
+_INDEX_ENTRY = struct.Struct("<Qd")
+_FOOTER = struct.Struct("<QQ8s")
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+
+class FrameRecorder:
+    """프레임을 하나의 .a2rec 파일에 이어 붙인다. 압축과 쓰기는 백그라운드 스레드가 맡는다.
+
+    record()는 프레임을 복사해 큐에 넣기만 한다. 큐가 가득 차면 기다리지 않고 버리며
+    dropped로 센다 (라이브 파이프라인을 늦추지 않는다). close()가 남은 프레임을 모두
+    쓰고 인덱스와 footer를 붙인다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compress: bool = True,
+        max_queue_size: int = 64,
+        level: int = 1,
+    ) -> None:
+        self.path = path
+        self._codec = CODEC_ZLIB if compress else CODEC_RAW
+        self._level = level
+        self._queue: queue.Queue[tuple[float, np.ndarray] | None] = queue.Queue(maxsize=max_queue_size)
+        self._index: list[tuple[int, float]] = []
+        self.written: int = 0
+        self.dropped: int = 0
+        self.bytes_written: int = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="FrameRecorder", daemon=True)
+        self._thread.start()
+
+    def record(self, image: np.ndarray, timestamp: float) -> bool:
+        """프레임 복사본을 쓰기 큐에 넣는다. 닫혔거나 큐가 가득 차면 False."""
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait((timestamp, image.copy()))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def close(self) -> None:
+        """남은 프레임을 모두 쓰고 인덱스를 붙인 뒤 파일을 닫는다."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+        index_offset = self._offset
+        for offset, timestamp in self._index:
+            self._file.write(_INDEX_ENTRY.pack(offset, timestamp))
+        self._file.write(_FOOTER.pack(index_offset, len(self._index), _FOOTER_MAGIC))
+        self._file.close()
+        logger.info(
+            "프레임 녹화 종료: %s (%d프레임, %d 드롭, %d bytes)",
+            self.path, self.written, self.dropped, self.bytes_written,
+        )
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+            "bytes": self.bytes_written,
+        }
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._write(*item)
+            except Exception:
+                logger.warning("프레임 녹화 실패", exc_info=True)
+
+    def _write(self, timestamp: float, image: np.ndarray) -> None:
+        data = np.ascontiguousarray(image).tobytes()
+        if self._codec == CODEC_ZLIB:
+            data = zlib.compress(data, self._level)
+        channels = image.shape[2] if image.ndim == 3 else 1
+        header = _RECORD.pack(timestamp, len(data), image.shape[0], image.shape[1], channels, self._codec)
+        self._file.write(header)
+        self._file.write(data)
+        self._index.append((self._offset, timestamp))
+        self._offset += len(header) + len(data)
+        self.written += 1
+        self.bytes_written += len(header) + len(data)
+
+
+class FrameReader:
+    """.a2rec 파일을 mmap으로 열어 임의 접근한다.
+
+    raw codec 프레임은 mmap 위의 읽기 전용 뷰로 복사 없이 반환한다.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"빈 녹화 파일입니다: {path}") from None
+        if self._mm[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"녹화 파일이 아닙니다: {path}")
+        self._offsets, self.timestamps = self._load_index()
+
+    @staticmethod
+    def is_recording(path: Path) -> bool:
+        """파일이 .a2rec 형식인지 magic으로 확인한다."""
+        if not path.is_file():
+            return False
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> tuple[float, np.ndarray]:
+        """index번째 프레임의 (timestamp, BGR 이미지)."""
+        offset = self._offsets[index]
+        timestamp, length, h, w, channels, codec = _RECORD.unpack_from(self._mm, offset)
+        start = offset + _RECORD.size
+        shape = (h, w, channels) if channels > 1 else (h, w)
+        if codec == CODEC_ZLIB:
+            data = zlib.decompress(self._mm[start : start + length])
+            return timestamp, np.frombuffer(data, dtype=np.uint8).reshape(shape)
+        return timestamp, np.frombuffer(self._mm, dtype=np.uint8, count=length, offset=start).reshape(shape)
+
+    def __iter__(self) -> Iterator[tuple[float, np.ndarray]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        except BufferError:
+            # 반환한 뷰가 아직 살아 있으면 mmap은 GC가 닫는다
+            pass
+        self._file.close()
+
+    def __enter__(self) -> FrameReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _load_index(self) -> tuple[list[int], list[float]]:
+        size = len(self._mm)
+        if size >= len(MAGIC) + _FOOTER.size:
+            index_offset, count, magic = _FOOTER.unpack_from(self._mm, size - _FOOTER.size)
+            if magic == _FOOTER_MAGIC and index_offset + count * _INDEX_ENTRY.size == size - _FOOTER.size:
+                entries = [
+                    _INDEX_ENTRY.unpack_from(self._mm, index_offset + i * _INDEX_ENTRY.size)
+                    for i in range(count)
+                ]
+                return [e[0] for e in entries], [e[1] for e in entries]
+        return self._scan()
+
+    def _scan(self) -> tuple[list[int], list[float]]:
+        """footer 없이 레코드를 순서대로 훑는다. 잘린 마지막 레코드는 버린다."""
+        logger.warning("녹화 인덱스가 없어 레코드를 다시 훑습니다: %s", self.path)
+        offsets: list[int] = []
+        timestamps: list[float] = []
+        offset = len(MAGIC)
+        size = len(self._mm)
+        while offset + _RECORD.size <= size:
+            timestamp, length, *_ = _RECORD.unpack_from(self._mm, offset)
+            end = offset + _RECORD.size + length
+            if end > size:
+                break
+            offsets.append(offset)
+            timestamps.append(timestamp)
+            offset = end
+        return offsets, timestamps
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import logging
+import queue
+import threading
 from dataclasses import asdict
 from pathlib import Path
 
@@ -11,30 +14,114 @@ import numpy as np
 
 from aion2meter.models import DamageEvent
 
+logger = logging.getLogger(__name__)
+
+_DumpItem = tuple[np.ndarray, np.ndarray, str, list[DamageEvent], float | None]
+
 
 class OcrDebugger:
-    """OCR 파이프라인 결과를 프레임별로 파일에 덤프한다."""
+    """OCR 파이프라인 결과를 프레임별로 파일에 덤프한다.
+
+    - sample_every: N번째 프레임마다 하나만 덤프한다 (1이면 모두).
+    - only_empty: 파싱된 이벤트가 없는 프레임만 덤프한다 (OCR/파서 실패 재현용).
+    - background: PNG 인코딩과 파일 쓰기를 전용 스레드에서 한다. 큐(max_queue_size)가
+      가득 차면 기다리지 않고 버리며 dropped로 센다. 이미지는 호출자가 넘긴 뒤
+      다시 쓰지 않는 복사본이어야 한다.
+    """
 
-    def __init__(self, output_dir: Path, enabled: bool = False) -> None:
+    def __init__(
+        self,
+        output_dir: Path,
+        enabled: bool = False,
+        sample_every: int = 1,
+        only_empty: bool = False,
+        background: bool = False,
+        max_queue_size: int = 32,
+    ) -> None:
         self._output_dir = output_dir
         self._enabled = enabled
         self._counter = 0
+        self._sample_every = max(sample_every, 1)
+        self._only_empty = only_empty
+        self._offered = 0
+        self.skipped: int = 0
+        self.dropped: int = 0
+        self.written: int = 0
+
+        self._queue: queue.Queue[_DumpItem | None] | None = None
+        self._thread: threading.Thread | None = None
+        if enabled and background:
+            self._queue = queue.Queue(maxsize=max_queue_size)
+            self._thread = threading.Thread(target=self._run, name="OcrDebugger", daemon=True)
+            self._thread.start()
 
     @property
     def enabled(self) -> bool:
         return self._enabled
 
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"written": self.written, "skipped": self.skipped, "dropped": self.dropped}
+
     def dump(
         self,
         raw_frame: np.ndarray,
         processed_image: np.ndarray,
         ocr_text: str,
         parsed_events: list[DamageEvent],
+        timestamp: float | None = None,
     ) -> None:
-        """한 프레임의 전체 파이프라인 결과를 저장한다."""
+        """한 프레임의 전체 파이프라인 결과를 저장한다 (background면 쓰기 큐에 넣는다).
+
+        timestamp(캡처 시각)를 주면 frame.json에 남겨 리플레이가 원래 시간축을 쓸 수 있게 한다.
+        """
         if not self._enabled:
             return
+        if self._only_empty and parsed_events:
+            self.skipped += 1
+            return
+        self._offered += 1
+        if (self._offered - 1) % self._sample_every:
+            self.skipped += 1
+            return
 
+        item = (raw_frame, processed_image, ocr_text, parsed_events, timestamp)
+        if self._queue is None:
+            self._write(*item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """쓰기 큐에 남은 프레임을 모두 저장하고 쓰기 스레드를 끝낸다."""
+        if self._thread is None or self._queue is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        logger.info("OCR 디버그 덤프 통계: %s", self.stats)
+
+    def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._write(*item)
+            except Exception:
+                logger.warning("OCR 디버그 덤프 실패", exc_info=True)
+
+    def _write(
+        self,
+        raw_frame: np.ndarray,
+        processed_image: np.ndarray,
+        ocr_text: str,
+        parsed_events: list[DamageEvent],
+        timestamp: float | None,
+    ) -> None:
         self._counter += 1
         frame_dir = self._output_dir / f"frame_{self._counter:06d}"
         frame_dir.mkdir(parents=True, exist_ok=True)
@@ -42,6 +129,10 @@ class OcrDebugger:
         cv2.imwrite(str(frame_dir / "raw.png"), raw_frame)
         cv2.imwrite(str(frame_dir / "processed.png"), processed_image)
         (frame_dir / "ocr.txt").write_text(ocr_text, encoding="utf-8")
+        if timestamp is not None:
+            (frame_dir / "frame.json").write_text(
+                json.dumps({"timestamp": timestamp}), encoding="utf-8",
+            )
 
         events_data = []
         for e in parsed_events:
@@ -53,3 +144,4 @@ class OcrDebugger:
             json.dumps(events_data, ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
+        self.written += 1
@@ -40,6 +40,14 @@ CREATE TABLE IF NOT EXISTS skill_summaries (
     hit_count   INTEGER NOT NULL,
     PRIMARY KEY (session_id, skill)
 );
+CREATE TABLE IF NOT EXISTS session_latency (
+    session_id  INTEGER PRIMARY KEY REFERENCES sessions(id) ON DELETE CASCADE,
+    sample_count INTEGER NOT NULL,
+    p50_ms      REAL NOT NULL,
+    p95_ms      REAL NOT NULL,
+    p99_ms      REAL NOT NULL,
+    max_ms      REAL NOT NULL
+);
 CREATE TABLE IF NOT EXISTS session_timeline (
     id          INTEGER PRIMARY KEY AUTOINCREMENT,
     session_id  INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
@@ -70,9 +78,16 @@ class SessionRepository:
             self._conn.commit()
 
     def save_session(
-        self, events: list[DamageEvent], snapshot: DpsSnapshot, tag: str = ""
+        self,
+        events: list[DamageEvent],
+        snapshot: DpsSnapshot,
+        tag: str = "",
+        latency: dict[str, float] | None = None,
     ) -> int:
-        """세션, 이벤트, 스킬 요약을 저장하고 세션 ID를 반환한다."""
+        """세션, 이벤트, 스킬 요약을 저장하고 세션 ID를 반환한다.
+
+        latency: 캡처→표시 지연 요약 (LatencyWindow.summary()). 샘플이 없으면 저장하지 않는다.
+        """
         start_time = events[0].timestamp if events else 0.0
         end_time = events[-1].timestamp if events else 0.0
         duration = snapshot.elapsed_seconds
@@ -145,6 +160,21 @@ class SessionRepository:
                 ],
             )
 
+        if latency and latency.get("count"):
+            self._conn.execute(
+                "INSERT INTO session_latency "
+                "(session_id, sample_count, p50_ms, p95_ms, p99_ms, max_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    session_id,
+                    int(latency["count"]),
+                    latency["p50_ms"],
+                    latency["p95_ms"],
+                    latency["p99_ms"],
+                    latency["max_ms"],
+                ),
+            )
+
         self._conn.commit()
         return session_id
 
@@ -194,6 +224,14 @@ class SessionRepository:
         )
         self._conn.commit()
 
+    def get_session_latency(self, session_id: int) -> dict | None:
+        """세션의 캡처→표시 지연 요약을 반환한다. 없으면 None."""
+        cur = self._conn.execute(
+            "SELECT * FROM session_latency WHERE session_id = ?", (session_id,)
+        )
+        row = cur.fetchone()
+        return dict(row) if row else None
+
     def get_session_timeline(self, session_id: int) -> list[dict]:
         """세션의 DPS 타임라인을 시간순으로 반환한다."""
         cur = self._conn.execute(
@@ -58,11 +58,12 @@ class HitType(Enum):
 
 @dataclass(frozen=True)
 class OcrResult:
-    """OCR 결과."""
+    """OCR 결과. failed이면 엔진이 실패해 text가 비어 있는 것이다 (인식 결과 없음과 구분)."""
 
     text: str
     confidence: float
     timestamp: float
+    failed: bool = False
 
 
 @dataclass(frozen=True)
@@ -90,6 +91,28 @@ class DpsSnapshot:
     skill_breakdown: dict[str, int] = field(default_factory=dict)
     event_count: int = 0
     dps_timeline: list[tuple[float, float]] = field(default_factory=list)
+    capture_timestamp: float = 0.0  # 이 스냅샷을 만든 프레임의 캡처 시각 (time.time())
+
+
+@dataclass(frozen=True)
+class StageLatency:
+    """파이프라인 스테이지 하나의 처리 시간 분포."""
+
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """파이프라인 계측 스냅샷."""
+
+    stages: dict[str, StageLatency] = field(default_factory=dict)
+    dropped_frames: int = 0
+    duplicate_frames: int = 0
+    capture_fps: int = 0
+    capture_schedule: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -101,6 +124,9 @@ class PreprocessConfig:
     sharpen: bool = True
     adaptive_threshold: bool = False
     cleanup_min_area: int = 10
+    mask_before_upscale: bool = False
+    change_block: int = 4
+    change_tolerance: int = 12
 
 
 @dataclass
@@ -109,10 +135,19 @@ class AppConfig:
 
     roi: ROI | None = None
     fps: int = 10
+    capture_idle_fps: int = 2
+    capture_idle_after: float = 3.0
+    capture_record: bool = False
     ocr_engine: str = "winocr"
     ocr_fallback: str = ""
     ocr_mode: str = "failover"
     ocr_debug: bool = False
+    ocr_debug_sample_every: int = 1
+    ocr_debug_only_empty: bool = False
+    ocr_deadline: float = 1.0
+    ocr_incremental: bool = True
+    ocr_workers: int = 1
+    ocr_cache_bytes: int = 1_048_576
     idle_timeout: float = 5.0
     overlay_opacity: float = 0.75
     overlay_width: int = 220
@@ -130,6 +165,7 @@ class AppConfig:
     dps_alert_cooldown: float = 10.0
     preprocess: PreprocessConfig = field(default_factory=PreprocessConfig)
     color_ranges: list[ColorRange] = field(default_factory=list)
+    ocr_corrections: dict[str, str] = field(default_factory=dict)
 
     @classmethod
     def default_color_ranges(cls) -> list[ColorRange]:
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING
 
-from aion2meter.models import OcrResult
+from aion2meter.models import AppConfig, OcrResult
 
 if TYPE_CHECKING:
     import numpy as np
@@ -15,22 +16,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class OcrDeadlineExceeded(RuntimeError):
+    """best_confidence 모드에서 어느 엔진도 deadline 안에 결과를 내지 못했다 (시간 초과/실행 중)."""
+
+
 class OcrEngineManager:
     """Primary/fallback OCR 엔진을 관리하며 장애 시 자동 전환한다.
 
-    OcrEngine Protocol 구현.
+    OcrEngine Protocol 구현. 엔진 예외는 삼키고 failed=True인 빈 결과를 돌려준다.
 
     mode:
         - "failover" (기본): primary 실패 시 fallback 전환
-        - "best_confidence": 두 엔진 결과 중 confidence 높은 쪽 채택
+        - "best_confidence": 두 엔진을 동시에 돌려 deadline(초)까지 나온 결과 중
+          confidence 높은 쪽 채택. 엔진별 승리/시간 초과 횟수를 best_confidence_stats로 노출한다.
+          시간 초과나 실행 중이라 결과가 하나도 없으면 OcrDeadlineExceeded를 던진다: 빈 텍스트를
+          돌려주면 증분 OCR에서는 그 줄들을 다시 읽을 기회가 없으므로, 호출자가 재전송하게 한다.
     """
 
+    _ENGINES = ("primary", "fallback")
+
     def __init__(
         self,
         primary: OcrEngine,
         fallback: OcrEngine | None = None,
         max_failures: int = 3,
         mode: str = "failover",
+        deadline: float = 1.0,
     ) -> None:
         self._primary = primary
         self._fallback = fallback
@@ -38,6 +49,29 @@ class OcrEngineManager:
         self._failure_count: int = 0
         self._using_fallback: bool = False
         self._mode = mode
+        self._deadline = deadline
+        # 엔진마다 단일 스레드 executor: 같은 엔진 인스턴스가 동시에 호출되지 않는다
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._in_flight: dict[str, Future] = {}
+        self._wins = dict.fromkeys(self._ENGINES, 0)
+        self._timeouts = dict.fromkeys(self._ENGINES, 0)
+        self._busy_skips = dict.fromkeys(self._ENGINES, 0)
+
+    @property
+    def best_confidence_stats(self) -> dict[str, dict[str, int]]:
+        """best_confidence 모드의 엔진별 승리/시간 초과/건너뜀 횟수."""
+        return {
+            "wins": dict(self._wins),
+            "timeouts": dict(self._timeouts),
+            "busy_skips": dict(self._busy_skips),
+        }
+
+    def close(self) -> None:
+        """best_confidence executor를 정리한다. 진행 중인 인식은 기다리지 않는다."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+        self._in_flight.clear()
 
     def recognize(self, image: np.ndarray) -> OcrResult:
         """이미지에서 텍스트를 인식한다."""
@@ -46,28 +80,56 @@ class OcrEngineManager:
         return self._recognize_failover(image)
 
     def _recognize_best_confidence(self, image: np.ndarray) -> OcrResult:
-        """두 엔진 결과 중 confidence가 높은 쪽을 반환한다."""
-        primary_result: OcrResult | None = None
-        fallback_result: OcrResult | None = None
-
-        try:
-            primary_result = self._primary.recognize(image)
-        except Exception:
-            logger.warning("best_confidence: primary OCR 실패")
-
-        if self._fallback is not None:
+        """두 엔진을 동시에 실행하고 deadline까지 나온 결과 중 confidence가 높은 쪽을 반환한다."""
+        if self._fallback is None:
             try:
-                fallback_result = self._fallback.recognize(image)
+                result = self._primary.recognize(image)
             except Exception:
-                logger.warning("best_confidence: fallback OCR 실패")
-
-        if primary_result and fallback_result:
-            return primary_result if primary_result.confidence >= fallback_result.confidence else fallback_result
-        if primary_result:
-            return primary_result
-        if fallback_result:
-            return fallback_result
-        return self._empty_result()
+                logger.warning("best_confidence: primary OCR 실패")
+                return self._failed_result()
+            self._wins["primary"] += 1
+            return result
+
+        # deadline을 넘긴 엔진은 이 호출이 끝난 뒤에도 계속 돈다: 호출자가 재사용할 버퍼
+        # (전처리 출력 링, 줄 strip) 대신 이 호출 전용 복사본을 넘긴다
+        image = image.copy()
+        futures: dict[str, Future] = {}
+        for name, engine in (("primary", self._primary), ("fallback", self._fallback)):
+            # 지난 프레임에서 deadline을 넘긴 엔진은 아직 돌고 있으면 이번 프레임에서 뺀다
+            previous = self._in_flight.get(name)
+            if previous is not None and not previous.done():
+                self._busy_skips[name] += 1
+                continue
+            futures[name] = self._executor(name).submit(engine.recognize, image)
+            self._in_flight[name] = futures[name]
+
+        wait(futures.values(), timeout=self._deadline)
+
+        results: dict[str, OcrResult] = {}
+        for name, future in futures.items():
+            if not future.done():
+                self._timeouts[name] += 1
+                continue
+            try:
+                results[name] = future.result()
+            except Exception:
+                logger.warning("best_confidence: %s OCR 실패", name)
+
+        if not results:
+            if len(futures) < len(self._ENGINES) or any(not f.done() for f in futures.values()):
+                raise OcrDeadlineExceeded(f"{self._deadline:.2f}s 안에 OCR 결과 없음")
+            return self._failed_result()
+        # 동점이면 primary 우선
+        winner = max(self._ENGINES, key=lambda n: results[n].confidence if n in results else -1.0)
+        self._wins[winner] += 1
+        return results[winner]
+
+    def _executor(self, name: str) -> ThreadPoolExecutor:
+        executor = self._executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ocr-{name}")
+            self._executors[name] = executor
+        return executor
 
     def _recognize_failover(self, image: np.ndarray) -> OcrResult:
         """기존 failover 로직."""
@@ -86,19 +148,51 @@ class OcrEngineManager:
                         logger.warning("fallback OCR 엔진으로 전환")
                         self._using_fallback = True
                     else:
-                        return self._empty_result()
+                        return self._failed_result()
                 else:
-                    return self._empty_result()
+                    return self._failed_result()
 
         if self._fallback is not None:
             try:
                 return self._fallback.recognize(image)
             except Exception:
                 logger.warning("fallback OCR도 실패")
-                return self._empty_result()
+                return self._failed_result()
 
-        return self._empty_result()
+        return self._failed_result()
 
     @staticmethod
-    def _empty_result() -> OcrResult:
-        return OcrResult(text="", confidence=0.0, timestamp=0.0)
+    def _failed_result() -> OcrResult:
+        return OcrResult(text="", confidence=0.0, timestamp=0.0, failed=True)
+
+
+def build_ocr_engine(name: str) -> object:
+    """이름으로 OCR 엔진을 생성한다. 실패 시 다음 엔진 시도."""
+    if name == "easyocr":
+        try:
+            from aion2meter.ocr.easyocr_engine import EasyOcrEngine
+            return EasyOcrEngine(gpu=True)
+        except Exception:
+            pass
+    if name in ("winocr", "easyocr", ""):
+        try:
+            from aion2meter.ocr.winocr_engine import WinOcrEngine
+            return WinOcrEngine()
+        except Exception:
+            pass
+    if name in ("tesseract", ""):
+        try:
+            from aion2meter.ocr.tesseract_engine import TesseractEngine
+            return TesseractEngine()
+        except Exception:
+            pass
+    raise RuntimeError(f"사용 가능한 OCR 엔진이 없습니다: {name}")
+
+
+def build_ocr_manager(config: AppConfig) -> OcrEngineManager:
+    """설정대로 primary/fallback 엔진을 묶은 OcrEngineManager를 만든다."""
+    primary = build_ocr_engine(config.ocr_engine)
+    fallback = build_ocr_engine(config.ocr_fallback) if config.ocr_fallback else None
+    return OcrEngineManager(
+        primary=primary, fallback=fallback, mode=config.ocr_mode, deadline=config.ocr_deadline,
+    )
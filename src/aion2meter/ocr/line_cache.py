@@ -0,0 +1,156 @@
+"""줄 strip 해시 기반 OCR 결과 캐시."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from aion2meter.models import OcrResult
+from aion2meter.preprocess.line_segmenter import LineSegmenter
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from aion2meter.protocols import OcrEngine
+
+
+class OcrLineCache:
+    """줄 strip 해시 → (텍스트, confidence) LRU 캐시. 스레드 안전.
+
+    빈 텍스트도 저장한다 (글자가 없는 줄: 아이콘, 구분선, 잘린 줄 등의 음성 캐시).
+
+    항목 크기는 키 + UTF-8 텍스트 바이트로 계산하며, 합계가 max_bytes를 넘으면
+    가장 오래 쓰이지 않은 항목부터 버린다.
+    """
+
+    def __init__(self, max_bytes: int = 1 << 20) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes_used: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(strip: np.ndarray) -> bytes:
+        """줄 strip의 캐시 키 (모양 + 픽셀 내용 해시)."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr(strip.shape).encode())
+        h.update(strip.tobytes())
+        return h.digest()
+
+    @staticmethod
+    def _cost(key: bytes, text: str) -> int:
+        return len(key) + len(text.encode("utf-8"))
+
+    def get(self, key: bytes) -> tuple[str, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: bytes, text: str, confidence: float) -> None:
+        cost = self._cost(key, text)
+        if cost > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes_used -= self._cost(key, old[0])
+            self._entries[key] = (text, confidence)
+            self.bytes_used += cost
+            while self.bytes_used > self._max_bytes:
+                old_key, (old_text, _) = self._entries.popitem(last=False)
+                self.bytes_used -= self._cost(old_key, old_text)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+        }
+
+
+class CachedOcrEngine:
+    """OcrLineCache를 앞에 둔 OCR 엔진 래퍼.
+
+    OcrEngine Protocol 구현. 이진 이미지를 줄 strip으로 나눠 캐시에 없는 줄만
+    세로로 이어붙여 한 번에 인식하고, 결과 텍스트를 줄 단위로 캐시에 넣는다.
+    인식된 줄 수가 strip 수와 다르면 대응을 알 수 없으므로 그 줄들만 하나씩 인식한다.
+    글자가 없다고 인식된 줄도 빈 텍스트로 캐시해 매 프레임 다시 인식하지 않는다.
+    엔진이 실패한 결과(failed)만 캐시하지 않는다.
+    """
+
+    def __init__(
+        self,
+        engine: OcrEngine,
+        cache: OcrLineCache,
+        segmenter: LineSegmenter | None = None,
+    ) -> None:
+        self._engine = engine
+        self._cache = cache
+        self._segmenter = segmenter or LineSegmenter()
+        self.split_mismatches: int = 0
+
+    def recognize(self, image: np.ndarray) -> OcrResult:
+        """이미지에서 텍스트를 인식한다. 캐시에 있는 줄은 다시 인식하지 않는다."""
+        bands = self._segmenter.segment(image)
+        if not bands:
+            return self._engine.recognize(image)
+
+        keys = [self._cache.key(image[s:e]) for s, e in bands]
+        lines = [self._cache.get(k) for k in keys]
+        missing = [i for i, line in enumerate(lines) if line is None]
+
+        timestamp = time.time()
+        if missing:
+            recognized, timestamp, failed = self._recognize_lines(image, [bands[i] for i in missing])
+            if failed:
+                # 엔진 실패: 일부 줄만 돌려주면 호출자가 재전송할 때 캐시된 줄이 두 번 세어진다
+                return OcrResult(text="", confidence=0.0, timestamp=timestamp, failed=True)
+            for i, (text, confidence) in zip(missing, recognized):
+                lines[i] = (text, confidence)
+                self._cache.put(keys[i], text, confidence)
+
+        texts = [text for text, _ in lines if text]  # type: ignore[misc]
+        confidence = sum(c for _, c in lines) / len(lines)  # type: ignore[misc]
+        return OcrResult(text="\n".join(texts), confidence=confidence, timestamp=timestamp)
+
+    def _recognize_lines(
+        self, image: np.ndarray, bands: list[tuple[int, int]],
+    ) -> tuple[list[tuple[str, float]], float, bool]:
+        """줄 strip들을 인식하여 줄별 (텍스트, confidence), 타임스탬프, 엔진 실패 여부를 반환한다."""
+        result = self._engine.recognize(self._segmenter.stack(image, bands))
+        if result.failed:
+            return [], result.timestamp, True
+        texts = [t.strip() for t in result.text.splitlines() if t.strip()]
+        if len(texts) == len(bands):
+            return [(t, result.confidence) for t in texts], result.timestamp, False
+
+        # 줄 수가 맞지 않으면(노이즈 strip, 줄 병합 등) 대응을 알 수 없으므로 하나씩 인식
+        self.split_mismatches += 1
+        if len(bands) == 1:
+            return [(result.text.strip(), result.confidence)], result.timestamp, False
+        singles = [self._engine.recognize(self._segmenter.stack(image, [band])) for band in bands]
+        failed = any(r.failed for r in singles)
+        return [(r.text.strip(), r.confidence) for r in singles], result.timestamp, failed
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import re
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Iterator
 
 from aion2meter.models import DamageEvent, HitType
 
@@ -51,54 +56,100 @@ _OCR_DIGIT_MAP: dict[str, str] = {
 _NUM = r"[\d,.\-OolIBSZGDQU]"
 _NUM_START = r"[\dOolIBSZGDQU]"
 
-# 정규식: 배율(치명타/완벽/강타 등) 포함 대미지
+# 대상과 나머지는 "에게"에서 나눈다. 아래 꼬리 패턴은 "에게" 바로 뒤에서 match한다.
+_TARGET_SEP = "에게"
+
+# 꼬리: 배율(치명타/완벽/강타 등) 포함 대미지
 # 긴 패턴(강타 치명타, 완벽 치명타)을 먼저 시도하도록 순서 지정
 _RE_MODIFIER = re.compile(
-    rf"(.*?)에게\s*(강타\s*치명타|완벽\s*치명타|치명타|완벽|강타)\s+(.*?)[을를]\s*사용해\s*.*?({_NUM_START}{_NUM}*)\s*의\s*대미지를\s*줬습니다"
+    rf"\s*(강타\s*치명타|완벽\s*치명타|치명타|완벽|강타)\s+(.*?)[을를]\s*사용해\s*.*?({_NUM_START}{_NUM}*)\s*의\s*대미지를\s*줬습니다"
 )
 
-# 정규식: 일반 대미지 (배율 없음)
+# 꼬리: 일반 대미지 (배율 없음)
 _RE_NORMAL = re.compile(
-    rf"(.*?)에게\s+(.*?)[을를]\s*사용해\s*.*?({_NUM_START}{_NUM}*)\s*의\s*대미지를\s*줬습니다"
+    rf"\s+(.*?)[을를]\s*사용해\s*.*?({_NUM_START}{_NUM}*)\s*의\s*대미지를\s*줬습니다"
 )
 
-# 정규식: 추가 대미지
+# 꼬리: 추가 대미지
 _RE_ADDITIONAL = re.compile(
-    rf"(.*?)에게\s*추가로\s*({_NUM_START}{_NUM}*)\s*의\s*대미지를\s*줬습니다"
+    rf"\s*추가로\s*({_NUM_START}{_NUM}*)\s*의\s*대미지를\s*줬습니다"
 )
 
-# 정규식: 빗나감
+# 꼬리: 빗나감
 _RE_MISS = re.compile(
-    r"(.*?)에게\s+(.*?)[을를]\s*사용했지만\s*빗나갔습니다"
+    r"\s+(.*?)[을를]\s*사용했지만\s*빗나갔습니다"
 )
 
-# 정규식: 저항
+# 꼬리: 저항
 _RE_RESIST = re.compile(
-    r"(.*?)에게\s+(.*?)[을를]\s*사용했지만\s*저항했습니다"
+    r"\s+(.*?)[을를]\s*사용했지만\s*저항했습니다"
 )
 
 # Fuzzy fallback: "에게" + 숫자 + "대미지"
 _RE_FUZZY_DAMAGE = re.compile(
-    rf"(.*?)에게\s+.*?({_NUM_START}{_NUM}*)\s*의\s*대미지"
+    rf"\s+.*?({_NUM_START}{_NUM}*)\s*의\s*대미지"
 )
 
+_MODIFIER_KEYWORDS = ("치명타", "완벽", "강타")
+
+# 이벤트 줄이면 반드시 들어 있는 키워드 (대미지/추가/fuzzy, 빗나감, 저항)
+_EVENT_KEYWORDS = ("대미지", "빗나갔", "저항했")
+
+
+class _LinePrefilter:
+    """정규식 전에 줄을 버리는 부분 문자열 필터.
+
+    OCR 보정 전 텍스트에 적용하므로, 보정 결과에 키워드를 만드는 오타도 함께 찾는다.
+    """
+
+    def __init__(self, corrections: dict[str, str]) -> None:
+        self._targets = self._variants((_TARGET_SEP,), corrections)
+        self._keywords = self._variants(_EVENT_KEYWORDS, corrections)
+
+    @staticmethod
+    def _variants(words: tuple[str, ...], corrections: dict[str, str]) -> tuple[str, ...]:
+        extra = [wrong for wrong, correct in corrections.items() if any(w in correct for w in words)]
+        return tuple(dict.fromkeys((*words, *extra)))
+
+    def reject(self, line: str) -> str | None:
+        """버릴 줄이면 거른 단계 이름, 통과하면 None."""
+        if not any(t in line for t in self._targets):
+            return "rejected_no_target"
+        if not any(k in line for k in self._keywords):
+            return "rejected_no_keyword"
+        return None
+
+
+class _TextCorrector:
+    """키워드 OCR 보정을 한 번의 정규식 치환으로 한다.
+
+    오타들을 긴 것부터 하나의 alternation으로 묶어, 줄을 한 번만 훑는다.
+    """
+
+    def __init__(self, corrections: dict[str, str]) -> None:
+        self.corrections = dict(corrections)
+        wrongs = sorted((w for w in self.corrections if w), key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, wrongs))) if wrongs else None
+
+    def __call__(self, text: str) -> str:
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(lambda m: self.corrections[m.group(0)], text)
+
+
+_FIX_OCR_TEXT = _TextCorrector(_OCR_TEXT_CORRECTIONS)
+_PREFILTER = _LinePrefilter(_OCR_TEXT_CORRECTIONS)
+_DIGIT_TABLE = str.maketrans(_OCR_DIGIT_MAP)
+
 
 def _fix_ocr_text(text: str) -> str:
-    """OCR 텍스트 보정 (키워드 수준)."""
-    for wrong, correct in _OCR_TEXT_CORRECTIONS.items():
-        text = text.replace(wrong, correct)
-    return text
+    """OCR 텍스트 보정 (키워드 수준, 기본 보정 사전)."""
+    return _FIX_OCR_TEXT(text)
 
 
 def _fix_ocr_digits(num_str: str) -> str:
     """숫자 문자열에서 OCR 오류 보정."""
-    result: list[str] = []
-    for ch in num_str:
-        if ch in _OCR_DIGIT_MAP:
-            result.append(_OCR_DIGIT_MAP[ch])
-        else:
-            result.append(ch)
-    return "".join(result)
+    return num_str.translate(_DIGIT_TABLE)
 
 
 def _parse_number(raw: str) -> int:
@@ -117,104 +168,255 @@ class KoreanCombatParser:
     """한국어 아이온2 전투 로그 파서.
 
     CombatLogParser Protocol 구현체.
+
+    corrections: 기본 키워드 보정 사전에 더할 사용자 보정 ("오타": "교정"). 같은 오타면 덮어쓴다.
+    line_stats: 줄 수와, 각 단계에서 걸러진 줄 수
+    (키워드 필터의 rejected_no_target / rejected_no_keyword, 정규식까지 가서 실패한 unmatched).
+
+    같은 줄은 스크롤되는 동안 여러 프레임에 걸쳐 다시 읽히므로, 줄 텍스트 → 파싱 결과
+    (타임스탬프를 뺀 이벤트 필드, 또는 걸러진 단계)를 memo_size개까지 LRU로 기억한다.
+    적중하면 결과를 현재 프레임 타임스탬프로 다시 찍어 반환한다 (0이면 끔).
     """
 
+    def __init__(self, corrections: dict[str, str] | None = None, memo_size: int = 4096) -> None:
+        if corrections:
+            merged = {**_OCR_TEXT_CORRECTIONS, **corrections}
+            self._fix_text = _TextCorrector(merged)
+            self._prefilter = _LinePrefilter(merged)
+        else:
+            self._fix_text = _FIX_OCR_TEXT
+            self._prefilter = _PREFILTER
+        self._line_stats = dict.fromkeys(
+            ("lines", "rejected_no_target", "rejected_no_keyword", "unmatched", "parsed"), 0,
+        )
+        self._memo_size = memo_size
+        self._memo: OrderedDict[str, tuple[str, tuple | None]] = OrderedDict()
+        self._memo_stats = dict.fromkeys(("hits", "misses", "evictions"), 0)
+
+    @property
+    def line_stats(self) -> dict[str, int]:
+        return dict(self._line_stats)
+
+    @property
+    def memo_stats(self) -> dict[str, int]:
+        """줄 memo 적중/미스/축출 수와 현재 크기."""
+        return {**self._memo_stats, "size": len(self._memo)}
+
+    def reset_stats(self) -> None:
+        for key in self._line_stats:
+            self._line_stats[key] = 0
+        for key in self._memo_stats:
+            self._memo_stats[key] = 0
+
     def parse(self, text: str, timestamp: float) -> list[DamageEvent]:
         """텍스트를 줄 단위로 분리하여 대미지 이벤트를 파싱한다."""
         events: list[DamageEvent] = []
+        stats = self._line_stats
         for line in text.splitlines():
             line = line.strip()
             if not line:
                 continue
-            # OCR 텍스트 보정 적용
-            line = _fix_ocr_text(line)
-            # 각 패턴 시도
-            event = self._parse_line(line, timestamp)
+            stats["lines"] += 1
+            memo = self._memo.get(line) if self._memo_size > 0 else None
+            if memo is not None:
+                self._memo.move_to_end(line)
+                self._memo_stats["hits"] += 1
+                outcome, fields = memo
+                stats[outcome] += 1
+                if fields is not None:
+                    events.append(DamageEvent(timestamp, *fields))
+                continue
+            outcome, event = self._parse_uncached(line, timestamp)
+            stats[outcome] += 1
             if event is not None:
                 events.append(event)
+            self._remember(line, outcome, event)
         return events
 
+    def parse_batch(
+        self,
+        items: Iterable[tuple[str, float]],
+        workers: int = 0,
+        chunk_size: int = 256,
+        reorder_window: int = 1024,
+    ) -> Iterator[DamageEvent]:
+        """(text, timestamp) 스트림을 파싱해 이벤트를 타임스탬프 순으로 내보내는 제너레이터.
+
+        입력은 필요한 만큼만 읽는다. 입력 순서가 reorder_window개 이내로만 어긋나 있으면
+        출력은 타임스탬프 순이며, 같은 타임스탬프끼리는 입력 순서를 지킨다.
+        workers가 2 이상이면 chunk_size개씩 묶어 프로세스 풀에서 파싱한다. 워커마다 별도의
+        파서(같은 보정 사전)와 memo를 쓰고, line_stats는 이 파서에 합산한다.
+        """
+        if workers > 1:
+            parsed = self._parse_chunks_in_processes(items, workers, chunk_size)
+        else:
+            parsed = ((ts, self.parse(text, ts)) for text, ts in items)
+
+        heap: list[tuple[float, int, list[DamageEvent]]] = []
+        for seq, (ts, events) in enumerate(parsed):
+            if not events:
+                continue
+            heapq.heappush(heap, (ts, seq, events))
+            if len(heap) > reorder_window:
+                yield from heapq.heappop(heap)[2]
+        while heap:
+            yield from heapq.heappop(heap)[2]
+
+    def _parse_chunks_in_processes(
+        self,
+        items: Iterable[tuple[str, float]],
+        workers: int,
+        chunk_size: int,
+    ) -> Iterator[tuple[float, list[DamageEvent]]]:
+        it = iter(items)
+        pending: deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self._fix_text.corrections, self._memo_size),
+        ) as pool:
+            while True:
+                # 워커당 2청크까지만 미리 보낸다: 입력을 한꺼번에 읽지 않도록
+                while len(pending) < workers * 2:
+                    chunk = list(itertools.islice(it, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(_parse_batch_chunk, chunk))
+                if not pending:
+                    return
+                results, line_stats = pending.popleft().result()
+                for key, n in line_stats.items():
+                    self._line_stats[key] += n
+                for ts, rows in results:
+                    yield ts, [
+                        DamageEvent(ts, src, target, skill, damage, HitType(hit), additional)
+                        for src, target, skill, damage, hit, additional in rows
+                    ]
+
+    def _parse_uncached(self, line: str, timestamp: float) -> tuple[str, DamageEvent | None]:
+        """(line_stats 단계, 파싱된 이벤트 또는 None)."""
+        # 채팅/시스템 메시지/노이즈는 보정과 정규식 없이 버린다
+        rejected = self._prefilter.reject(line)
+        if rejected is not None:
+            return rejected, None
+        # OCR 텍스트 보정 적용 후 각 패턴 시도
+        try:
+            event = self._parse_line(self._fix_text(line), timestamp)
+        except ValueError:
+            # 숫자 자리가 심하게 깨진 줄 ("1O2-"): 한 줄 때문에 프레임 전체를 잃지 않는다
+            event = None
+        return ("unmatched", None) if event is None else ("parsed", event)
+
+    def _remember(self, line: str, outcome: str, event: DamageEvent | None) -> None:
+        if self._memo_size <= 0:
+            return
+        self._memo_stats["misses"] += 1
+        fields = None
+        if event is not None:
+            fields = (
+                event.source, event.target, event.skill, event.damage, event.hit_type, event.is_additional,
+            )
+        self._memo[line] = (outcome, fields)
+        if len(self._memo) > self._memo_size:
+            self._memo.popitem(last=False)
+            self._memo_stats["evictions"] += 1
+
     def _parse_line(self, line: str, timestamp: float) -> DamageEvent | None:
-        """한 줄을 파싱하여 DamageEvent를 반환. 매칭 실패 시 None."""
+        """한 줄을 파싱하여 DamageEvent를 반환. 매칭 실패 시 None.
+
+        "에게" 위치를 한 번 찾고, 그 뒤 꼬리에 있는 키워드로 시도할 패턴만 고른다.
+        패턴 우선순위(추가 → 빗나감 → 저항 → 배율 → 일반 → fuzzy)와, 같은 패턴에서는
+        앞쪽 "에게"가 이기는 규칙은 줄 전체에 패턴을 차례로 search하던 방식과 같다.
+        """
+        first = line.find(_TARGET_SEP)
+        if first < 0:
+            return None
+        splits = [first]
+        while (nxt := line.find(_TARGET_SEP, splits[-1] + 1)) >= 0:
+            splits.append(nxt)
+        tail = line[first + len(_TARGET_SEP):]
+
+        def _match(pattern: re.Pattern[str]) -> tuple[str, re.Match[str]] | None:
+            for i in splits:
+                m = pattern.match(line, i + len(_TARGET_SEP))
+                if m:
+                    return line[:i].strip(), m
+            return None
+
+        has_damage = "대미지" in tail
+
         # 1) 추가 대미지 먼저 체크 (더 구체적)
-        m = _RE_ADDITIONAL.search(line)
-        if m:
-            target = m.group(1).strip()
-            damage = _parse_number(m.group(2))
+        if has_damage and "추가로" in tail and (found := _match(_RE_ADDITIONAL)):
+            target, m = found
             return DamageEvent(
                 timestamp=timestamp,
                 source="",
                 target=target,
                 skill="",
-                damage=damage,
+                damage=_parse_number(m.group(1)),
                 hit_type=HitType.NORMAL,
                 is_additional=True,
             )
 
         # 1.5) 빗나감/저항 (대미지 0)
-        m = _RE_MISS.search(line)
-        if m:
-            return DamageEvent(
-                timestamp=timestamp,
-                source="",
-                target=m.group(1).strip(),
-                skill=m.group(2).strip(),
-                damage=0,
-                hit_type=HitType.MISS,
-            )
+        if "사용했지만" in tail:
+            if "빗나갔습니다" in tail and (found := _match(_RE_MISS)):
+                target, m = found
+                return DamageEvent(
+                    timestamp=timestamp,
+                    source="",
+                    target=target,
+                    skill=m.group(1).strip(),
+                    damage=0,
+                    hit_type=HitType.MISS,
+                )
+            if "저항했습니다" in tail and (found := _match(_RE_RESIST)):
+                target, m = found
+                return DamageEvent(
+                    timestamp=timestamp,
+                    source="",
+                    target=target,
+                    skill=m.group(1).strip(),
+                    damage=0,
+                    hit_type=HitType.RESIST,
+                )
 
-        m = _RE_RESIST.search(line)
-        if m:
-            return DamageEvent(
-                timestamp=timestamp,
-                source="",
-                target=m.group(1).strip(),
-                skill=m.group(2).strip(),
-                damage=0,
-                hit_type=HitType.RESIST,
-            )
+        if not has_damage:
+            return None
 
-        # 2) 배율 포함 대미지 (치명타, 완벽, 강타 등)
-        m = _RE_MODIFIER.search(line)
-        if m:
-            target = m.group(1).strip()
-            modifier_raw = m.group(2).strip()
-            modifier_key = re.sub(r"\s+", " ", modifier_raw)
-            skill = m.group(3).strip()
-            damage = _parse_number(m.group(4))
-            hit_type = _HIT_TYPE_MAP.get(modifier_key, HitType.NORMAL)
-            return DamageEvent(
-                timestamp=timestamp,
-                source="",
-                target=target,
-                skill=skill,
-                damage=damage,
-                hit_type=hit_type,
-                is_additional=False,
-            )
+        if "줬습니다" in tail:
+            # 2) 배율 포함 대미지 (치명타, 완벽, 강타 등)
+            if any(k in tail for k in _MODIFIER_KEYWORDS) and (found := _match(_RE_MODIFIER)):
+                target, m = found
+                modifier_key = re.sub(r"\s+", " ", m.group(1).strip())
+                return DamageEvent(
+                    timestamp=timestamp,
+                    source="",
+                    target=target,
+                    skill=m.group(2).strip(),
+                    damage=_parse_number(m.group(3)),
+                    hit_type=_HIT_TYPE_MAP.get(modifier_key, HitType.NORMAL),
+                    is_additional=False,
+                )
 
-        # 3) 일반 대미지 (배율 없음)
-        m = _RE_NORMAL.search(line)
-        if m:
-            target = m.group(1).strip()
-            skill = m.group(2).strip()
-            damage = _parse_number(m.group(3))
-            return DamageEvent(
-                timestamp=timestamp,
-                source="",
-                target=target,
-                skill=skill,
-                damage=damage,
-                hit_type=HitType.NORMAL,
-                is_additional=False,
-            )
+            # 3) 일반 대미지 (배율 없음)
+            if found := _match(_RE_NORMAL):
+                target, m = found
+                return DamageEvent(
+                    timestamp=timestamp,
+                    source="",
+                    target=target,
+                    skill=m.group(1).strip(),
+                    damage=_parse_number(m.group(2)),
+                    hit_type=HitType.NORMAL,
+                    is_additional=False,
+                )
 
         # 4) Fuzzy fallback: "에게" + 숫자 + "대미지" 키워드만으로 추출
-        m = _RE_FUZZY_DAMAGE.search(line)
-        if m:
-            target = m.group(1).strip()
+        if found := _match(_RE_FUZZY_DAMAGE):
+            target, m = found
             try:
-                damage = _parse_number(m.group(2))
+                damage = _parse_number(m.group(1))
             except (ValueError, IndexError):
                 return None
             if damage <= 0:
@@ -230,3 +432,29 @@ class KoreanCombatParser:
             )
 
         return None
+
+
+_BATCH_PARSER: KoreanCombatParser | None = None
+
+
+def _init_batch_worker(corrections: dict[str, str], memo_size: int) -> None:
+    """parse_batch 워커 프로세스 초기화: 프로세스당 파서 하나."""
+    global _BATCH_PARSER
+    _BATCH_PARSER = KoreanCombatParser(corrections=corrections, memo_size=memo_size)
+
+
+def _parse_batch_chunk(
+    chunk: list[tuple[str, float]],
+) -> tuple[list[tuple[float, list[tuple]]], dict[str, int]]:
+    """청크를 파싱해 이벤트 필드 튜플로 돌려준다 (DamageEvent보다 pickle이 싸다)."""
+    parser = _BATCH_PARSER
+    assert parser is not None
+    parser.reset_stats()
+    results = []
+    for text, ts in chunk:
+        rows = [
+            (e.source, e.target, e.skill, e.damage, e.hit_type.value, e.is_additional)
+            for e in parser.parse(text, ts)
+        ]
+        results.append((ts, rows))
+    return results, parser.line_stats
@@ -0,0 +1,87 @@
+"""스크롤 인식 이벤트 중복 제거."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+
+from aion2meter.models import DamageEvent, HitType
+
+_Fingerprint = tuple[str, str, int, HitType, bool]
+
+
+def _fingerprint(event: DamageEvent) -> _Fingerprint:
+    """타임스탬프를 제외한 이벤트 내용 지문."""
+    return (event.target, event.skill, event.damage, event.hit_type, event.is_additional)
+
+
+class EventDeduplicator:
+    """연속 프레임에 반복해서 보이는 전투 로그 줄의 이벤트를 한 번만 통과시킨다.
+
+    프레임 전체를 OCR하면 화면에 남아 있는 줄이 매 프레임 다시 파싱된다.
+    최근에 통과시킨 이벤트 지문 시퀀스의 접미사와 현재 프레임 이벤트의 접두사가
+    가장 길게 겹치는 지점을 찾아, 그 뒤의 이벤트만 새 이벤트로 내보낸다.
+
+    겹침을 찾지 못하면(OCR 오인식으로 정렬 실패) 최근 기억에 없는 지문만 내보낸다.
+    """
+
+    def __init__(self, memory: int = 256, max_leading_skip: int = 1) -> None:
+        self._history: deque[_Fingerprint] = deque(maxlen=memory)
+        self._max_leading_skip = max_leading_skip
+        self.emitted_count: int = 0
+        self.dropped_count: int = 0
+
+    def reset(self) -> None:
+        """기억한 지문과 카운터를 초기화한다."""
+        self._history.clear()
+        self.emitted_count = 0
+        self.dropped_count = 0
+
+    def filter(self, events: list[DamageEvent]) -> list[DamageEvent]:
+        """현재 프레임 이벤트 중 새로 나타난 이벤트만 반환한다."""
+        if not events:
+            return []
+        prints = [_fingerprint(e) for e in events]
+
+        start = self._align(prints)
+        if start is not None:
+            new_events = events[start:]
+            new_prints = prints[start:]
+        else:
+            seen = Counter(self._history)
+            new_events, new_prints = [], []
+            for event, fp in zip(events, prints):
+                if seen[fp] > 0:
+                    seen[fp] -= 1
+                else:
+                    new_events.append(event)
+                    new_prints.append(fp)
+
+        self._history.extend(new_prints)
+        self.emitted_count += len(new_events)
+        self.dropped_count += len(events) - len(new_events)
+        return new_events
+
+    def remember(self, events: list[DamageEvent]) -> None:
+        """이미 새 이벤트로 확인된 이벤트를 걸러내지 않고 지문만 기억한다.
+
+        증분 OCR처럼 상류에서 새 줄만 골라낸 프레임에 쓴다. 같은 내용의 연속 타격을
+        버리지 않으면서, 이후 전체 프레임이 다시 들어오면 이 지문으로 중복을 걸러낸다.
+        """
+        self._history.extend(_fingerprint(e) for e in events)
+        self.emitted_count += len(events)
+
+    def _align(self, prints: list[_Fingerprint]) -> int | None:
+        """새 이벤트가 시작되는 인덱스를 반환한다. 겹침이 없으면 None.
+
+        화면 맨 윗줄은 잘려서 다르게 읽힐 수 있으므로 앞쪽 이벤트를
+        max_leading_skip개까지 건너뛰고 정렬을 시도한다.
+        """
+        history = list(self._history)
+        if not history:
+            return 0
+        for skip in range(min(self._max_leading_skip, len(prints) - 1) + 1):
+            window = prints[skip:]
+            for n in range(min(len(history), len(window)), 0, -1):
+                if history[-n:] == window[:n]:
+                    return skip + n
+        return None
@@ -0,0 +1,82 @@
+"""전투 활동에 따른 적응형 캡처 주기."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class AdaptiveCaptureRate:
+    """활동이 없으면 캡처 fps를 낮추고, 활동이 생기면 즉시 다시 올린다.
+
+    - 활동: 전처리 스테이지의 프레임 변화, 파싱 스테이지의 대미지 이벤트 (notify_activity)
+    - idle_after초 동안 활동이 없으면 idle_fps로 내린다.
+    - idle 중 활동이 오면 active_fps로 올리고, 대기 중인 캡처 스레드를 깨운다.
+    - fps별로 머문 시간을 누적한다.
+
+    idle_fps가 0 이하이거나 active_fps 이상이면 항상 active_fps를 쓴다.
+    """
+
+    def __init__(
+        self,
+        active_fps: int,
+        idle_fps: int = 2,
+        idle_after: float = 3.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._active_fps = active_fps
+        self._idle_fps = idle_fps if 0 < idle_fps < active_fps else active_fps
+        self._idle_after = idle_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        now = clock()
+        self._last_activity = now
+        self._current_fps = active_fps
+        self._since = now
+        self._time_at: dict[int, float] = {self._active_fps: 0.0, self._idle_fps: 0.0}
+
+    @property
+    def current_fps(self) -> int:
+        """현재 적용 중인 캡처 fps."""
+        return self._current_fps
+
+    def notify_activity(self) -> None:
+        """활동을 알린다. idle 상태였다면 즉시 active로 전환한다."""
+        with self._lock:
+            now = self._clock()
+            self._last_activity = now
+            if self._current_fps != self._active_fps:
+                self._switch(self._active_fps, now)
+                self._wake.set()
+
+    def interval(self) -> float:
+        """idle 전환 여부를 갱신하고 현재 캡처 간격(초)을 반환한다."""
+        with self._lock:
+            now = self._clock()
+            if (
+                self._current_fps == self._active_fps
+                and now - self._last_activity >= self._idle_after
+            ):
+                self._switch(self._idle_fps, now)
+            return 1.0 / self._current_fps
+
+    def sleep(self, seconds: float) -> bool:
+        """seconds만큼 대기한다. idle → active 전환이 일어나면 바로 깨어나 True를 반환한다."""
+        if self._wake.wait(seconds):
+            self._wake.clear()
+            return True
+        return False
+
+    def time_at_rate(self) -> dict[int, float]:
+        """fps별 누적 시간(초). 현재 fps에 머문 시간까지 포함한다."""
+        with self._lock:
+            result = dict(self._time_at)
+            result[self._current_fps] += self._clock() - self._since
+            return result
+
+    def _switch(self, fps: int, now: float) -> None:
+        self._time_at[self._current_fps] += now - self._since
+        self._current_fps = fps
+        self._since = now
@@ -0,0 +1,120 @@
+"""파이프라인 스테이지별 처리 시간 계측."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from collections import deque
+
+from aion2meter.models import StageLatency
+
+# 0.05ms ~ 약 20s 로그 버킷 (인접 버킷 비율 1.25)
+_BUCKET_EDGES: tuple[float, ...] = tuple(
+    0.00005 * 1.25 ** i for i in range(int(math.log(20 / 0.00005, 1.25)) + 1)
+)
+
+STAGES = ("capture", "preprocess", "ocr", "parse", "calculate")
+
+
+class LatencyHistogram:
+    """고정 크기 로그 버킷 히스토그램. 기록은 O(log 버킷 수)이며 할당이 없다.
+
+    백분위 값은 해당 버킷의 상한이므로 최대 25% 과대 추정된다.
+    """
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(_BUCKET_EDGES) + 1)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._total
+
+    def record(self, seconds: float) -> None:
+        index = bisect.bisect_left(_BUCKET_EDGES, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += 1
+
+    def percentile(self, p: float) -> float:
+        """p(0~1) 백분위 처리 시간(초). 기록이 없으면 0."""
+        with self._lock:
+            if self._total == 0:
+                return 0.0
+            rank = max(math.ceil(p * self._total), 1)
+            seen = 0
+            for index, n in enumerate(self._counts):
+                seen += n
+                if seen >= rank:
+                    break
+        if index >= len(_BUCKET_EDGES):
+            return _BUCKET_EDGES[-1]
+        return _BUCKET_EDGES[index]
+
+    def summary(self) -> StageLatency:
+        return StageLatency(
+            count=self._total,
+            p50_ms=self.percentile(0.50) * 1000,
+            p95_ms=self.percentile(0.95) * 1000,
+            p99_ms=self.percentile(0.99) * 1000,
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self._total = 0
+
+
+class PipelineMetrics:
+    """스테이지별 히스토그램과 중복 프레임 카운터. 각 스테이지 스레드가 공유한다."""
+
+    def __init__(self) -> None:
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self.duplicate_frames: int = 0
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.histograms[stage].record(seconds)
+
+    def summaries(self) -> dict[str, StageLatency]:
+        return {stage: h.summary() for stage, h in self.histograms.items()}
+
+    def reset(self) -> None:
+        for h in self.histograms.values():
+            h.reset()
+        self.duplicate_frames = 0
+
+
+class LatencyWindow:
+    """최근 window개 지연 샘플(ms)의 이동 분포. 세션과 함께 내보낼 요약을 만든다."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, ms: float) -> None:
+        self._samples.append(ms)
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def summary(self) -> dict[str, float]:
+        """count / p50_ms / p95_ms / p99_ms / max_ms. 샘플이 없으면 count만 0."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0}
+        n = len(samples)
+
+        def _pct(p: float) -> float:
+            return samples[min(int(p * n), n - 1)]
+
+        return {
+            "count": n,
+            "p50_ms": _pct(0.50),
+            "p95_ms": _pct(0.95),
+            "p99_ms": _pct(0.99),
+            "max_ms": samples[-1],
+        }
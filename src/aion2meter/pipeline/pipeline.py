@@ -1,50 +1,87 @@
-"""캡처 → OCR → 파싱 → DPS 계산 파이프라인."""
+"""캡처 → 전처리 → OCR → 파싱 → DPS 계산 파이프라인."""
 
 from __future__ import annotations
 
 import logging
 import queue
+import threading
 import time
+from dataclasses import dataclass, field, replace
+from typing import Callable
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
 
 from aion2meter.calculator.dps_calculator import RealtimeDpsCalculator
 from aion2meter.capture.mss_capture import MssCapture
+from aion2meter.io.frame_recorder import FrameRecorder
 from aion2meter.io.ocr_debugger import OcrDebugger
-from aion2meter.models import AppConfig, CapturedFrame, DpsSnapshot, ROI
-from aion2meter.ocr.engine_manager import OcrEngineManager
+from aion2meter.models import AppConfig, CapturedFrame, DpsSnapshot, PipelineStats, ROI
+from aion2meter.ocr.engine_manager import OcrDeadlineExceeded, OcrEngineManager, build_ocr_manager
+from aion2meter.ocr.line_cache import CachedOcrEngine, OcrLineCache
 from aion2meter.parser.combat_parser import KoreanCombatParser
+from aion2meter.parser.event_dedup import EventDeduplicator
+from aion2meter.pipeline.capture_rate import AdaptiveCaptureRate
+from aion2meter.pipeline.metrics import PipelineMetrics
+from aion2meter.pipeline.scheduler import DeadlineScheduler
 from aion2meter.preprocess.image_proc import CombatLogPreprocessor
+from aion2meter.preprocess.line_segmenter import LineSegmenter
 
 
 class CaptureWorker(QThread):
-    """화면 캡처 워커 스레드."""
+    """화면 캡처 워커 스레드.
+
+    캡처 세션의 수명을 소유한다: run() 시작 시 열고, stop()으로 루프가 끝나면 닫는다.
+    rate를 주면 고정 fps 대신 활동에 따라 바뀌는 캡처 주기를 따른다.
+    캡처 시각은 DeadlineScheduler가 잡으며, jitter/놓친 deadline 통계는 scheduler.stats().
+    """
 
     frame_captured = pyqtSignal(object)  # CapturedFrame
 
-    def __init__(self, capturer: MssCapture, roi: ROI, fps: int = 10) -> None:
+    def __init__(
+        self,
+        capturer: MssCapture,
+        roi: ROI,
+        fps: int = 10,
+        rate: AdaptiveCaptureRate | None = None,
+        metrics: PipelineMetrics | None = None,
+    ) -> None:
         super().__init__()
         self._capturer = capturer
         self._roi = roi
         self._fps = fps
+        self._rate = rate
+        self._metrics = metrics or PipelineMetrics()
+        # 적응형 주기는 idle → active 전환 시 대기를 끊을 수 있어야 한다
+        self.scheduler = DeadlineScheduler(sleep=rate.sleep if rate is not None else time.sleep)
         self._running = False
 
     def run(self) -> None:
         self._running = True
         interval = 1.0 / self._fps
-        while self._running:
-            start = time.monotonic()
-            try:
-                frame = self._capturer.capture(self._roi)
-                self.frame_captured.emit(frame)
-            except Exception:
-                logger.warning("캡처 실패", exc_info=True)
-            elapsed = time.monotonic() - start
-            sleep_time = interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        self.scheduler.reset()
+        # mss 세션은 캡처 스레드에서 열고 닫는다 (핸들이 스레드에 묶임)
+        try:
+            self._capturer.open()
+        except Exception:
+            logger.warning("캡처 세션 열기 실패", exc_info=True)
+        try:
+            while self._running:
+                try:
+                    start = time.perf_counter()
+                    frame = self._capturer.capture(self._roi)
+                    self._metrics.record("capture", time.perf_counter() - start)
+                    self.frame_captured.emit(frame)
+                except Exception:
+                    logger.warning("캡처 실패", exc_info=True)
+                if self._rate is not None:
+                    interval = self._rate.interval()
+                self.scheduler.wait(interval)
+        finally:
+            self._capturer.close()
 
     def stop(self) -> None:
         self._running = False
@@ -53,96 +90,355 @@ class CaptureWorker(QThread):
         self._roi = roi
 
 
-class OcrWorker(QThread):
-    """OCR 처리 워커 스레드."""
+@dataclass
+class FrameWork:
+    """스테이지 사이를 흐르는 프레임 단위 작업.
 
-    dps_updated = pyqtSignal(object)  # DpsSnapshot
+    캡처/전처리 결과 배열은 링 버퍼에서 나오므로, ocr_input과 디버그 덤프용 이미지는
+    전처리 스테이지에서 만든 자기 버퍼(복사본 또는 새 줄을 쌓은 배열)로 들고 다닌다.
+    """
+
+    timestamp: float
+    seq: int = 0
+    # 줄 분할기가 이전 프레임과 정렬해 새 줄만 골라낸 입력인지 (아니면 프레임 전체)
+    new_lines_only: bool = False
+    # 증분 모드에서 ocr_input에 담긴 줄의 해시 (인식 결과가 버려지면 재전송 요청에 쓴다)
+    line_hashes: list[int] = field(default_factory=list)
+    ocr_input: np.ndarray | None = None
+    text: str = ""
+    debug_raw: np.ndarray | None = None
+    debug_processed: np.ndarray | None = None
+
+
+class _StageWorker(QThread):
+    """입력 큐 하나를 소비하는 파이프라인 스테이지 스레드.
+
+    - latest_wins=True: 큐가 차면 가장 오래된 항목을 버리고, 꺼낼 때도 최신 항목만 처리한다.
+    - latest_wins=False: 큐가 차면 생산자가 자리가 날 때까지 기다린다 (backpressure).
+    """
 
     def __init__(
         self,
-        preprocessor: CombatLogPreprocessor,
-        ocr_engine: OcrEngineManager,
-        parser: KoreanCombatParser,
-        calculator: RealtimeDpsCalculator,
-        max_queue_size: int = 2,
+        max_queue_size: int,
+        latest_wins: bool,
+        input_queue: queue.Queue | None = None,
     ) -> None:
         super().__init__()
-        self._preprocessor = preprocessor
-        self._ocr_engine = ocr_engine
-        self._parser = parser
-        self._calculator = calculator
-        self._queue: queue.Queue[CapturedFrame] = queue.Queue(maxsize=max_queue_size)
+        # input_queue를 주면 여러 스테이지 스레드가 같은 큐를 소비한다 (OCR 풀)
+        self._queue: queue.Queue = input_queue or queue.Queue(maxsize=max_queue_size)
+        self._latest_wins = latest_wins
         self._running = False
-        self._debugger: OcrDebugger | None = None
-
-    def set_debugger(self, debugger: OcrDebugger) -> None:
-        """OCR 디버거를 설정한다."""
-        self._debugger = debugger
+        self._stopped = False
+        self.dropped_count = 0
 
-    def enqueue(self, frame: CapturedFrame) -> None:
-        """프레임을 큐에 추가. 큐가 꽉 차면 가장 오래된 프레임 버림."""
-        try:
-            self._queue.put_nowait(frame)
-        except queue.Full:
+    def enqueue(self, item: object) -> None:
+        """항목을 입력 큐에 넣는다."""
+        if self._latest_wins:
             try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                pass
+                self._queue.put_nowait(item)
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped_count += 1
+                except queue.Empty:
+                    pass
+                try:
+                    self._queue.put_nowait(item)
+                except queue.Full:
+                    logger.debug("프레임 큐 오버플로우")
+            return
+
+        # backpressure: 정지된 스테이지에는 막히지 않도록 주기적으로 확인
+        while not self._stopped:
             try:
-                self._queue.put_nowait(frame)
+                self._queue.put(item, timeout=0.1)
+                return
             except queue.Full:
-                logger.debug("프레임 큐 오버플로우")
+                continue
+        self.dropped_count += 1
 
     def run(self) -> None:
         self._running = True
         while self._running:
             try:
-                frame = self._queue.get(timeout=0.1)
+                item = self._queue.get(timeout=0.1)
             except queue.Empty:
                 continue
 
-            # 큐에 더 있으면 최신만 처리 (stale 프레임 스킵)
-            while not self._queue.empty():
-                try:
-                    frame = self._queue.get_nowait()
-                except queue.Empty:
-                    break
+            if self._latest_wins:
+                # 큐에 더 있으면 최신만 처리 (stale 프레임 스킵)
+                while not self._queue.empty():
+                    try:
+                        item = self._queue.get_nowait()
+                        self.dropped_count += 1
+                    except queue.Empty:
+                        break
 
-            if self._preprocessor.is_duplicate(frame):
-                continue
+            try:
+                self._handle(item)
+            except Exception:
+                logger.warning("%s 처리 실패", type(self).__name__, exc_info=True)
 
-            processed = self._preprocessor.process(frame)
-            ocr_result = self._ocr_engine.recognize(processed)
+    def _handle(self, item: object) -> None:
+        raise NotImplementedError
 
-            if not ocr_result.text.strip():
-                if self._debugger:
-                    self._debugger.dump(frame.image, processed, "", [])
-                continue
+    def stop(self) -> None:
+        self._running = False
+        self._stopped = True
+
+
+class PreprocessWorker(_StageWorker):
+    """전처리 스테이지: 중복 프레임 스킵 → 전처리 → (증분 모드) 새 줄 추출.
+
+    입력은 latest-frame-wins. 줄 분할기는 프레임 순서에 의존하는 상태를 가지므로
+    이 스테이지는 단일 스레드이며, 이후 스테이지로는 항목을 버리지 않는다.
+    """
+
+    def __init__(
+        self,
+        preprocessor: CombatLogPreprocessor,
+        sink: Callable[[FrameWork], None],
+        max_queue_size: int = 2,
+        line_segmenter: LineSegmenter | None = None,
+        debugger: OcrDebugger | None = None,
+        on_activity: Callable[[], None] | None = None,
+        metrics: PipelineMetrics | None = None,
+        recorder: FrameRecorder | None = None,
+    ) -> None:
+        super().__init__(max_queue_size, latest_wins=True)
+        self._preprocessor = preprocessor
+        self._sink = sink
+        self._line_segmenter = line_segmenter
+        self._debugger = debugger
+        self._recorder = recorder
+        self._on_activity = on_activity
+        self._metrics = metrics or PipelineMetrics()
+        self._seq = 0
+
+    def _handle(self, frame: CapturedFrame) -> None:
+        start = time.perf_counter()
+        if self._preprocessor.is_duplicate(frame):
+            self._metrics.duplicate_frames += 1
+            return
+        if self._on_activity is not None:
+            self._on_activity()
+        if self._recorder is not None:
+            # 녹화기가 복사본을 뜨므로 캡처 링 슬롯은 바로 돌려준다
+            self._recorder.record(frame.image, frame.timestamp)
+
+        processed = self._preprocessor.process(frame)
+        # 캡처 링 버퍼 슬롯을 오래 붙잡지 않도록 이후 스테이지로는 원본 프레임을 넘기지 않는다
+        work = FrameWork(timestamp=frame.timestamp)
+        if self._debugger is not None:
+            work.debug_raw = frame.image.copy()
+            work.debug_processed = processed.copy()
+
+        # 증분 OCR: 스크롤로 새로 나타난 줄만 인식 (쌓은 결과는 새 배열)
+        if self._line_segmenter is not None:
+            work.ocr_input = self._line_segmenter.extract_new(processed)
+            work.new_lines_only = self._line_segmenter.last_scroll_offset is not None
+            work.line_hashes = self._line_segmenter.last_new_hashes
+        else:
+            # OCR 워커는 순서와 상관없이 끝나므로 출력 링 슬롯을 넘기면 인식 중에 덮어써질 수 있다
+            work.ocr_input = processed.copy()
+        self._metrics.record("preprocess", time.perf_counter() - start)
+        if work.ocr_input is None:
+            return
+        # 순번은 실제로 넘기는 항목에만 매긴다: 순서 재조립이 빈 순번을 기다리지 않도록
+        work.seq = self._seq
+        self._seq += 1
+        self._sink(work)
+
+
+class OcrWorker(_StageWorker):
+    """OCR 스테이지: 전처리된 이미지를 텍스트로 인식한다 (입력은 backpressure)."""
+
+    def __init__(
+        self,
+        ocr_engine: OcrEngineManager,
+        sink: Callable[[FrameWork], None],
+        max_queue_size: int = 1,
+        input_queue: queue.Queue | None = None,
+        metrics: PipelineMetrics | None = None,
+        on_discarded: Callable[[FrameWork], None] | None = None,
+    ) -> None:
+        super().__init__(max_queue_size, latest_wins=False, input_queue=input_queue)
+        self._ocr_engine = ocr_engine
+        self._sink = sink
+        self._metrics = metrics or PipelineMetrics()
+        self._on_discarded = on_discarded
+
+    def _handle(self, work: FrameWork) -> None:
+        # 인식 실패에도 항목은 넘긴다: 순서 재조립이 빠진 순번을 기다리며 멈추지 않도록
+        start = time.perf_counter()
+        try:
+            result = self._ocr_engine.recognize(work.ocr_input)
+            work.text = result.text
+            discarded = result.failed
+        except Exception as exc:
+            if isinstance(exc, OcrDeadlineExceeded):
+                logger.debug("OCR 시간 초과: %s", exc)
+            else:
+                logger.warning("OCR 실패", exc_info=True)
+            work.text = ""
+            discarded = True
+        # 엔진 실패(예외 또는 failed 결과): 증분 모드에서는 이 줄들을 다시 보내지 않으면 영영 읽지 못한다
+        if discarded and self._on_discarded is not None:
+            self._on_discarded(work)
+        self._metrics.record("ocr", time.perf_counter() - start)
+        work.ocr_input = None
+        self._sink(work)
+
+
+class _ReorderBuffer:
+    """순번이 뒤섞여 도착한 작업을 순번 순서대로 sink에 넘긴다."""
+
+    def __init__(self, sink: Callable[[FrameWork], None]) -> None:
+        self._sink = sink
+        self._lock = threading.Lock()
+        self._next_seq = 0
+        self._pending: dict[int, FrameWork] = {}
+
+    def push(self, work: FrameWork) -> None:
+        with self._lock:
+            self._pending[work.seq] = work
+            while self._next_seq in self._pending:
+                self._sink(self._pending.pop(self._next_seq))
+                self._next_seq += 1
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+
+class OcrWorkerPool:
+    """OCR 스테이지를 엔진 인스턴스마다 스레드 하나씩 돌린다.
+
+    워커들은 입력 큐 하나를 공유하고, 결과는 프레임 순번대로 재조립되어 sink로 간다.
+    엔진 인스턴스는 스레드 간에 공유하지 않는다 (WinOCR/EasyOCR 인스턴스는 스레드 안전하지 않음).
+    """
 
-            events = self._parser.parse(ocr_result.text, frame.timestamp)
+    def __init__(
+        self,
+        ocr_engines: list[OcrEngineManager],
+        sink: Callable[[FrameWork], None],
+        max_queue_size: int = 1,
+        metrics: PipelineMetrics | None = None,
+        on_discarded: Callable[[FrameWork], None] | None = None,
+    ) -> None:
+        if not ocr_engines:
+            raise ValueError("OCR 엔진이 하나 이상 필요합니다")
+        self._reorder = _ReorderBuffer(sink)
+        shared: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._workers = [
+            OcrWorker(
+                ocr_engine=engine, sink=self._reorder.push, input_queue=shared, metrics=metrics,
+                on_discarded=on_discarded,
+            )
+            for engine in ocr_engines
+        ]
 
-            if self._debugger:
-                self._debugger.dump(frame.image, processed, ocr_result.text, events)
+    @property
+    def size(self) -> int:
+        return len(self._workers)
+
+    def enqueue(self, work: FrameWork) -> None:
+        """작업을 공유 입력 큐에 넣는다 (큐가 차면 대기)."""
+        self._workers[0].enqueue(work)
 
-            if events:
-                snapshot = self._calculator.add_events(events)
-                self.dps_updated.emit(snapshot)
+    def start(self) -> None:
+        for worker in self._workers:
+            worker.start()
 
     def stop(self) -> None:
-        self._running = False
+        for worker in self._workers:
+            worker.stop()
+
+    def wait(self, msecs: int) -> None:
+        for worker in self._workers:
+            worker.wait(msecs)
+
+
+class ParseWorker(_StageWorker):
+    """파싱 + DPS 계산 스테이지 (입력은 backpressure)."""
+
+    dps_updated = pyqtSignal(object)  # DpsSnapshot
+
+    def __init__(
+        self,
+        parser: KoreanCombatParser,
+        calculator: RealtimeDpsCalculator,
+        max_queue_size: int = 4,
+        deduplicator: EventDeduplicator | None = None,
+        debugger: OcrDebugger | None = None,
+        on_activity: Callable[[], None] | None = None,
+        metrics: PipelineMetrics | None = None,
+    ) -> None:
+        super().__init__(max_queue_size, latest_wins=False)
+        self._parser = parser
+        self._calculator = calculator
+        self._deduplicator = deduplicator
+        self._debugger = debugger
+        self._on_activity = on_activity
+        self._metrics = metrics or PipelineMetrics()
+
+    def _handle(self, work: FrameWork) -> None:
+        if not work.text.strip():
+            self._dump(work, [])
+            return
+
+        start = time.perf_counter()
+        events = self._parser.parse(work.text, work.timestamp)
+        parsed = time.perf_counter()
+        self._dump(work, events)
+
+        resumed = time.perf_counter()
+        # 전체 프레임 OCR(증분 모드의 정렬 실패 포함): 이전 프레임에서 이미 센 줄의 이벤트 제거.
+        # 새 줄만 들어온 프레임은 그대로 통과시키되 지문은 기억해 둔다.
+        if self._deduplicator is not None:
+            if work.new_lines_only:
+                self._deduplicator.remember(events)
+            else:
+                events = self._deduplicator.filter(events)
+        self._metrics.record("parse", parsed - start + time.perf_counter() - resumed)
+
+        if events:
+            if self._on_activity is not None:
+                self._on_activity()
+            start = time.perf_counter()
+            snapshot = self._calculator.add_events(events)
+            self._metrics.record("calculate", time.perf_counter() - start)
+            # 오버레이가 캡처→표시 지연을 잴 수 있도록 프레임 캡처 시각을 싣는다
+            snapshot = replace(snapshot, capture_timestamp=work.timestamp)
+            self.dps_updated.emit(snapshot)
+
+    def _dump(self, work: FrameWork, events: list) -> None:
+        if self._debugger is not None and work.debug_raw is not None:
+            self._debugger.dump(
+                work.debug_raw, work.debug_processed, work.text, events, timestamp=work.timestamp,
+            )
 
 
 class DpsPipeline(QObject):
-    """DPS 파이프라인 조립 및 제어."""
+    """DPS 파이프라인 조립 및 제어.
+
+    config.ocr_workers > 1이면 OCR 엔진을 워커 수만큼 만들어 OcrWorkerPool로 돌린다.
+    ocr_engine을 하나 주입하면 OCR 워커 하나로 돌리고(엔진 인스턴스는 스레드 간에 공유하지 않는다),
+    리스트로 주입하면 엔진마다 워커 하나씩 돌린다.
+    실행 중에는 스테이지별 계측 스냅샷(PipelineStats)을 1초마다 stats_updated로 보낸다.
+    """
 
     dps_updated = pyqtSignal(object)  # DpsSnapshot
     combat_ended = pyqtSignal(object, object)  # (list[DamageEvent], DpsSnapshot)
+    stats_updated = pyqtSignal(object)  # PipelineStats
+
+    _STATS_INTERVAL_MS = 1000
 
     def __init__(
         self,
         config: AppConfig,
         capturer: MssCapture | None = None,
-        ocr_engine: OcrEngineManager | None = None,
+        ocr_engine: OcrEngineManager | list[OcrEngineManager] | None = None,
     ) -> None:
         super().__init__()
         self._config = config
@@ -152,87 +448,154 @@ class DpsPipeline(QObject):
             color_ranges=config.color_ranges or AppConfig.default_color_ranges(),
             preprocess_config=config.preprocess,
         )
-        if ocr_engine is not None:
-            self._ocr_engine = ocr_engine
+        if isinstance(ocr_engine, list):
+            self._ocr_engines = list(ocr_engine)
+        elif ocr_engine is not None:
+            self._ocr_engines = [ocr_engine]
         else:
-            primary = self._build_ocr_engine(config.ocr_engine)
-            fallback = self._build_ocr_engine(config.ocr_fallback) if config.ocr_fallback else None
-            self._ocr_engine = OcrEngineManager(
-                primary=primary, fallback=fallback, mode=config.ocr_mode,
-            )
-        self._parser = KoreanCombatParser()
+            workers = max(config.ocr_workers, 1)
+            self._ocr_engines = [build_ocr_manager(config) for _ in range(workers)]
+        # 줄 strip 캐시는 모든 OCR 워커가 공유한다 (0이면 끔)
+        self._ocr_cache = OcrLineCache(config.ocr_cache_bytes) if config.ocr_cache_bytes > 0 else None
+        self._parser = KoreanCombatParser(corrections=config.ocr_corrections)
         self._calculator = RealtimeDpsCalculator(idle_timeout=config.idle_timeout)
         self._calculator.set_on_reset(self._on_calculator_reset)
 
+        self._capture_rate: AdaptiveCaptureRate | None = None
+        self._recorder: FrameRecorder | None = None
+        self._debugger: OcrDebugger | None = None
         self._capture_worker: CaptureWorker | None = None
-        self._ocr_worker: OcrWorker | None = None
+        self._preprocess_worker: PreprocessWorker | None = None
+        self._ocr_pool: OcrWorkerPool | None = None
+        self._parse_worker: ParseWorker | None = None
+
+        self._metrics = PipelineMetrics()
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(self._STATS_INTERVAL_MS)
+        self._stats_timer.timeout.connect(self._emit_stats)
 
     def _on_calculator_reset(self, events: list, snapshot: object) -> None:
         """계산기 리셋 콜백 → 시그널로 메인 스레드에 전달."""
         self.combat_ended.emit(events, snapshot)
 
-    @staticmethod
-    def _build_ocr_engine(name: str) -> object:
-        """이름으로 OCR 엔진을 생성한다. 실패 시 다음 엔진 시도."""
-        if name == "easyocr":
-            try:
-                from aion2meter.ocr.easyocr_engine import EasyOcrEngine
-                return EasyOcrEngine(gpu=True)
-            except Exception:
-                pass
-        if name in ("winocr", "easyocr", ""):
-            try:
-                from aion2meter.ocr.winocr_engine import WinOcrEngine
-                return WinOcrEngine()
-            except Exception:
-                pass
-        if name in ("tesseract", ""):
-            try:
-                from aion2meter.ocr.tesseract_engine import TesseractEngine
-                return TesseractEngine()
-            except Exception:
-                pass
-        raise RuntimeError(f"사용 가능한 OCR 엔진이 없습니다: {name}")
-
     def start(self, roi: ROI) -> None:
         """파이프라인 시작."""
         if self._capture_worker is not None:
             self.stop()
 
-        self._ocr_worker = OcrWorker(
-            preprocessor=self._preprocessor,
-            ocr_engine=self._ocr_engine,
-            parser=self._parser,
-            calculator=self._calculator,
+        self._metrics.reset()
+        self._parser.reset_stats()
+        self._capture_rate = AdaptiveCaptureRate(
+            active_fps=self._config.fps,
+            idle_fps=self._config.capture_idle_fps,
+            idle_after=self._config.capture_idle_after,
         )
+
+        debugger = None
         if self._config.ocr_debug:
             from pathlib import Path
             debug_dir = Path.home() / ".aion2meter" / "debug"
-            self._ocr_worker.set_debugger(OcrDebugger(output_dir=debug_dir, enabled=True))
+            # 덤프는 쓰기 스레드에서: 디버깅 중에도 스테이지 처리 시간이 달라지지 않게 한다
+            debugger = OcrDebugger(
+                output_dir=debug_dir,
+                enabled=True,
+                sample_every=self._config.ocr_debug_sample_every,
+                only_empty=self._config.ocr_debug_only_empty,
+                background=True,
+            )
+        self._debugger = debugger
 
-        self._ocr_worker.dps_updated.connect(self.dps_updated.emit)
+        self._recorder = None
+        if self._config.capture_record:
+            from datetime import datetime
+            from pathlib import Path
+            record_dir = Path.home() / ".aion2meter" / "recordings"
+            self._recorder = FrameRecorder(record_dir / f"{datetime.now():%Y%m%d_%H%M%S}.a2rec")
+
+        # 캡처 → 전처리 → OCR 풀 → 파싱+계산. OCR 입력 큐는 1칸으로 둔다
+        # (OCR 작업은 전처리 출력 링이 아닌 자기 버퍼를 들고 간다).
+        self._parse_worker = ParseWorker(
+            parser=self._parser,
+            calculator=self._calculator,
+            # 증분 OCR도 줄 정렬에 실패하면 프레임 전체를 다시 보내므로 중복 제거는 항상 둔다
+            deduplicator=EventDeduplicator(),
+            debugger=debugger,
+            on_activity=self._capture_rate.notify_activity,
+            metrics=self._metrics,
+        )
+        engines = self._ocr_engines
+        if self._ocr_cache is not None:
+            engines = [CachedOcrEngine(engine, self._ocr_cache) for engine in engines]
+        segmenter = LineSegmenter() if self._config.ocr_incremental else None
+        self._ocr_pool = OcrWorkerPool(
+            ocr_engines=engines,
+            sink=self._parse_worker.enqueue,
+            max_queue_size=1,
+            metrics=self._metrics,
+            # 인식 결과가 버려진 줄은 화면에 남아 있는 동안 줄 분할기가 다시 보낸다
+            on_discarded=(lambda work: segmenter.mark_unread(work.line_hashes)) if segmenter else None,
+        )
+        self._preprocess_worker = PreprocessWorker(
+            preprocessor=self._preprocessor,
+            sink=self._ocr_pool.enqueue,
+            line_segmenter=segmenter,
+            debugger=debugger,
+            on_activity=self._capture_rate.notify_activity,
+            metrics=self._metrics,
+            recorder=self._recorder,
+        )
+        self._parse_worker.dps_updated.connect(self.dps_updated.emit)
 
         self._capture_worker = CaptureWorker(
             capturer=self._capturer,
             roi=roi,
             fps=self._config.fps,
+            rate=self._capture_rate,
+            metrics=self._metrics,
         )
-        self._capture_worker.frame_captured.connect(self._ocr_worker.enqueue)
+        self._capture_worker.frame_captured.connect(self._preprocess_worker.enqueue)
 
-        self._ocr_worker.start()
+        self._parse_worker.start()
+        self._ocr_pool.start()
+        self._preprocess_worker.start()
         self._capture_worker.start()
+        self._stats_timer.start()
 
     def stop(self) -> None:
-        """파이프라인 정지."""
+        """파이프라인 정지 (상류 스테이지부터)."""
+        self._stats_timer.stop()
+        stats = self.get_pipeline_stats()
         if self._capture_worker is not None:
             self._capture_worker.stop()
             self._capture_worker.wait(2000)
             self._capture_worker = None
 
-        if self._ocr_worker is not None:
-            self._ocr_worker.stop()
-            self._ocr_worker.wait(2000)
-            self._ocr_worker = None
+        for worker in (self._preprocess_worker, self._ocr_pool, self._parse_worker):
+            if worker is not None:
+                worker.stop()
+                worker.wait(2000)
+        self._preprocess_worker = None
+        self._ocr_pool = None
+        self._parse_worker = None
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+        if self._debugger is not None:
+            self._debugger.close()
+            self._debugger = None
+
+        for engine in self._ocr_engines:
+            if isinstance(engine, OcrEngineManager):
+                if self._config.ocr_mode == "best_confidence":
+                    logger.info("best_confidence 통계: %s", engine.best_confidence_stats)
+                # best_confidence 엔진 스레드 정리 (다시 start하면 필요할 때 새로 만든다)
+                engine.close()
+        if self._ocr_cache is not None:
+            logger.info("OCR 줄 캐시 통계: %s", self._ocr_cache.stats)
+        if self._capture_rate is not None:
+            logger.info("캡처 fps별 시간(초): %s", self._capture_rate.time_at_rate())
+        logger.info("파서 줄 통계: %s, memo: %s", self._parser.line_stats, self._parser.memo_stats)
+        logger.info("파이프라인 통계: %s", stats)
 
     def update_roi(self, roi: ROI) -> None:
         """실행 중 ROI 변경."""
@@ -251,6 +614,32 @@ class DpsPipeline(QObject):
         """현재 전투의 DPS 스냅샷을 반환한다 (상태 변경 없음)."""
         return self._calculator.add_events([])
 
+    def get_pipeline_stats(self) -> PipelineStats:
+        """스테이지별 처리 시간 분포와 드롭/중복 프레임 수를 반환한다."""
+        dropped = self._preprocess_worker.dropped_count if self._preprocess_worker else 0
+        return PipelineStats(
+            stages=self._metrics.summaries(),
+            dropped_frames=dropped,
+            duplicate_frames=self._metrics.duplicate_frames,
+            capture_fps=self._capture_rate.current_fps if self._capture_rate else 0,
+            capture_schedule=self.capture_schedule_stats,
+        )
+
+    def _emit_stats(self) -> None:
+        self.stats_updated.emit(self.get_pipeline_stats())
+
+    @property
+    def capture_schedule_stats(self) -> dict[str, float]:
+        """캡처 스레드의 틱/놓친 deadline/jitter 통계. 실행 중이 아니면 빈 dict."""
+        if self._capture_worker is None:
+            return {}
+        return self._capture_worker.scheduler.stats()
+
+    @property
+    def capture_rate(self) -> AdaptiveCaptureRate | None:
+        """현재(또는 마지막) 실행의 적응형 캡처 주기. current_fps, time_at_rate()를 제공한다."""
+        return self._capture_rate
+
     @property
     def is_running(self) -> bool:
         return self._capture_worker is not None and self._capture_worker.isRunning()
@@ -0,0 +1,288 @@
+"""녹화된 프레임을 Qt 없이 파이프라인에 흘려보내는 헤드리스 리플레이.
+
+    python -m aion2meter replay ~/.aion2meter/debug [--engine tesseract] [--realtime]
+    aion2meter-replay frames.zip --recorded-text --json result.json
+
+입력은 FrameRecorder 녹화 파일(.a2rec), OcrDebugger 덤프 디렉토리(frame_*/raw.png)
+또는 그 zip 아카이브다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+import cv2
+import numpy as np
+
+from aion2meter.calculator.dps_calculator import RealtimeDpsCalculator
+from aion2meter.config import ConfigManager
+from aion2meter.io.frame_recorder import FrameReader
+from aion2meter.models import AppConfig, CapturedFrame, DpsSnapshot, ROI, StageLatency
+from aion2meter.ocr.engine_manager import OcrDeadlineExceeded, build_ocr_manager
+from aion2meter.parser.combat_parser import KoreanCombatParser
+from aion2meter.parser.event_dedup import EventDeduplicator
+from aion2meter.pipeline.metrics import PipelineMetrics
+from aion2meter.preprocess.image_proc import CombatLogPreprocessor
+from aion2meter.preprocess.line_segmenter import LineSegmenter
+
+if TYPE_CHECKING:
+    from aion2meter.protocols import OcrEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RecordedFrame:
+    """녹화된 프레임 하나. image가 None이면 ocr_text만 있는 프레임."""
+
+    timestamp: float
+    image: np.ndarray | None = None
+    ocr_text: str | None = None
+
+
+@dataclass
+class ReplayResult:
+    """리플레이 결과: 세션별 스냅샷과 처리량."""
+
+    frames: int = 0
+    ocr_calls: int = 0
+    events: int = 0
+    wall_seconds: float = 0.0
+    sessions: list[DpsSnapshot] = field(default_factory=list)
+    stages: dict[str, StageLatency] = field(default_factory=dict)
+    duplicate_frames: int = 0
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+
+def iter_recorded_frames(path: Path, fps: float = 10.0) -> Iterator[RecordedFrame]:
+    """녹화 파일, 디렉토리 또는 zip에서 프레임을 순서대로 읽는다.
+
+    덤프 디렉토리/zip의 타임스탬프는 frame.json → events.json 첫 이벤트 →
+    직전 프레임 + 1/fps 순으로 정한다. 녹화 파일에는 OCR 텍스트가 없다.
+    """
+    if FrameReader.is_recording(path):
+        with FrameReader(path) as reader:
+            for timestamp, image in reader:
+                yield RecordedFrame(timestamp=timestamp, image=image)
+        return
+
+    if path.is_file() and zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            names = set(zf.namelist())
+            dirs = sorted({n.split("/")[-2] for n in names if n.endswith("/raw.png")})
+            prefix = {n.split("/")[-2]: n[: -len("raw.png")] for n in names if n.endswith("/raw.png")}
+
+            def _read(d: str, name: str) -> bytes | None:
+                member = prefix[d] + name
+                return zf.read(member) if member in names else None
+
+            yield from _frames(dirs, _read, fps)
+        return
+
+    frame_dirs = sorted(d for d in path.glob("frame_*") if d.is_dir())
+
+    def _read_file(d: str, name: str) -> bytes | None:
+        p = path / d / name
+        return p.read_bytes() if p.exists() else None
+
+    yield from _frames([d.name for d in frame_dirs], _read_file, fps)
+
+
+def _frames(dirs: list[str], read, fps: float) -> Iterator[RecordedFrame]:
+    last_ts: float | None = None
+    for d in dirs:
+        raw = read(d, "raw.png")
+        image = cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_COLOR) if raw else None
+        text = read(d, "ocr.txt")
+        ts = _recorded_timestamp(read(d, "frame.json"), read(d, "events.json"))
+        if ts is None:
+            ts = 0.0 if last_ts is None else last_ts + 1.0 / fps
+        last_ts = ts
+        yield RecordedFrame(
+            timestamp=ts,
+            image=image,
+            ocr_text=text.decode("utf-8") if text is not None else None,
+        )
+
+
+def _recorded_timestamp(frame_json: bytes | None, events_json: bytes | None) -> float | None:
+    try:
+        if frame_json:
+            return float(json.loads(frame_json)["timestamp"])
+        if events_json:
+            events = json.loads(events_json)
+            if events:
+                return float(events[0]["timestamp"])
+    except (ValueError, KeyError, TypeError):
+        logger.debug("녹화 타임스탬프 해석 실패", exc_info=True)
+    return None
+
+
+class ReplayRunner:
+    """전처리 → OCR → 파싱 → DPS 계산을 한 스레드에서 순서대로 실행한다.
+
+    DpsPipeline의 스테이지와 같은 구성(증분 OCR이면 줄 분할, 이벤트 중복 제거는 항상)을 쓴다.
+    use_recorded_text이면 전처리/OCR 대신 녹화된 ocr.txt를 파서에 넣는다.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        ocr_engine: OcrEngine | None = None,
+        use_recorded_text: bool = False,
+    ) -> None:
+        self._use_recorded_text = use_recorded_text
+        self._preprocessor = CombatLogPreprocessor(
+            color_ranges=config.color_ranges or AppConfig.default_color_ranges(),
+            preprocess_config=config.preprocess,
+        )
+        self._ocr_engine = ocr_engine
+        if self._ocr_engine is None and not use_recorded_text:
+            self._ocr_engine = build_ocr_manager(config)
+        self._segmenter = LineSegmenter() if config.ocr_incremental else None
+        self._deduplicator = EventDeduplicator()
+        self._parser = KoreanCombatParser(corrections=config.ocr_corrections)
+        self._calculator = RealtimeDpsCalculator(idle_timeout=config.idle_timeout)
+        self._sessions: list[DpsSnapshot] = []
+        self._calculator.set_on_reset(lambda events, snapshot: self._sessions.append(snapshot))
+        self._metrics = PipelineMetrics()
+
+    def run(
+        self,
+        frames: Iterable[RecordedFrame],
+        realtime: bool = False,
+        speed: float = 1.0,
+    ) -> ReplayResult:
+        """프레임을 모두 처리하고 결과를 반환한다. realtime이면 녹화 시간축(÷speed)에 맞춰 흘린다."""
+        result = ReplayResult()
+        start = time.perf_counter()
+        origin: float | None = None
+
+        for frame in frames:
+            if realtime:
+                origin = frame.timestamp if origin is None else origin
+                delay = start + (frame.timestamp - origin) / speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            result.frames += 1
+            text, new_lines_only = self._recognize(frame, result)
+            if text is None or not text.strip():
+                continue
+
+            t0 = time.perf_counter()
+            events = self._parser.parse(text, frame.timestamp)
+            if new_lines_only:
+                self._deduplicator.remember(events)
+            else:
+                events = self._deduplicator.filter(events)
+            self._metrics.record("parse", time.perf_counter() - t0)
+            if events:
+                t0 = time.perf_counter()
+                self._calculator.add_events(events)
+                self._metrics.record("calculate", time.perf_counter() - t0)
+                result.events += len(events)
+
+        # 마지막 전투도 세션으로 마감
+        self._calculator.reset()
+        result.wall_seconds = time.perf_counter() - start
+        result.sessions = list(self._sessions)
+        result.stages = self._metrics.summaries()
+        result.duplicate_frames = self._metrics.duplicate_frames
+        return result
+
+    def _recognize(self, frame: RecordedFrame, result: ReplayResult) -> tuple[str | None, bool]:
+        """(OCR 텍스트, 새 줄만 인식했는지)를 반환한다."""
+        if self._use_recorded_text or frame.image is None:
+            return frame.ocr_text, False
+
+        t0 = time.perf_counter()
+        h, w = frame.image.shape[:2]
+        captured = CapturedFrame(
+            image=frame.image, timestamp=frame.timestamp, roi=ROI(left=0, top=0, width=w, height=h),
+        )
+        if self._preprocessor.is_duplicate(captured):
+            self._metrics.duplicate_frames += 1
+            return None, False
+        processed = self._preprocessor.process(captured)
+        ocr_input, new_lines_only = processed, False
+        if self._segmenter is not None:
+            ocr_input = self._segmenter.extract_new(processed)
+            new_lines_only = self._segmenter.last_scroll_offset is not None
+        self._metrics.record("preprocess", time.perf_counter() - t0)
+        if ocr_input is None:
+            return None, False
+
+        t0 = time.perf_counter()
+        try:
+            ocr = self._ocr_engine.recognize(ocr_input)  # type: ignore[union-attr]
+            text, discarded = ocr.text, ocr.failed
+        except OcrDeadlineExceeded:
+            text, discarded = "", True
+        # 엔진이 실패했거나 시간 안에 못 읽은 줄은 다음 프레임에서 다시 보낸다
+        if discarded and self._segmenter is not None:
+            self._segmenter.mark_unread(self._segmenter.last_new_hashes)
+        self._metrics.record("ocr", time.perf_counter() - t0)
+        result.ocr_calls += 1
+        return text, new_lines_only
+
+
+def _print_result(result: ReplayResult) -> None:
+    print(
+        f"{result.frames} frames, {result.ocr_calls} OCR calls, {result.events} events "
+        f"in {result.wall_seconds:.2f}s ({result.frames_per_second:.1f} frames/s)"
+    )
+    for stage, latency in result.stages.items():
+        if latency.count:
+            print(
+                f"  {stage:<10} n={latency.count:<6} p50={latency.p50_ms:.2f}ms "
+                f"p95={latency.p95_ms:.2f}ms p99={latency.p99_ms:.2f}ms"
+            )
+    for i, s in enumerate(result.sessions, 1):
+        print(
+            f"session {i}: total={s.total_damage:,} dps={s.dps:,.0f} peak={s.peak_dps:,.0f} "
+            f"time={s.elapsed_seconds:.1f}s events={s.event_count}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="aion2meter replay", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("frames", type=Path, help=".a2rec 녹화 파일, frame_* 디렉토리 또는 zip")
+    ap.add_argument("--config", type=Path, default=None, help="설정 파일 (기본: 사용자 설정)")
+    ap.add_argument("--engine", default="", help="OCR 엔진 (winocr / tesseract / easyocr)")
+    ap.add_argument("--recorded-text", action="store_true", help="OCR 대신 녹화된 ocr.txt 사용")
+    ap.add_argument("--realtime", action="store_true", help="녹화 시간축에 맞춰 재생")
+    ap.add_argument("--speed", type=float, default=1.0, help="--realtime 재생 배속")
+    ap.add_argument("--fps", type=float, default=10.0, help="타임스탬프가 없는 프레임의 간격 기준")
+    ap.add_argument("--json", type=Path, default=None, help="결과를 JSON으로 저장")
+    args = ap.parse_args(argv)
+
+    config = ConfigManager().load(args.config)
+    if args.engine:
+        config.ocr_engine = args.engine
+        config.ocr_fallback = ""
+
+    runner = ReplayRunner(config, use_recorded_text=args.recorded_text)
+    frames = iter_recorded_frames(args.frames.expanduser(), fps=args.fps)
+    result = runner.run(frames, realtime=args.realtime, speed=args.speed)
+    _print_result(result)
+
+    if args.json is not None:
+        data = asdict(result)
+        data["frames_per_second"] = result.frames_per_second
+        args.json.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""monotonic deadline 기반 주기 스케줄러."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable
+
+
+class DeadlineScheduler:
+    """고정 격자(deadline = 이전 deadline + interval)로 주기 작업을 스케줄한다.
+
+    sleep(interval - elapsed) 방식과 달리 sleep 오차가 누적되지 않는다.
+    deadline을 놓치면 밀린 틱을 몰아서 실행하지 않는다: 지금 한 번 실행하고
+    놓친 격자 시각은 건너뛴 것으로 센 뒤, 다음 deadline을 다음 격자 시각에 맞춘다.
+
+    jitter는 틱 시작 시각 - 예정 deadline이며 최근 window개를 보관한다.
+    sleep이 True를 반환하면 외부 신호로 일찍 깨어난 것으로 보고 격자를 새로 잡는다.
+    """
+
+    def __init__(
+        self,
+        sleep: Callable[[float], bool | None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        window: int = 256,
+    ) -> None:
+        self._sleep = sleep
+        self._clock = clock
+        self._deadline: float | None = None
+        self._interval = 0.0
+        self._jitter: deque[float] = deque(maxlen=window)
+        self.ticks: int = 0
+        self.missed_deadlines: int = 0
+        self.skipped_ticks: int = 0
+
+    def reset(self) -> None:
+        """격자를 버린다. 다음 wait()부터 새 격자가 시작된다."""
+        self._deadline = None
+
+    def wait(self, interval: float) -> None:
+        """다음 deadline까지 대기한다. 이미 지났으면 바로 반환한다."""
+        now = self._clock()
+        if self._deadline is None:
+            self._deadline = now + interval
+        elif interval != self._interval:
+            # 주기가 바뀌면 직전 틱 시각 기준으로 격자를 다시 잡는다
+            self._deadline += interval - self._interval
+        self._interval = interval
+        self.ticks += 1
+
+        if now >= self._deadline:
+            late = now - self._deadline
+            skipped = int(late // interval)
+            self.missed_deadlines += 1
+            self.skipped_ticks += skipped
+            self._jitter.append(late - skipped * interval)
+            self._deadline += (skipped + 1) * interval
+            return
+
+        if self._sleep(self._deadline - now):
+            # 외부 신호로 일찍 깨어남 (적응형 주기 전환 등): 지금부터 격자를 새로 잡는다
+            self._deadline = None
+            return
+        woke = self._clock()
+        self._jitter.append(woke - self._deadline)
+        self._deadline += interval
+
+    def stats(self) -> dict[str, float]:
+        """틱/놓친 deadline/건너뛴 틱 수와 jitter 분포(ms)."""
+        samples = sorted(self._jitter)
+
+        def _pct(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(int(p * len(samples)), len(samples) - 1)] * 1000
+
+        return {
+            "ticks": self.ticks,
+            "missed_deadlines": self.missed_deadlines,
+            "skipped_ticks": self.skipped_ticks,
+            "jitter_p50_ms": _pct(0.50),
+            "jitter_p95_ms": _pct(0.95),
+            "jitter_max_ms": samples[-1] * 1000 if samples else 0.0,
+        }
@@ -0,0 +1,77 @@
+"""프레임 변화 감지."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FrameChange:
+    """이전 프레임 대비 변화 결과."""
+
+    identical: bool
+    changed_rows: np.ndarray  # 원본 해상도 행별 bool 벡터
+
+
+class FrameChangeDetector:
+    """축소 시그니처 + 행별 체크섬으로 프레임 변화를 감지한다.
+
+    - 시그니처: 프레임을 1/block로 축소한 격자. 셀 밝기 차이가 tolerance를 넘으면 변화.
+    - 행 체크섬: 원본 각 행의 전체 픽셀 합. 축소에서 빠진 픽셀의 변화도 잡는다.
+      블록 한 개 분량(block 픽셀 × 3채널)의 tolerance 이하 차이는 노이즈로 본다.
+
+    두 비교 모두 cv2/NumPy 벡터 연산이며, 600x250 ROI 기준 프레임당 0.2ms 미만이다.
+    """
+
+    def __init__(self, block: int = 4, tolerance: int = 12) -> None:
+        if block < 1:
+            raise ValueError(f"block은 1 이상이어야 합니다: {block}")
+        self._block = block
+        self._tolerance = tolerance
+        self._row_tolerance = tolerance * block * 3
+        self._prev_sig: np.ndarray | None = None
+        self._prev_rows: np.ndarray | None = None
+
+    def reset(self) -> None:
+        self._prev_sig = None
+        self._prev_rows = None
+
+    def signature(self, image: np.ndarray) -> np.ndarray:
+        """프레임의 축소 시그니처 격자를 반환한다."""
+        h, w = image.shape[:2]
+        size = (max(w // self._block, 1), max(h // self._block, 1))
+        return cv2.resize(image, size, interpolation=cv2.INTER_LINEAR)
+
+    @staticmethod
+    def row_checksums(image: np.ndarray) -> np.ndarray:
+        """행별 픽셀 합 벡터(int32)를 반환한다."""
+        flat = np.ascontiguousarray(image).reshape(image.shape[0], -1)
+        return cv2.reduce(flat, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
+
+    def detect(self, image: np.ndarray) -> FrameChange:
+        """이전 프레임과 비교하여 변화 결과를 반환하고 기준 프레임을 갱신한다."""
+        h = image.shape[0]
+        sig = self.signature(image)
+        rows = self.row_checksums(image)
+        prev_sig, prev_rows = self._prev_sig, self._prev_rows
+        self._prev_sig, self._prev_rows = sig, rows
+
+        if prev_sig is None or prev_sig.shape != sig.shape:
+            return FrameChange(identical=False, changed_rows=np.ones(h, dtype=bool))
+
+        changed = np.abs(rows - prev_rows) > self._row_tolerance
+
+        diff = cv2.absdiff(sig, prev_sig).reshape(sig.shape[0], -1)
+        cell_rows = diff.max(axis=1) > self._tolerance
+        if cell_rows.any():
+            # 격자 행 → 원본 행 (마지막 격자 행이 나머지 행을 포함)
+            scale = h // sig.shape[0]
+            expanded = np.repeat(cell_rows, scale)
+            if expanded.size < h:
+                expanded = np.concatenate((expanded, np.full(h - expanded.size, cell_rows[-1])))
+            changed |= expanded
+
+        return FrameChange(identical=not changed.any(), changed_rows=changed)
@@ -6,6 +6,10 @@ import cv2
 import numpy as np
 
 from aion2meter.models import AppConfig, CapturedFrame, ColorRange, PreprocessConfig
+from aion2meter.preprocess.change_detector import FrameChange, FrameChangeDetector
+
+_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+_OUTPUT_RING = 3
 
 
 class CombatLogPreprocessor:
@@ -18,92 +22,215 @@ class CombatLogPreprocessor:
         self,
         color_ranges: list[ColorRange] | None = None,
         preprocess_config: PreprocessConfig | None = None,
+        output_ring: int = _OUTPUT_RING,
     ) -> None:
-        self._color_ranges = color_ranges or AppConfig.default_color_ranges()
         self._config = preprocess_config or PreprocessConfig()
-        self._prev_hash: tuple | None = None
+        self._output_ring = max(output_ring, 1)
+        self.set_color_ranges(color_ranges)
+        self._change_detector = FrameChangeDetector(
+            block=self._config.change_block,
+            tolerance=self._config.change_tolerance,
+        )
+        self.last_change: FrameChange | None = None
+        self._buffers: dict[str, np.ndarray] = {}
+        self._out_index = 0
 
     def process(self, frame: CapturedFrame) -> np.ndarray:
         """프레임을 전처리하여 이진화된 numpy 배열을 반환한다.
 
         파이프라인: upscale → denoise → sharpen → color_mask → binary → cleanup
+        mask_before_upscale이면: denoise → sharpen → color_mask → cleanup → upscale(nearest)
+
+        중간 결과는 입력 크기별 scratch 버퍼에 쓰므로 정상 상태에서는 할당이 없다.
+        반환 배열은 출력 버퍼 링에서 나오며 output_ring 프레임 뒤에 재사용된다.
         """
         image: np.ndarray = frame.image  # type: ignore[assignment]
+        if self._config.mask_before_upscale:
+            return self._process_mask_first(image)
+
         h, w = image.shape[:2]
 
         # 1) 업스케일
         factor = self._config.upscale_factor
+        up_shape = (h * factor, w * factor) + image.shape[2:]
         upscaled = cv2.resize(
-            image, (w * factor, h * factor), interpolation=cv2.INTER_NEAREST_EXACT,
+            image, (w * factor, h * factor), dst=self._buffer("upscaled", up_shape),
+            interpolation=cv2.INTER_NEAREST_EXACT,
         )
 
         # 2) Denoise (morphological open + close)
         if self._config.denoise:
-            upscaled = self._denoise(upscaled)
+            upscaled = self._denoise(
+                upscaled, tmp=self._buffer("morph", up_shape), dst=self._buffer("denoised", up_shape),
+            )
 
         # 3) Sharpen (unsharp mask)
         if self._config.sharpen:
-            upscaled = self._sharpen(upscaled)
-
-        # 4) 색상 범위별 마스크 생성 후 OR 결합
-        combined_mask = np.zeros(upscaled.shape[:2], dtype=np.uint8)
-        for cr in self._color_ranges:
-            lower = np.array(cr.lower, dtype=np.uint8)
-            upper = np.array(cr.upper, dtype=np.uint8)
-            mask = cv2.inRange(upscaled, lower, upper)
-            combined_mask = cv2.bitwise_or(combined_mask, mask)
+            upscaled = self._sharpen(
+                upscaled, blurred=self._buffer("blurred", up_shape),
+                dst=self._buffer("sharpened", up_shape),
+            )
 
-        # 5) 이진화
-        binary = np.where(combined_mask > 0, np.uint8(255), np.uint8(0)).astype(np.uint8)
+        # 4~5) 색상 범위 마스크 (단일 패스, 0/255 이진)
+        out = self._output_buffer(up_shape[:2])
+        if self._config.cleanup_min_area <= 0:
+            return self._color_mask(upscaled, dst=out)
+        binary = self._color_mask(upscaled)
 
         # 6) Cleanup (작은 컴포넌트 제거)
+        return self._cleanup(
+            binary, self._config.cleanup_min_area,
+            labels=self._buffer("labels", up_shape[:2], np.int32),
+            index=self._buffer("label_index", up_shape[:2], np.intp), dst=out,
+        )
+
+    def _process_mask_first(self, image: np.ndarray) -> np.ndarray:
+        """원본 해상도에서 마스크와 cleanup을 끝낸 뒤 이진 이미지만 업스케일한다.
+
+        업스케일 후 처리 대비 픽셀 수가 1/factor²이므로 denoise~cleanup 비용이 그만큼 줄어든다.
+        cleanup_min_area는 업스케일 기준 면적이므로 원본 해상도 면적으로 환산한다.
+        """
+        factor = self._config.upscale_factor
+        shape = image.shape
+
+        if self._config.denoise:
+            image = self._denoise(
+                image, tmp=self._buffer("morph", shape), dst=self._buffer("denoised", shape),
+            )
+        if self._config.sharpen:
+            image = self._sharpen(
+                image, blurred=self._buffer("blurred", shape), dst=self._buffer("sharpened", shape),
+            )
+
+        binary = self._color_mask(image)
+
         if self._config.cleanup_min_area > 0:
-            binary = self._cleanup(binary, self._config.cleanup_min_area)
+            min_area = max(self._config.cleanup_min_area // (factor * factor), 1)
+            binary = self._cleanup(
+                binary, min_area,
+                labels=self._buffer("labels", shape[:2], np.int32),
+                index=self._buffer("label_index", shape[:2], np.intp),
+                dst=self._buffer("cleaned", shape[:2]),
+            )
+
+        h, w = shape[:2]
+        out = self._output_buffer((h * factor, w * factor))
+        if factor == 1:
+            np.copyto(out, binary)
+            return out
+        return cv2.resize(binary, (w * factor, h * factor), dst=out, interpolation=cv2.INTER_NEAREST)
+
+    def _buffer(self, name: str, shape: tuple[int, ...], dtype: type = np.uint8) -> np.ndarray:
+        """이름별 scratch 버퍼를 반환한다. 크기가 바뀔 때만 새로 할당한다."""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+        return buf
+
+    def _output_buffer(self, shape: tuple[int, ...]) -> np.ndarray:
+        """출력 버퍼 링의 다음 버퍼를 반환한다."""
+        name = f"out{self._out_index}"
+        self._out_index = (self._out_index + 1) % self._output_ring
+        return self._buffer(name, shape)
+
+    def set_color_ranges(self, color_ranges: list[ColorRange] | None) -> None:
+        """색상 범위를 바꾸고 마스크 LUT를 다시 만든다."""
+        self._color_ranges = color_ranges or AppConfig.default_color_ranges()
+        self._color_luts = self._build_color_luts(self._color_ranges)
 
-        return binary
+    @staticmethod
+    def _build_color_luts(
+        color_ranges: list[ColorRange],
+    ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """색상 범위들을 채널별 비트마스크 LUT(B, G, R)로 컴파일한다.
+
+        lut_c[v]의 i번째 비트 = v가 i번째 범위의 채널 c 구간 안에 있는지.
+        세 채널 LUT 값을 AND하면 픽셀이 속한 범위의 비트만 남는다.
+        uint8 LUT 하나에 범위 8개까지 담고, 넘치면 LUT 묶음을 추가한다.
+        """
+        luts: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        for start in range(0, len(color_ranges), 8):
+            planes = np.zeros((3, 256), dtype=np.uint8)
+            for bit, cr in enumerate(color_ranges[start:start + 8]):
+                for c in range(3):
+                    lo, hi = max(int(cr.lower[c]), 0), min(int(cr.upper[c]), 255)
+                    planes[c, lo:hi + 1] |= np.uint8(1 << bit)
+            luts.append((planes[0].copy(), planes[1].copy(), planes[2].copy()))
+        return luts
+
+    def _color_mask(self, image: np.ndarray, dst: np.ndarray | None = None) -> np.ndarray:
+        """색상 범위 중 하나라도 해당하는 픽셀을 255로 하는 이진 마스크를 반환한다."""
+        shape = image.shape[:2]
+        planes = cv2.split(
+            image, [self._buffer("plane_b", shape), self._buffer("plane_g", shape),
+                    self._buffer("plane_r", shape)],
+        )
+        combined = self._buffer("mask_bits", shape)
+        tmp = self._buffer("mask_tmp", shape)
+        for i, (lut_b, lut_g, lut_r) in enumerate(self._color_luts):
+            bits = combined if i == 0 else self._buffer("mask_chunk", shape)
+            cv2.LUT(planes[0], lut_b, dst=bits)
+            cv2.bitwise_and(bits, cv2.LUT(planes[1], lut_g, dst=tmp), dst=bits)
+            cv2.bitwise_and(bits, cv2.LUT(planes[2], lut_r, dst=tmp), dst=bits)
+            if i > 0:
+                cv2.bitwise_or(combined, bits, dst=combined)
+        if dst is None:
+            dst = self._buffer("binary", shape)
+        return cv2.compare(combined, 0, cv2.CMP_GT, dst=dst)
 
     @staticmethod
-    def _denoise(image: np.ndarray) -> np.ndarray:
+    def _denoise(
+        image: np.ndarray, tmp: np.ndarray | None = None, dst: np.ndarray | None = None,
+    ) -> np.ndarray:
         """모폴로지 연산으로 노이즈를 제거한다."""
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        opened = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
-        closed = cv2.morphologyEx(opened, cv2.MORPH_CLOSE, kernel)
+        opened = cv2.morphologyEx(image, cv2.MORPH_OPEN, _KERNEL, dst=tmp)
+        closed = cv2.morphologyEx(opened, cv2.MORPH_CLOSE, _KERNEL, dst=dst)
         return closed
 
     @staticmethod
-    def _sharpen(image: np.ndarray) -> np.ndarray:
+    def _sharpen(
+        image: np.ndarray, blurred: np.ndarray | None = None, dst: np.ndarray | None = None,
+    ) -> np.ndarray:
         """Unsharp mask로 이미지를 샤프닝한다."""
-        blurred = cv2.GaussianBlur(image, (0, 0), sigmaX=1.0)
-        sharpened = cv2.addWeighted(image, 1.5, blurred, -0.5, 0)
+        blurred = cv2.GaussianBlur(image, (0, 0), sigmaX=1.0, dst=blurred)
+        sharpened = cv2.addWeighted(image, 1.5, blurred, -0.5, 0, dst=dst)
         return sharpened
 
     @staticmethod
-    def _cleanup(binary: np.ndarray, min_area: int) -> np.ndarray:
-        """min_area 미만의 연결 컴포넌트를 제거한다."""
-        num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
-        result = np.zeros_like(binary)
-        for i in range(1, num_labels):  # 0은 배경
-            if stats[i, cv2.CC_STAT_AREA] >= min_area:
-                result[labels == i] = 255
-        return result
+    def _cleanup(
+        binary: np.ndarray,
+        min_area: int,
+        labels: np.ndarray | None = None,
+        index: np.ndarray | None = None,
+        dst: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """min_area 미만의 연결 컴포넌트를 제거한다.
+
+        labels(int32), index(intp), dst(uint8)를 주면 그 버퍼에 쓴다.
+        """
+        _, labels, stats, _ = cv2.connectedComponentsWithStats(
+            binary, labels=labels, connectivity=8,
+        )
+        # 라벨별 유지 여부 LUT → 라벨 이미지를 인덱스로 한 번에 매핑 (픽셀 수에 선형)
+        keep = np.where(stats[:, cv2.CC_STAT_AREA] >= min_area, np.uint8(255), np.uint8(0))
+        keep[0] = 0  # 0은 배경
+        if dst is None or index is None:
+            return keep[labels]
+        # np.take는 int32 인덱스를 intp로 변환하며 임시 배열을 만들므로 미리 변환해 둔다.
+        # mode="clip": 라벨은 항상 범위 안이고, 기본 mode="raise"는 out을 임시 버퍼로 복사한다.
+        np.copyto(index, labels)
+        return np.take(keep, index, out=dst, mode="clip")
 
     def is_duplicate(self, frame: CapturedFrame) -> bool:
-        """이전 프레임과 동일한지 5지점 픽셀 샘플링으로 비교한다."""
+        """이전 프레임과 동일한지 축소 grayscale 시그니처로 비교한다.
+
+        바뀐 행 정보는 last_change에 남는다.
+        """
         image: np.ndarray = frame.image  # type: ignore[assignment]
         h, w = image.shape[:2]
         if h == 0 or w == 0:
             return False
 
-        points = [
-            (0, 0),
-            (0, w - 1),
-            (h - 1, 0),
-            (h - 1, w - 1),
-            (h // 2, w // 2),
-        ]
-        sample = tuple(image[y, x].tobytes() for y, x in points)
-
-        if self._prev_hash is not None and sample == self._prev_hash:
-            return True
-        self._prev_hash = sample
-        return False
+        self.last_change = self._change_detector.detect(image)
+        return self.last_change.identical
@@ -0,0 +1,129 @@
+"""전투 로그 줄 분할 및 스크롤 기반 증분 추출."""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterable
+
+import numpy as np
+
+
+class LineSegmenter:
+    """이진 마스크를 줄 단위 strip으로 나누고, 이전 프레임 이후 새로 나타난 줄만 추출한다.
+
+    - 줄 분할: 수평 투영(행별 전경 픽셀 유무)으로 텍스트 행 구간을 찾는다.
+    - 스크롤 감지: 이전 프레임 줄 해시 시퀀스의 접미사와 현재 프레임의 접두사가
+      가장 길게 겹치는 위치를 찾는다. 겹친 뒤에 오는 줄이 새 줄이다.
+    - 재전송: 인식 결과가 버려진 줄(mark_unread)은 화면에 남아 있는 동안 다음 프레임에서 다시 보낸다.
+    """
+
+    def __init__(
+        self, min_gap: int = 2, min_height: int = 4, padding: int = 4, max_leading_skip: int = 1,
+    ) -> None:
+        self._min_gap = min_gap
+        self._min_height = min_height
+        self._padding = padding
+        self._max_leading_skip = max_leading_skip
+        self._prev_hashes: list[int] = []
+        self._prev_bands: list[tuple[int, int]] = []
+        self._prev_shape: tuple[int, ...] | None = None
+        # mark_unread는 OCR 스레드에서 불리므로 잠금으로 보호한다
+        self._unread: set[int] = set()
+        self._unread_lock = threading.Lock()
+        self.last_scroll_offset: int | None = None
+        self.last_new_hashes: list[int] = []
+
+    def reset(self) -> None:
+        """이전 프레임 정보를 지운다 (다음 프레임의 모든 줄이 새 줄이 된다)."""
+        self._prev_hashes = []
+        self._prev_bands = []
+        self._prev_shape = None
+        with self._unread_lock:
+            self._unread.clear()
+        self.last_scroll_offset = None
+        self.last_new_hashes = []
+
+    def mark_unread(self, hashes: Iterable[int]) -> None:
+        """보낸 줄(last_new_hashes)의 인식 결과가 버려졌음을 알린다. 화면에 남아 있으면 다시 보낸다."""
+        with self._unread_lock:
+            self._unread.update(hashes)
+
+    def segment(self, binary: np.ndarray) -> list[tuple[int, int]]:
+        """텍스트 행 구간 [(start, end), ...]을 반환한다 (end는 미포함)."""
+        has_ink = binary.any(axis=1).astype(np.int8)
+        if not has_ink.any():
+            return []
+        edges = np.diff(np.concatenate(([0], has_ink, [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        # 줄 내부의 짧은 공백(받침, 문장부호 등)은 같은 줄로 병합
+        bands: list[tuple[int, int]] = []
+        for s, e in zip(starts.tolist(), ends.tolist()):
+            if bands and s - bands[-1][1] < self._min_gap:
+                bands[-1] = (bands[-1][0], e)
+            else:
+                bands.append((s, e))
+        return [(s, e) for s, e in bands if e - s >= self._min_height]
+
+    def extract_new(self, binary: np.ndarray) -> np.ndarray | None:
+        """새로 나타난 줄만 세로로 이어붙인 이진 이미지를 반환한다. 새 줄이 없으면 None."""
+        bands = self.segment(binary)
+        hashes = [hash(binary[s:e].tobytes()) for s, e in bands]
+
+        matched: list[tuple[int, int]] = []
+        if binary.shape != self._prev_shape:
+            overlap = 0
+            self.last_scroll_offset = None
+        else:
+            overlap, self.last_scroll_offset, matched = self._align(hashes, bands)
+
+        with self._unread_lock:
+            resend = [i for i, prev in matched if hashes[i] in self._unread or prev in self._unread]
+            emitted = resend + list(range(overlap, len(bands)))
+            # 화면에서 사라진 줄은 더 이상 다시 보낼 수 없으므로 잊는다
+            self._unread.intersection_update(hashes)
+            self._unread.difference_update(hashes[i] for i in emitted)
+
+        self._prev_hashes = hashes
+        self._prev_bands = bands
+        self._prev_shape = binary.shape
+        self.last_new_hashes = [hashes[i] for i in emitted]
+
+        if not emitted:
+            return None
+        return self.stack(binary, [bands[i] for i in emitted])
+
+    def _align(
+        self, hashes: list[int], bands: list[tuple[int, int]],
+    ) -> tuple[int, int | None, list[tuple[int, int]]]:
+        """(겹친 줄 수, 픽셀 스크롤 오프셋, 겹친 줄의 (현재 인덱스, 이전 해시) 목록)을 반환한다.
+
+        겹침이 없으면 (0, None, []).
+        화면 맨 윗줄은 스크롤 중에 잘려 보일 수 있으므로 현재 프레임 앞쪽 줄을
+        max_leading_skip개까지 건너뛰고 정렬한다. 건너뛴 줄은 이미 지나간 줄이다.
+        이전 프레임의 마지막 줄은 렌더링 중(페이드인 등)이었을 수 있으므로, 그 줄만
+        달라진 경우에도 겹침으로 인정한다. 이미 인식한 줄이므로 새 줄로 보지 않는다.
+        """
+        prev = self._prev_hashes
+        # 이전 프레임 앞쪽 k줄이 위로 밀려난 경우: prev[k:] == hashes[skip:skip+len(prev)-k]
+        for tail in (0, 1):
+            for k in range(len(prev) - tail):
+                n = len(prev) - k - tail
+                for skip in range(min(self._max_leading_skip, len(hashes)) + 1):
+                    if skip + n > len(hashes) or prev[k:k + n] != hashes[skip:skip + n]:
+                        continue
+                    overlap = min(skip + n + tail, len(hashes))
+                    matched = [(skip + j, prev[k + j]) for j in range(overlap - skip)]
+                    offset = self._prev_bands[k][0] - bands[skip][0]
+                    return overlap, offset, matched
+        return 0, None, []
+
+    def stack(self, binary: np.ndarray, bands: list[tuple[int, int]]) -> np.ndarray:
+        """줄 strip들을 빈 여백 행으로 구분하여 세로로 이어붙인다."""
+        gap = np.zeros((self._padding, binary.shape[1]), dtype=binary.dtype)
+        parts = [gap]
+        for s, e in bands:
+            parts.append(binary[s:e])
+            parts.append(gap)
+        return np.vstack(parts)
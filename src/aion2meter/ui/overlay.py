@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import time
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QFont, QPainter
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 from aion2meter.models import DpsSnapshot
+from aion2meter.pipeline.metrics import LatencyWindow
 from aion2meter.ui.sparkline import SparklineWidget
 
 _GREEN = QColor(0, 255, 100)
@@ -37,6 +40,8 @@ class DpsOverlay(QWidget):
         self._bg_color = QColor(*bg_color)
         self._combat_active = False
         self._breakdown_visible = False
+        # 캡처 → 표시 지연 (ms) 이동 분포
+        self.latency = LatencyWindow()
 
         font = QFont("Consolas", 11)
         font_small = QFont("Consolas", 9)
@@ -96,6 +101,8 @@ class DpsOverlay(QWidget):
 
     def update_display(self, snapshot: DpsSnapshot) -> None:
         """DPS 스냅샷으로 표시 갱신."""
+        if snapshot.capture_timestamp > 0:
+            self.latency.record((time.time() - snapshot.capture_timestamp) * 1000)
         self._combat_active = snapshot.combat_active
         color = _GREEN if snapshot.combat_active else _GRAY
         self._dps_label.setText(f"DPS: {snapshot.dps:,.0f}")
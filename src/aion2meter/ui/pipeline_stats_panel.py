@@ -0,0 +1,99 @@
+"""파이프라인 계측 디버그 패널."""
+
+from __future__ import annotations
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QPainter
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from aion2meter.models import PipelineStats
+from aion2meter.pipeline.metrics import STAGES
+
+_BG = QColor(0, 0, 0)
+_TEXT = "#cccccc"
+_WARN = "#ff8060"
+
+
+class PipelineStatsPanel(QWidget):
+    """스테이지별 p50/p95/p99 처리 시간과 드롭/중복 프레임 수를 보여주는 오버레이 패널."""
+
+    def __init__(self, opacity: float = 0.75) -> None:
+        super().__init__()
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint
+            | Qt.WindowType.WindowStaysOnTopHint
+            | Qt.WindowType.Tool
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self._opacity = opacity
+
+        font = QFont("Consolas", 9)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 8, 10, 8)
+        layout.setSpacing(1)
+
+        header = QLabel(f"{'ms':<10} {'p50':>7} {'p95':>7} {'p99':>7}")
+        header.setFont(font)
+        header.setStyleSheet(f"color: {_TEXT};")
+        layout.addWidget(header)
+
+        self._stage_labels: dict[str, QLabel] = {}
+        for stage in STAGES:
+            lbl = QLabel(f"{stage:<10} {'-':>7} {'-':>7} {'-':>7}")
+            lbl.setFont(font)
+            lbl.setStyleSheet(f"color: {_TEXT};")
+            layout.addWidget(lbl)
+            self._stage_labels[stage] = lbl
+
+        self._frames_label = QLabel("drop 0  dup 0")
+        self._frames_label.setFont(font)
+        self._frames_label.setStyleSheet(f"color: {_TEXT};")
+        layout.addWidget(self._frames_label)
+
+        self._capture_label = QLabel("fps 0  missed 0")
+        self._capture_label.setFont(font)
+        self._capture_label.setStyleSheet(f"color: {_TEXT};")
+        layout.addWidget(self._capture_label)
+
+        self._drag_pos = None
+
+    def paintEvent(self, event: object) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        bg = QColor(_BG)
+        bg.setAlphaF(self._opacity)
+        painter.setBrush(bg)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(self.rect(), 8, 8)
+
+    def update_stats(self, stats: PipelineStats) -> None:
+        """계측 스냅샷으로 표시 갱신."""
+        for stage, lbl in self._stage_labels.items():
+            latency = stats.stages.get(stage)
+            if latency is None or latency.count == 0:
+                continue
+            lbl.setText(
+                f"{stage:<10} {latency.p50_ms:>7.1f} {latency.p95_ms:>7.1f} {latency.p99_ms:>7.1f}"
+            )
+
+        self._frames_label.setText(
+            f"drop {stats.dropped_frames:,}  dup {stats.duplicate_frames:,}"
+        )
+        missed = int(stats.capture_schedule.get("missed_deadlines", 0))
+        jitter = stats.capture_schedule.get("jitter_p95_ms", 0.0)
+        self._capture_label.setText(
+            f"fps {stats.capture_fps}  missed {missed:,}  jitter95 {jitter:.1f}ms"
+        )
+        self._capture_label.setStyleSheet(f"color: {_WARN if missed else _TEXT};")
+        self.adjustSize()
+
+    def mousePressEvent(self, event: object) -> None:
+        if hasattr(event, "globalPosition"):
+            self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+
+    def mouseMoveEvent(self, event: object) -> None:
+        if self._drag_pos is not None and hasattr(event, "globalPosition"):
+            self.move(event.globalPosition().toPoint() - self._drag_pos)
+
+    def mouseReleaseEvent(self, event: object) -> None:
+        self._drag_pos = None
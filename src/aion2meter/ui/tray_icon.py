@@ -31,6 +31,7 @@ class TrayIcon(QSystemTrayIcon):
     select_roi = pyqtSignal()
     reset_combat = pyqtSignal()
     toggle_breakdown = pyqtSignal()
+    toggle_pipeline_stats = pyqtSignal()
     save_log = pyqtSignal()
     open_settings = pyqtSignal()
     quit_app = pyqtSignal()
@@ -53,6 +54,10 @@ class TrayIcon(QSystemTrayIcon):
         breakdown_action.triggered.connect(self.toggle_breakdown.emit)
         menu.addAction(breakdown_action)
 
+        stats_action = QAction("파이프라인 통계", menu)
+        stats_action.triggered.connect(self.toggle_pipeline_stats.emit)
+        menu.addAction(stats_action)
+
         roi_action = QAction("ROI 영역 설정", menu)
         roi_action.triggered.connect(self.select_roi.emit)
         menu.addAction(roi_action)
@@ -58,8 +58,7 @@ class TestMssCapture:
         mock_sct_instance.grab.return_value = fake_bgra
 
         with patch("aion2meter.capture.mss_capture.mss.mss") as mock_mss:
-            mock_mss.return_value.__enter__ = MagicMock(return_value=mock_sct_instance)
-            mock_mss.return_value.__exit__ = MagicMock(return_value=False)
+            mock_mss.return_value = mock_sct_instance
 
             capturer = MssCapture()
             frame = capturer.capture(roi)
@@ -83,8 +82,7 @@ class TestMssCapture:
         mock_sct_instance.grab.return_value = fake_bgra
 
         with patch("aion2meter.capture.mss_capture.mss.mss") as mock_mss:
-            mock_mss.return_value.__enter__ = MagicMock(return_value=mock_sct_instance)
-            mock_mss.return_value.__exit__ = MagicMock(return_value=False)
+            mock_mss.return_value = mock_sct_instance
 
             capturer = MssCapture()
             capturer.capture(roi)
@@ -92,3 +90,113 @@ class TestMssCapture:
         mock_sct_instance.grab.assert_called_once_with(
             {"left": 100, "top": 200, "width": 300, "height": 400}
         )
+
+    def test_session_reused_across_frames(self) -> None:
+        """여러 프레임을 캡처해도 mss 세션은 한 번만 생성된다."""
+        roi = ROI(left=0, top=0, width=20, height=10)
+        mock_sct_instance = MagicMock()
+        mock_sct_instance.grab.return_value = np.zeros((10, 20, 4), dtype=np.uint8)
+
+        with patch("aion2meter.capture.mss_capture.mss.mss") as mock_mss:
+            mock_mss.return_value = mock_sct_instance
+
+            capturer = MssCapture()
+            for _ in range(5):
+                capturer.capture(roi)
+
+        assert mock_mss.call_count == 1
+        assert mock_sct_instance.grab.call_count == 5
+        mock_sct_instance.close.assert_not_called()
+
+    def test_close_releases_session(self) -> None:
+        """close()는 세션을 닫고, 다음 capture()에서 다시 연다."""
+        roi = ROI(left=0, top=0, width=20, height=10)
+        mock_sct_instance = MagicMock()
+        mock_sct_instance.grab.return_value = np.zeros((10, 20, 4), dtype=np.uint8)
+
+        with patch("aion2meter.capture.mss_capture.mss.mss") as mock_mss:
+            mock_mss.return_value = mock_sct_instance
+
+            capturer = MssCapture()
+            capturer.open()
+            assert capturer.is_open is True
+            capturer.close()
+            assert capturer.is_open is False
+            mock_sct_instance.close.assert_called_once()
+
+            capturer.capture(roi)
+            assert mock_mss.call_count == 2
+
+    def test_reconnects_on_grab_failure(self) -> None:
+        """grab이 실패하면 세션을 재연결하고 한 번 재시도한다."""
+        roi = ROI(left=0, top=0, width=20, height=10)
+        broken = MagicMock()
+        broken.grab.side_effect = RuntimeError("display lost")
+        healthy = MagicMock()
+        healthy.grab.return_value = np.zeros((10, 20, 4), dtype=np.uint8)
+
+        with patch("aion2meter.capture.mss_capture.mss.mss") as mock_mss:
+            mock_mss.side_effect = [broken, healthy]
+
+            capturer = MssCapture()
+            frame = capturer.capture(roi)
+
+        assert frame.roi == roi
+        broken.close.assert_called_once()
+        healthy.grab.assert_called_once()
+
+    def test_reconnect_failure_propagates(self) -> None:
+        """재연결 후에도 grab이 실패하면 예외를 전파한다."""
+        roi = ROI(left=0, top=0, width=20, height=10)
+        broken = MagicMock()
+        broken.grab.side_effect = RuntimeError("display lost")
+
+        with patch("aion2meter.capture.mss_capture.mss.mss") as mock_mss:
+            mock_mss.return_value = broken
+
+            capturer = MssCapture()
+            with pytest.raises(RuntimeError):
+                capturer.capture(roi)
+
+
+class TestMssCaptureFrameRing:
+    """MssCapture 링 버퍼 테스트."""
+
+    @staticmethod
+    def _capture_n(capturer: MssCapture, roi: ROI, n: int) -> list[np.ndarray]:
+        mock_sct_instance = MagicMock()
+        mock_sct_instance.grab.side_effect = lambda mon: np.full(
+            (mon["height"], mon["width"], 4), 7, dtype=np.uint8
+        )
+        with patch("aion2meter.capture.mss_capture.mss.mss") as mock_mss:
+            mock_mss.return_value = mock_sct_instance
+            return [capturer.capture(roi).image for _ in range(n)]  # type: ignore[misc]
+
+    def test_image_is_contiguous_bgr(self) -> None:
+        """반환 이미지는 C-contiguous BGR 배열이다."""
+        roi = ROI(left=0, top=0, width=30, height=10)
+        (image,) = self._capture_n(MssCapture(), roi, 1)
+        assert image.shape == (10, 30, 3)
+        assert image.flags["C_CONTIGUOUS"]
+        assert np.all(image == 7)
+
+    def test_ring_buffers_reused(self) -> None:
+        """ring_size 프레임 후에는 같은 버퍼를 재사용한다."""
+        roi = ROI(left=0, top=0, width=30, height=10)
+        images = self._capture_n(MssCapture(ring_size=3), roi, 4)
+        assert not np.shares_memory(images[0], images[1])
+        assert not np.shares_memory(images[0], images[2])
+        assert np.shares_memory(images[0], images[3])
+
+    def test_ring_reallocated_on_roi_change(self) -> None:
+        """ROI 크기가 바뀌면 링을 새 크기로 재할당한다."""
+        capturer = MssCapture(ring_size=2)
+        (small,) = self._capture_n(capturer, ROI(left=0, top=0, width=30, height=10), 1)
+        (large,) = self._capture_n(capturer, ROI(left=0, top=0, width=60, height=20), 1)
+        assert small.shape == (10, 30, 3)
+        assert large.shape == (20, 60, 3)
+        assert not np.shares_memory(small, large)
+
+    def test_invalid_ring_size(self) -> None:
+        with pytest.raises(ValueError):
+            MssCapture(ring_size=0)
@@ -0,0 +1,84 @@
+"""적응형 캡처 주기 단위 테스트."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from aion2meter.pipeline.capture_rate import AdaptiveCaptureRate
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveCaptureRate:
+    """AdaptiveCaptureRate 테스트."""
+
+    def test_starts_active(self) -> None:
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=2, clock=_Clock())
+        assert rate.current_fps == 10
+        assert rate.interval() == 0.1
+
+    def test_drops_to_idle_after_quiet_period(self) -> None:
+        clock = _Clock()
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=2, idle_after=3.0, clock=clock)
+        clock.now += 2.9
+        assert rate.interval() == 0.1
+        clock.now += 0.1
+        assert rate.interval() == 0.5
+        assert rate.current_fps == 2
+
+    def test_activity_ramps_up_immediately(self) -> None:
+        clock = _Clock()
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=2, idle_after=3.0, clock=clock)
+        clock.now += 5.0
+        rate.interval()
+        rate.notify_activity()
+        assert rate.current_fps == 10
+        assert rate.interval() == 0.1
+
+    def test_activity_keeps_active(self) -> None:
+        clock = _Clock()
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=2, idle_after=3.0, clock=clock)
+        for _ in range(5):
+            clock.now += 2.0
+            rate.notify_activity()
+            assert rate.interval() == 0.1
+
+    def test_time_at_rate(self) -> None:
+        clock = _Clock()
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=2, idle_after=3.0, clock=clock)
+        clock.now += 3.0
+        rate.interval()  # idle 전환
+        clock.now += 4.0
+        rate.notify_activity()
+        clock.now += 1.0
+        assert rate.time_at_rate() == {10: 4.0, 2: 4.0}
+
+    def test_disabled_when_idle_fps_not_lower(self) -> None:
+        clock = _Clock()
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=0, clock=clock)
+        clock.now += 60.0
+        assert rate.interval() == 0.1
+        assert rate.time_at_rate() == {10: 60.0}
+
+    def test_sleep_times_out_without_activity(self) -> None:
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=2)
+        assert rate.sleep(0.01) is False
+
+    def test_sleep_wakes_on_ramp_up(self) -> None:
+        """idle 대기 중 활동이 오면 대기를 끊는다."""
+        clock = _Clock()
+        rate = AdaptiveCaptureRate(active_fps=10, idle_fps=2, idle_after=0.0, clock=clock)
+        rate.interval()
+        timer = threading.Timer(0.02, rate.notify_activity)
+        timer.start()
+        start = time.monotonic()
+        assert rate.sleep(1.0) is True
+        timer.join()
+        assert time.monotonic() - start < 0.5
@@ -0,0 +1,92 @@
+"""프레임 변화 감지 단위 테스트."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from aion2meter.preprocess.change_detector import FrameChangeDetector
+
+
+def _image(h: int = 40, w: int = 80, value: int = 30) -> np.ndarray:
+    return np.full((h, w, 3), value, dtype=np.uint8)
+
+
+class TestFrameChangeDetector:
+    """FrameChangeDetector 테스트."""
+
+    def test_first_frame_is_changed(self) -> None:
+        det = FrameChangeDetector()
+        change = det.detect(_image())
+        assert change.identical is False
+        assert change.changed_rows.all()
+
+    def test_identical_frame(self) -> None:
+        det = FrameChangeDetector()
+        det.detect(_image())
+        change = det.detect(_image())
+        assert change.identical is True
+        assert not change.changed_rows.any()
+
+    def test_small_flicker_within_tolerance(self) -> None:
+        """모서리의 tolerance 이하 깜빡임은 무시한다."""
+        det = FrameChangeDetector(tolerance=12)
+        base = _image(value=30)
+        det.detect(base)
+        flicker = base.copy()
+        flicker[0:2, 0:2] = 38
+        assert det.detect(flicker).identical is True
+
+    def test_reports_changed_rows(self) -> None:
+        """바뀐 영역의 행만 changed_rows에 표시된다."""
+        det = FrameChangeDetector(block=4)
+        base = _image()
+        det.detect(base)
+        changed = base.copy()
+        changed[20:24, 10:40] = 255
+        change = det.detect(changed)
+
+        assert change.identical is False
+        assert change.changed_rows.shape == (40,)
+        assert change.changed_rows[20:24].all()
+        assert not change.changed_rows[:16].any()
+        assert not change.changed_rows[28:].any()
+
+    def test_detects_change_away_from_corners(self) -> None:
+        """모서리/중앙이 아닌 곳의 텍스트 변화도 감지한다."""
+        det = FrameChangeDetector()
+        base = _image()
+        det.detect(base)
+        changed = base.copy()
+        changed[6:10, 50:70] = 255
+        assert det.detect(changed).identical is False
+
+    def test_rows_cover_non_divisible_height(self) -> None:
+        det = FrameChangeDetector(block=4)
+        base = _image(h=42)
+        det.detect(base)
+        changed = base.copy()
+        changed[40:42] = 255
+        change = det.detect(changed)
+        assert change.changed_rows.shape == (42,)
+        assert change.changed_rows[41]
+
+    def test_shape_change_is_changed(self) -> None:
+        det = FrameChangeDetector()
+        det.detect(_image(h=40))
+        assert det.detect(_image(h=60)).identical is False
+
+    def test_grayscale_input(self) -> None:
+        det = FrameChangeDetector()
+        det.detect(np.zeros((20, 20), dtype=np.uint8))
+        assert det.detect(np.zeros((20, 20), dtype=np.uint8)).identical is True
+
+    def test_reset(self) -> None:
+        det = FrameChangeDetector()
+        det.detect(_image())
+        det.reset()
+        assert det.detect(_image()).identical is False
+
+    def test_invalid_block(self) -> None:
+        with pytest.raises(ValueError):
+            FrameChangeDetector(block=0)
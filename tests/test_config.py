@@ -22,6 +22,9 @@ class TestConfigLoad:
         """파일이 없으면 기본값을 반환한다."""
         cfg = manager.load()
         assert cfg.fps == 10
+        assert cfg.capture_idle_fps == 2
+        assert cfg.capture_idle_after == 3.0
+        assert cfg.capture_record is False
         assert cfg.ocr_engine == "winocr"
         assert cfg.idle_timeout == 5.0
         assert cfg.overlay_opacity == 0.75
@@ -92,6 +95,9 @@ class TestConfigSave:
         original = AppConfig(
             roi=ROI(left=10, top=20, width=300, height=400),
             fps=15,
+            capture_idle_fps=1,
+            capture_idle_after=8.0,
+            capture_record=True,
             ocr_engine="tesseract",
             idle_timeout=3.0,
             overlay_opacity=0.9,
@@ -103,6 +109,9 @@ class TestConfigSave:
         loaded = manager.load()
 
         assert loaded.fps == original.fps
+        assert loaded.capture_idle_fps == 1
+        assert loaded.capture_idle_after == 8.0
+        assert loaded.capture_record is True
         assert loaded.ocr_engine == original.ocr_engine
         assert loaded.idle_timeout == original.idle_timeout
         assert loaded.overlay_opacity == original.overlay_opacity
@@ -248,6 +257,9 @@ class TestPreprocessConfig:
         assert config.preprocess.sharpen is True
         assert config.preprocess.adaptive_threshold is False
         assert config.preprocess.cleanup_min_area == 10
+        assert config.preprocess.mask_before_upscale is False
+        assert config.preprocess.change_block == 4
+        assert config.preprocess.change_tolerance == 12
 
     def test_preprocess_config_roundtrip(self, tmp_path):
         from aion2meter.models import PreprocessConfig
@@ -258,6 +270,9 @@ class TestPreprocessConfig:
                 sharpen=True,
                 adaptive_threshold=True,
                 cleanup_min_area=20,
+                mask_before_upscale=True,
+                change_block=8,
+                change_tolerance=4,
             ),
         )
         mgr = ConfigManager(default_path=tmp_path / "config.toml")
@@ -268,6 +283,9 @@ class TestPreprocessConfig:
         assert loaded.preprocess.sharpen is True
         assert loaded.preprocess.adaptive_threshold is True
         assert loaded.preprocess.cleanup_min_area == 20
+        assert loaded.preprocess.mask_before_upscale is True
+        assert loaded.preprocess.change_block == 8
+        assert loaded.preprocess.change_tolerance == 4
 
 
 class TestOcrEngineConfig:
@@ -279,6 +297,13 @@ class TestOcrEngineConfig:
         assert config.ocr_fallback == ""
         assert config.ocr_mode == "failover"
         assert config.ocr_debug is False
+        assert config.ocr_debug_sample_every == 1
+        assert config.ocr_debug_only_empty is False
+        assert config.ocr_corrections == {}
+        assert config.ocr_incremental is True
+        assert config.ocr_workers == 1
+        assert config.ocr_cache_bytes == 1_048_576
+        assert config.ocr_deadline == 1.0
 
     def test_ocr_config_roundtrip(self, tmp_path):
         config = AppConfig(
@@ -286,6 +311,13 @@ class TestOcrEngineConfig:
             ocr_fallback="tesseract",
             ocr_mode="best_confidence",
             ocr_debug=True,
+            ocr_debug_sample_every=5,
+            ocr_debug_only_empty=True,
+            ocr_corrections={"대미쥐": "대미지", 'a"b': "c\\d"},
+            ocr_incremental=False,
+            ocr_workers=3,
+            ocr_cache_bytes=0,
+            ocr_deadline=0.25,
         )
         mgr = ConfigManager(default_path=tmp_path / "config.toml")
         mgr.save(config)
@@ -294,3 +326,10 @@ class TestOcrEngineConfig:
         assert loaded.ocr_fallback == "tesseract"
         assert loaded.ocr_mode == "best_confidence"
         assert loaded.ocr_debug is True
+        assert loaded.ocr_debug_sample_every == 5
+        assert loaded.ocr_debug_only_empty is True
+        assert loaded.ocr_corrections == {"대미쥐": "대미지", 'a"b': "c\\d"}
+        assert loaded.ocr_incremental is False
+        assert loaded.ocr_workers == 3
+        assert loaded.ocr_cache_bytes == 0
+        assert loaded.ocr_deadline == 0.25
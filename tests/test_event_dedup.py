@@ -0,0 +1,103 @@
+"""스크롤 인식 이벤트 중복 제거 단위 테스트."""
+
+from __future__ import annotations
+
+from aion2meter.models import DamageEvent, HitType
+from aion2meter.parser.event_dedup import EventDeduplicator
+
+
+def _evt(damage: int, ts: float = 1.0, skill: str = "검격") -> DamageEvent:
+    return DamageEvent(
+        timestamp=ts, source="", target="몬스터", skill=skill, damage=damage,
+        hit_type=HitType.NORMAL,
+    )
+
+
+def _frame(damages: list[int], ts: float) -> list[DamageEvent]:
+    return [_evt(d, ts) for d in damages]
+
+
+class TestEventDeduplicator:
+    """EventDeduplicator 테스트."""
+
+    def test_first_frame_passes_all(self) -> None:
+        dedup = EventDeduplicator()
+        assert len(dedup.filter(_frame([1, 2, 3], 1.0))) == 3
+
+    def test_same_frame_again_emits_nothing(self) -> None:
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2, 3], 1.0))
+        assert dedup.filter(_frame([1, 2, 3], 1.1)) == []
+
+    def test_scrolled_frame_emits_only_new(self) -> None:
+        """1줄 스크롤되면 마지막 새 이벤트만 내보낸다."""
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2, 3], 1.0))
+        new = dedup.filter(_frame([2, 3, 4], 1.1))
+        assert [e.damage for e in new] == [4]
+        assert new[0].timestamp == 1.1
+
+    def test_repeated_identical_hit_is_counted(self) -> None:
+        """같은 대미지 줄이 연달아 새로 추가되어도 센다."""
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2, 3], 1.0))
+        new = dedup.filter(_frame([2, 3, 3], 1.1))
+        assert [e.damage for e in new] == [3]
+
+    def test_growing_log(self) -> None:
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2], 1.0))
+        new = dedup.filter(_frame([1, 2, 3, 4], 1.1))
+        assert [e.damage for e in new] == [3, 4]
+
+    def test_garbled_top_line_skipped(self) -> None:
+        """맨 윗줄이 잘못 읽혀도 나머지로 정렬한다."""
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2, 3], 1.0))
+        new = dedup.filter(_frame([999, 3, 4], 1.1))
+        assert [e.damage for e in new] == [4]
+
+    def test_no_overlap_falls_back_to_memory(self) -> None:
+        """정렬에 실패하면 최근 기억에 없는 이벤트만 내보낸다."""
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2, 3], 1.0))
+        new = dedup.filter(_frame([7, 1, 8, 9], 1.1))
+        assert [e.damage for e in new] == [7, 8, 9]
+
+    def test_remember_passes_repeats_and_blocks_resent_frame(self) -> None:
+        """새 줄만 들어온 이벤트는 같은 내용이 반복돼도 통과하고, 이후 전체 프레임 재전송은 걸러진다."""
+        dedup = EventDeduplicator()
+        dedup.remember(_frame([1, 2], 1.0))
+        dedup.remember(_frame([2], 1.1))
+        assert dedup.emitted_count == 3
+        assert dedup.filter(_frame([1, 2, 2], 1.2)) == []
+
+    def test_memory_is_bounded(self) -> None:
+        dedup = EventDeduplicator(memory=4)
+        dedup.filter(_frame(list(range(10)), 1.0))
+        assert len(dedup._history) == 4
+
+    def test_counters(self) -> None:
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2, 3], 1.0))
+        dedup.filter(_frame([2, 3, 4], 1.1))
+        assert dedup.emitted_count == 4
+        assert dedup.dropped_count == 2
+
+    def test_reset(self) -> None:
+        dedup = EventDeduplicator()
+        dedup.filter(_frame([1, 2, 3], 1.0))
+        dedup.reset()
+        assert len(dedup.filter(_frame([1, 2, 3], 1.1))) == 3
+        assert dedup.dropped_count == 0
+
+    def test_empty_events(self) -> None:
+        dedup = EventDeduplicator()
+        assert dedup.filter([]) == []
+
+    def test_different_skill_not_merged(self) -> None:
+        """대미지가 같아도 스킬이 다르면 다른 이벤트다."""
+        dedup = EventDeduplicator()
+        dedup.filter([_evt(100, 1.0, "검격")])
+        new = dedup.filter([_evt(100, 1.1, "검격"), _evt(100, 1.1, "화염")])
+        assert [e.skill for e in new] == ["화염"]
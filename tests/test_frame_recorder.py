@@ -0,0 +1,104 @@
+"""프레임 녹화 파일 단위 테스트."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from aion2meter.io.frame_recorder import FrameReader, FrameRecorder
+
+
+def _image(value: int, shape: tuple[int, ...] = (12, 16, 3)) -> np.ndarray:
+    rng = np.random.default_rng(value)
+    return rng.integers(0, 256, size=shape, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_roundtrip(tmp_path, compress) -> None:
+    path = tmp_path / "rec" / "session.a2rec"
+    recorder = FrameRecorder(path, compress=compress)
+    images = [_image(i) for i in range(5)]
+    for i, image in enumerate(images):
+        assert recorder.record(image, 10.0 + i * 0.1)
+    recorder.close()
+
+    assert recorder.written == 5
+    with FrameReader(path) as reader:
+        assert len(reader) == 5
+        assert reader.timestamps == pytest.approx([10.0, 10.1, 10.2, 10.3, 10.4])
+        ts, image = reader[3]
+        assert ts == pytest.approx(10.3)
+        np.testing.assert_array_equal(image, images[3])
+        assert [t for t, _ in reader] == reader.timestamps
+
+
+def test_grayscale_frames(tmp_path) -> None:
+    path = tmp_path / "gray.a2rec"
+    recorder = FrameRecorder(path)
+    image = _image(1, (8, 9))
+    recorder.record(image, 1.0)
+    recorder.close()
+
+    with FrameReader(path) as reader:
+        np.testing.assert_array_equal(reader[0][1], image)
+
+
+def test_record_copies_frame(tmp_path) -> None:
+    """record() 이후 원본 버퍼가 재사용돼도 녹화 내용은 바뀌지 않는다."""
+    path = tmp_path / "copy.a2rec"
+    recorder = FrameRecorder(path)
+    image = _image(2)
+    expected = image.copy()
+    recorder.record(image, 1.0)
+    image[:] = 0
+    recorder.close()
+
+    with FrameReader(path) as reader:
+        np.testing.assert_array_equal(reader[0][1], expected)
+
+
+def test_full_queue_drops_without_blocking(tmp_path, monkeypatch) -> None:
+    gate = threading.Event()
+    recorder = FrameRecorder(tmp_path / "drop.a2rec", max_queue_size=1)
+    original = recorder._write
+
+    def slow_write(*args):
+        gate.wait(2)
+        original(*args)
+
+    monkeypatch.setattr(recorder, "_write", slow_write)
+    results = [recorder.record(_image(i), float(i)) for i in range(5)]
+    gate.set()
+    recorder.close()
+
+    assert recorder.dropped == results.count(False)
+    assert recorder.dropped >= 3
+    assert recorder.written == results.count(True)
+    assert recorder.record(_image(9), 9.0) is False
+
+
+def test_missing_footer_rebuilds_index(tmp_path) -> None:
+    """비정상 종료로 인덱스가 없으면 레코드를 훑어 복구하고, 잘린 레코드는 버린다."""
+    path = tmp_path / "crash.a2rec"
+    recorder = FrameRecorder(path, compress=False)
+    for i in range(3):
+        recorder.record(_image(i), float(i))
+    recorder.close()
+
+    data = path.read_bytes()
+    record_size = (len(data) - 8 - 3 * 16 - 24) // 3
+    path.write_bytes(data[: 8 + 2 * record_size + 10])
+
+    with FrameReader(path) as reader:
+        assert len(reader) == 2
+        np.testing.assert_array_equal(reader[1][1], _image(1))
+
+
+def test_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a recording")
+    assert FrameReader.is_recording(path) is False
+    with pytest.raises(ValueError):
+        FrameReader(path)
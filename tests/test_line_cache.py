@@ -0,0 +1,176 @@
+"""OCR 줄 캐시 단위 테스트."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+
+from aion2meter.models import OcrResult
+from aion2meter.ocr.line_cache import CachedOcrEngine, OcrLineCache
+from aion2meter.preprocess.line_segmenter import LineSegmenter
+
+_LINE_H = 10
+_LINE_GAP = 6
+_WIDTH = 60
+
+
+def _line(seed: int) -> np.ndarray:
+    rng = np.random.RandomState(seed)
+    strip = np.where(rng.random((_LINE_H, _WIDTH)) < 0.3, 255, 0).astype(np.uint8)
+    strip[:, 0] = 255
+    return strip
+
+
+def _log(seeds: list[int]) -> np.ndarray:
+    image = np.zeros((3 + len(seeds) * (_LINE_H + _LINE_GAP) + 5, _WIDTH), dtype=np.uint8)
+    y = 3
+    for seed in seeds:
+        image[y:y + _LINE_H] = _line(seed)
+        y += _LINE_H + _LINE_GAP
+    return image
+
+
+class _FakeEngine:
+    """줄 strip 픽셀로 seed를 알아내 "line<seed>" 줄들을 돌려주는 엔진."""
+
+    def __init__(self, drop_lines: bool = False) -> None:
+        self._known = {_line(seed).tobytes(): f"line{seed}" for seed in range(20)}
+        self._segmenter = LineSegmenter()
+        self._drop_lines = drop_lines
+        self.calls: list[int] = []
+
+    def recognize(self, image: np.ndarray) -> OcrResult:
+        bands = self._segmenter.segment(image)
+        self.calls.append(len(bands))
+        texts = [self._known.get(image[s:e].tobytes(), "?") for s, e in bands]
+        if self._drop_lines and len(texts) > 1:
+            texts = [" ".join(texts)]
+        return OcrResult(text="\n".join(texts), confidence=0.9, timestamp=1.0)
+
+
+class TestOcrLineCache:
+    """OcrLineCache 테스트."""
+
+    def test_hit_and_miss_counters(self) -> None:
+        cache = OcrLineCache()
+        key = cache.key(_line(1))
+        assert cache.get(key) is None
+        cache.put(key, "line1", 0.9)
+        assert cache.get(key) == ("line1", 0.9)
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_key_depends_on_shape(self) -> None:
+        strip = np.zeros((4, 6), dtype=np.uint8)
+        assert OcrLineCache.key(strip) != OcrLineCache.key(strip.reshape(6, 4))
+
+    def test_byte_budget_evicts_least_recently_used(self) -> None:
+        cache = OcrLineCache(max_bytes=3 * (16 + 5))
+        keys = [cache.key(_line(i)) for i in range(4)]
+        for i in range(3):
+            cache.put(keys[i], f"line{i}", 0.9)
+        cache.get(keys[0])  # 0을 최근 사용으로
+        cache.put(keys[3], "line3", 0.9)
+
+        assert len(cache) == 3
+        assert cache.bytes_used <= 3 * (16 + 5)
+        assert cache.evictions == 1
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+
+    def test_oversized_entry_not_stored(self) -> None:
+        cache = OcrLineCache(max_bytes=10)
+        cache.put(cache.key(_line(1)), "a long line of text", 0.9)
+        assert len(cache) == 0
+        assert cache.bytes_used == 0
+
+
+class TestCachedOcrEngine:
+    """CachedOcrEngine 테스트."""
+
+    def test_unchanged_lines_not_reocrd(self) -> None:
+        engine = _FakeEngine()
+        cached = CachedOcrEngine(engine, OcrLineCache())
+
+        assert cached.recognize(_log([1, 2, 3])).text == "line1\nline2\nline3"
+        assert cached.recognize(_log([1, 2, 3])).text == "line1\nline2\nline3"
+        assert engine.calls == [3]
+
+    def test_only_new_line_recognized_after_scroll(self) -> None:
+        engine = _FakeEngine()
+        cached = CachedOcrEngine(engine, OcrLineCache())
+        cached.recognize(_log([1, 2, 3]))
+
+        result = cached.recognize(_log([2, 3, 4]))
+
+        assert result.text == "line2\nline3\nline4"
+        assert engine.calls == [3, 1]
+
+    def test_line_count_mismatch_falls_back_to_single_lines(self) -> None:
+        """엔진이 줄을 합쳐 돌려주면 줄마다 따로 인식해 캐시한다."""
+        engine = _FakeEngine(drop_lines=True)
+        cached = CachedOcrEngine(engine, OcrLineCache())
+
+        assert cached.recognize(_log([1, 2])).text == "line1\nline2"
+        assert cached.split_mismatches == 1
+        assert engine.calls == [2, 1, 1]
+        cached.recognize(_log([1, 2]))
+        assert engine.calls == [2, 1, 1]
+
+    def test_empty_text_cached_as_negative_entry(self) -> None:
+        """글자가 없다고 인식된 줄은 빈 텍스트로 캐시해 다시 인식하지 않는다."""
+        class _Empty:
+            calls = 0
+
+            def recognize(self, image):
+                self.calls += 1
+                return OcrResult(text="", confidence=0.0, timestamp=0.0)
+
+        engine = _Empty()
+        cache = OcrLineCache()
+        cached = CachedOcrEngine(engine, cache)
+        assert cached.recognize(_log([1])).text == ""
+        assert cached.recognize(_log([1])).text == ""
+        assert engine.calls == 1
+        assert len(cache) == 1
+
+    def test_line_count_mismatch_caches_blank_lines(self) -> None:
+        """글자 없는 줄(아이콘 등) 때문에 줄 수가 어긋나도 한 번 인식한 뒤에는 캐시로 끝난다."""
+        engine = _FakeEngine()
+        engine._known[_line(2).tobytes()] = ""
+        recognize = engine.recognize
+
+        def _skip_blank(image: np.ndarray) -> OcrResult:
+            result = recognize(image)
+            return replace(result, text="\n".join(t for t in result.text.splitlines() if t))
+
+        engine.recognize = _skip_blank
+        cache = OcrLineCache()
+        cached = CachedOcrEngine(engine, cache)
+
+        assert cached.recognize(_log([1, 2])).text == "line1"
+        calls = len(engine.calls)
+        assert cached.recognize(_log([1, 2])).text == "line1"
+        assert len(engine.calls) == calls
+        assert len(cache) == 2
+
+    def test_engine_failure_not_cached_and_reported(self) -> None:
+        """엔진이 실패하면 캐시된 줄까지 포함해 failed 결과를 돌려주고 아무것도 캐시하지 않는다."""
+        engine = _FakeEngine()
+        cache = OcrLineCache()
+        cached = CachedOcrEngine(engine, cache)
+        cached.recognize(_log([1, 2]))
+        engine.recognize = lambda image: OcrResult(text="", confidence=0.0, timestamp=0.0, failed=True)
+
+        result = cached.recognize(_log([1, 2, 3]))
+
+        assert result.failed
+        assert result.text == ""
+        assert len(cache) == 2
+
+    def test_blank_image_passes_through(self) -> None:
+        engine = _FakeEngine()
+        cached = CachedOcrEngine(engine, OcrLineCache())
+        assert cached.recognize(np.zeros((20, 20), dtype=np.uint8)).text == ""
+        assert engine.calls == [0]
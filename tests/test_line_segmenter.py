@@ -0,0 +1,185 @@
+"""줄 분할 / 증분 추출 단위 테스트."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from aion2meter.preprocess.line_segmenter import LineSegmenter
+
+_LINE_H = 10
+_LINE_GAP = 6
+_WIDTH = 60
+
+
+def _line(seed: int) -> np.ndarray:
+    """seed마다 다른 패턴의 텍스트 줄 strip (행마다 전경 픽셀 포함)."""
+    rng = np.random.RandomState(seed)
+    strip = np.where(rng.random((_LINE_H, _WIDTH)) < 0.3, 255, 0).astype(np.uint8)
+    strip[:, 0] = 255
+    return strip
+
+
+def _log(seeds: list[int], top: int = 3) -> np.ndarray:
+    """seeds 순서대로 줄을 쌓은 전투 로그 이진 이미지."""
+    height = top + len(seeds) * (_LINE_H + _LINE_GAP) + 5
+    image = np.zeros((height, _WIDTH), dtype=np.uint8)
+    y = top
+    for seed in seeds:
+        image[y:y + _LINE_H] = _line(seed)
+        y += _LINE_H + _LINE_GAP
+    return image
+
+
+class TestSegment:
+    """segment() 테스트."""
+
+    def test_finds_line_bands(self) -> None:
+        seg = LineSegmenter()
+        bands = seg.segment(_log([1, 2, 3]))
+        assert bands == [(3, 13), (19, 29), (35, 45)]
+
+    def test_empty_image(self) -> None:
+        seg = LineSegmenter()
+        assert seg.segment(np.zeros((20, 30), dtype=np.uint8)) == []
+
+    def test_merges_small_gaps(self) -> None:
+        """min_gap 미만의 공백은 같은 줄로 병합한다."""
+        image = np.zeros((20, 10), dtype=np.uint8)
+        image[2:6] = 255
+        image[7:12] = 255  # 1px 공백
+        seg = LineSegmenter(min_gap=2)
+        assert seg.segment(image) == [(2, 12)]
+
+    def test_drops_short_bands(self) -> None:
+        """min_height 미만의 구간(노이즈)은 버린다."""
+        image = np.zeros((20, 10), dtype=np.uint8)
+        image[2:4] = 255
+        image[8:16] = 255
+        seg = LineSegmenter(min_height=4)
+        assert seg.segment(image) == [(8, 16)]
+
+
+class TestExtractNew:
+    """extract_new() 테스트."""
+
+    def test_first_frame_returns_all_lines(self) -> None:
+        seg = LineSegmenter(padding=4)
+        out = seg.extract_new(_log([1, 2, 3]))
+        assert out is not None
+        assert len(seg.segment(out)) == 3
+
+    def test_unchanged_frame_returns_none(self) -> None:
+        seg = LineSegmenter()
+        seg.extract_new(_log([1, 2, 3]))
+        assert seg.extract_new(_log([1, 2, 3])) is None
+
+    def test_scroll_returns_only_new_lines(self) -> None:
+        """1줄 스크롤되면 새로 나타난 마지막 줄만 반환한다."""
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 3]))
+        out = seg.extract_new(_log([2, 3, 4]))
+
+        assert out is not None
+        bands = seg.segment(out)
+        assert len(bands) == 1
+        s, e = bands[0]
+        assert np.array_equal(out[s:e], _line(4))
+        assert seg.last_scroll_offset == _LINE_H + _LINE_GAP
+
+    def test_scroll_by_two_lines(self) -> None:
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 3, 4]))
+        out = seg.extract_new(_log([3, 4, 5, 6]))
+        assert out is not None
+        assert len(seg.segment(out)) == 2
+
+    def test_repeated_identical_line_detected(self) -> None:
+        """같은 내용의 줄이 다시 추가되어도 새 줄로 인식한다."""
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 3]))
+        out = seg.extract_new(_log([2, 3, 3]))
+        assert out is not None
+        assert len(seg.segment(out)) == 1
+
+    def test_growing_log_without_scroll(self) -> None:
+        """로그가 아직 차지 않아 아래로 줄이 추가되는 경우."""
+        seg = LineSegmenter(padding=4)
+        first = np.zeros_like(_log([1, 2, 3]))
+        first[: _log([1, 2]).shape[0]] = _log([1, 2])
+        seg.extract_new(first)
+        out = seg.extract_new(_log([1, 2, 3]))
+        assert out is not None
+        assert len(seg.segment(out)) == 1
+        assert seg.last_scroll_offset == 0
+
+    def test_changed_last_line_not_resent(self) -> None:
+        """이전 프레임의 마지막 줄이 바뀌기만 했으면 이미 인식한 줄이므로 다시 보내지 않는다."""
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 99]))
+        assert seg.extract_new(_log([1, 2, 3])) is None
+        assert seg.last_new_hashes == []
+
+    def test_changed_last_line_resent_when_unread(self) -> None:
+        """마지막 줄의 인식 결과가 버려졌다면 바뀐 그 줄을 다시 보낸다."""
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 99]))
+        seg.mark_unread(seg.last_new_hashes)
+        out = seg.extract_new(_log([1, 2, 3]))
+        assert out is not None
+        bands = seg.segment(out)
+        assert len(bands) == 3
+
+    def test_unread_lines_resent_once_while_visible(self) -> None:
+        """인식 결과가 버려진 줄은 스크롤 뒤에도 화면에 있으면 새 줄과 함께 한 번만 다시 보낸다."""
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 3]))
+        seg.extract_new(_log([2, 3, 4]))
+        seg.mark_unread(seg.last_new_hashes)
+        out = seg.extract_new(_log([3, 4, 5]))
+        assert out is not None
+        bands = seg.segment(out)
+        assert [out[s:e].tobytes() for s, e in bands] == [_line(4).tobytes(), _line(5).tobytes()]
+        assert seg.extract_new(_log([4, 5, 6])) is not None
+        assert len(seg.last_new_hashes) == 1
+
+    def test_clipped_top_line_skipped(self) -> None:
+        """한 줄 + 5px 스크롤로 맨 윗줄이 잘려도 정렬하고, 새 줄만 반환한다."""
+        seg = LineSegmenter(padding=4)
+        first = _log([1, 2, 3, 4])
+        scrolled = np.zeros((first.shape[0] + 40, _WIDTH), dtype=np.uint8)
+        source = _log([1, 2, 3, 4, 5])
+        scrolled[: source.shape[0]] = source
+        shift = _LINE_H + _LINE_GAP + 5
+        seg.extract_new(first)
+
+        out = seg.extract_new(scrolled[shift : shift + first.shape[0]])
+
+        assert out is not None
+        bands = seg.segment(out)
+        assert len(bands) == 1
+        s, e = bands[0]
+        assert np.array_equal(out[s:e], _line(5))
+        assert seg.last_scroll_offset == shift
+
+    def test_no_overlap_returns_all(self) -> None:
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 3]))
+        out = seg.extract_new(_log([7, 8, 9]))
+        assert out is not None
+        assert len(seg.segment(out)) == 3
+        assert seg.last_scroll_offset is None
+
+    def test_shape_change_resets(self) -> None:
+        """이미지 크기가 바뀌면 모든 줄을 새 줄로 취급한다."""
+        seg = LineSegmenter(padding=4)
+        seg.extract_new(_log([1, 2, 3]))
+        out = seg.extract_new(_log([1, 2, 3], top=5))
+        assert out is not None
+        assert len(seg.segment(out)) == 3
+
+    def test_reset(self) -> None:
+        seg = LineSegmenter()
+        seg.extract_new(_log([1, 2, 3]))
+        seg.reset()
+        assert seg.extract_new(_log([1, 2, 3])) is not None
+        assert len(seg.last_new_hashes) == 3
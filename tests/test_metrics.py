@@ -0,0 +1,90 @@
+"""파이프라인 계측 단위 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from aion2meter.pipeline.metrics import STAGES, LatencyHistogram, LatencyWindow, PipelineMetrics
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트."""
+
+    def test_empty(self) -> None:
+        h = LatencyHistogram()
+        assert h.count == 0
+        assert h.percentile(0.5) == 0.0
+
+    def test_percentiles_within_bucket_error(self) -> None:
+        h = LatencyHistogram()
+        for ms in range(1, 101):
+            h.record(ms / 1000)
+        summary = h.summary()
+        assert summary.count == 100
+        # 버킷 상한이므로 실제 값 이상, 25% 이내
+        assert 50 <= summary.p50_ms <= 50 * 1.25
+        assert 95 <= summary.p95_ms <= 95 * 1.25
+        assert 99 <= summary.p99_ms <= 99 * 1.25
+
+    def test_outlier_goes_to_overflow_bucket(self) -> None:
+        h = LatencyHistogram()
+        h.record(60.0)
+        assert h.percentile(1.0) == pytest.approx(h.percentile(0.5))
+        assert h.percentile(1.0) >= 15.0
+
+    def test_reset(self) -> None:
+        h = LatencyHistogram()
+        h.record(0.01)
+        h.reset()
+        assert h.count == 0
+
+
+class TestPipelineMetrics:
+    """PipelineMetrics 테스트."""
+
+    def test_records_per_stage(self) -> None:
+        m = PipelineMetrics()
+        m.record("ocr", 0.05)
+        m.record("ocr", 0.05)
+        m.record("parse", 0.001)
+        summaries = m.summaries()
+        assert set(summaries) == set(STAGES)
+        assert summaries["ocr"].count == 2
+        assert summaries["parse"].count == 1
+        assert summaries["capture"].count == 0
+
+    def test_reset_clears_counters(self) -> None:
+        m = PipelineMetrics()
+        m.record("capture", 0.002)
+        m.duplicate_frames = 3
+        m.reset()
+        assert m.summaries()["capture"].count == 0
+        assert m.duplicate_frames == 0
+
+
+class TestLatencyWindow:
+    """LatencyWindow 테스트."""
+
+    def test_summary(self) -> None:
+        w = LatencyWindow()
+        for ms in range(1, 101):
+            w.record(float(ms))
+        summary = w.summary()
+        assert summary["count"] == 100
+        assert summary["p50_ms"] == 51.0
+        assert summary["p99_ms"] == 100.0
+        assert summary["max_ms"] == 100.0
+
+    def test_rolling_window_keeps_recent(self) -> None:
+        w = LatencyWindow(window=3)
+        for ms in (500.0, 1.0, 2.0, 3.0):
+            w.record(ms)
+        assert len(w) == 3
+        assert w.summary()["max_ms"] == 3.0
+
+    def test_empty_and_clear(self) -> None:
+        w = LatencyWindow()
+        assert w.summary() == {"count": 0}
+        w.record(5.0)
+        w.clear()
+        assert w.summary() == {"count": 0}
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
 
 from aion2meter.models import OcrResult
-from aion2meter.ocr.engine_manager import OcrEngineManager
+from aion2meter.ocr.engine_manager import OcrDeadlineExceeded, OcrEngineManager
 
 
 def _ok_result(text: str = "테스트") -> OcrResult:
@@ -44,6 +47,7 @@ class TestOcrEngineManager:
         # 1회 실패: 아직 fallback 전환 안 됨
         result = mgr.recognize(_make_image())
         assert result.text == ""
+        assert result.failed
         fallback.recognize.assert_not_called()
 
     def test_switch_to_fallback_after_max_failures(self) -> None:
@@ -164,3 +168,124 @@ class TestBestConfidenceMode:
         result = mgr.recognize(_make_image())
 
         assert result.text == "primary"
+
+    def test_best_confidence_runs_engines_concurrently(self) -> None:
+        """두 엔진을 동시에 실행하므로 지연은 합이 아니라 최댓값에 가깝다."""
+        def _slow(text: str, confidence: float):
+            def _recognize(image):
+                time.sleep(0.1)
+                return OcrResult(text=text, confidence=confidence, timestamp=1.0)
+            return _recognize
+
+        primary = MagicMock()
+        primary.recognize.side_effect = _slow("primary", 0.6)
+        fallback = MagicMock()
+        fallback.recognize.side_effect = _slow("fallback", 0.8)
+
+        mgr = OcrEngineManager(primary=primary, fallback=fallback, mode="best_confidence")
+        start = time.monotonic()
+        result = mgr.recognize(_make_image())
+        elapsed = time.monotonic() - start
+        mgr.close()
+
+        assert result.text == "fallback"
+        assert elapsed < 0.18
+
+    def test_best_confidence_deadline_returns_available_result(self) -> None:
+        """deadline을 넘긴 엔진은 제외하고, 다음 프레임에서도 아직 돌면 건너뛴다."""
+        release = threading.Event()
+        primary = MagicMock()
+        primary.recognize.return_value = OcrResult(text="primary", confidence=0.5, timestamp=1.0)
+        fallback = MagicMock()
+        fallback.recognize.side_effect = lambda image: (
+            release.wait(2.0), OcrResult(text="fallback", confidence=0.99, timestamp=1.0),
+        )[1]
+
+        mgr = OcrEngineManager(
+            primary=primary, fallback=fallback, mode="best_confidence", deadline=0.05,
+        )
+        try:
+            assert mgr.recognize(_make_image()).text == "primary"
+            assert mgr.recognize(_make_image()).text == "primary"
+        finally:
+            release.set()
+            mgr.close()
+
+        stats = mgr.best_confidence_stats
+        assert stats["wins"] == {"primary": 2, "fallback": 0}
+        assert stats["timeouts"]["fallback"] == 1
+        assert stats["busy_skips"]["fallback"] == 1
+        assert fallback.recognize.call_count == 1
+
+    def test_best_confidence_no_result_in_time_raises(self) -> None:
+        """두 엔진 모두 deadline을 넘기거나 실행 중이면 빈 결과 대신 OcrDeadlineExceeded를 던진다."""
+        release = threading.Event()
+        slow = lambda image: (release.wait(2.0), OcrResult(text="late", confidence=0.9, timestamp=1.0))[1]
+        primary = MagicMock()
+        primary.recognize.side_effect = slow
+        fallback = MagicMock()
+        fallback.recognize.side_effect = slow
+
+        mgr = OcrEngineManager(
+            primary=primary, fallback=fallback, mode="best_confidence", deadline=0.02,
+        )
+        try:
+            with pytest.raises(OcrDeadlineExceeded):
+                mgr.recognize(_make_image())
+            with pytest.raises(OcrDeadlineExceeded):
+                mgr.recognize(_make_image())
+        finally:
+            release.set()
+            mgr.close()
+
+        stats = mgr.best_confidence_stats
+        assert stats["timeouts"] == {"primary": 1, "fallback": 1}
+        assert stats["busy_skips"] == {"primary": 1, "fallback": 1}
+
+    def test_best_confidence_engines_get_private_copy(self) -> None:
+        """시간 초과 뒤에도 도는 엔진이 호출자 버퍼를 읽지 않도록 복사본을 넘긴다."""
+        seen: list[np.ndarray] = []
+        primary = MagicMock()
+        primary.recognize.side_effect = lambda image: (
+            seen.append(image), OcrResult(text="primary", confidence=0.5, timestamp=1.0),
+        )[1]
+        fallback = MagicMock()
+        fallback.recognize.return_value = OcrResult(text="fallback", confidence=0.1, timestamp=1.0)
+        image = _make_image()
+
+        mgr = OcrEngineManager(primary=primary, fallback=fallback, mode="best_confidence")
+        mgr.recognize(image)
+        mgr.close()
+
+        assert np.array_equal(seen[0], image)
+        assert not np.shares_memory(seen[0], image)
+        assert fallback.recognize.call_args[0][0] is seen[0]
+
+    def test_best_confidence_counts_wins(self) -> None:
+        primary = MagicMock()
+        primary.recognize.return_value = OcrResult(text="primary", confidence=0.7, timestamp=1.0)
+        fallback = MagicMock()
+        fallback.recognize.return_value = OcrResult(text="fallback", confidence=0.7, timestamp=1.0)
+
+        mgr = OcrEngineManager(primary=primary, fallback=fallback, mode="best_confidence")
+        # 동점이면 primary
+        assert mgr.recognize(_make_image()).text == "primary"
+        fallback.recognize.return_value = OcrResult(text="fallback", confidence=0.9, timestamp=1.0)
+        assert mgr.recognize(_make_image()).text == "fallback"
+        mgr.close()
+
+        assert mgr.best_confidence_stats["wins"] == {"primary": 1, "fallback": 1}
+
+    def test_best_confidence_both_fail(self) -> None:
+        primary = MagicMock()
+        primary.recognize.side_effect = RuntimeError("fail")
+        fallback = MagicMock()
+        fallback.recognize.side_effect = RuntimeError("fail")
+
+        mgr = OcrEngineManager(primary=primary, fallback=fallback, mode="best_confidence")
+        result = mgr.recognize(_make_image())
+        mgr.close()
+
+        assert result.text == ""
+        assert result.failed
+        assert mgr.best_confidence_stats["wins"] == {"primary": 0, "fallback": 0}
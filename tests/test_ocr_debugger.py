@@ -75,3 +75,92 @@ class TestOcrDebugger:
         frame_dir = tmp_path / "debug" / "frame_000001"
         events_data = json.loads((frame_dir / "events.json").read_text(encoding="utf-8"))
         assert events_data == []
+
+    def test_dump_writes_timestamp(self, tmp_path) -> None:
+        """timestamp를 주면 frame.json에 캡처 시각을 남긴다."""
+        from aion2meter.io.ocr_debugger import OcrDebugger
+
+        debugger = OcrDebugger(output_dir=tmp_path / "debug", enabled=True)
+        raw = np.zeros((10, 20, 3), dtype=np.uint8)
+        processed = np.zeros((20, 40), dtype=np.uint8)
+
+        debugger.dump(raw, processed, "", [], timestamp=12.5)
+        debugger.dump(raw, processed, "", [])
+
+        frame_json = tmp_path / "debug" / "frame_000001" / "frame.json"
+        assert json.loads(frame_json.read_text(encoding="utf-8")) == {"timestamp": 12.5}
+        assert not (tmp_path / "debug" / "frame_000002" / "frame.json").exists()
+
+    def test_sample_every(self, tmp_path) -> None:
+        """sample_every=N이면 N프레임마다 하나만 덤프한다."""
+        from aion2meter.io.ocr_debugger import OcrDebugger
+
+        debugger = OcrDebugger(output_dir=tmp_path / "debug", enabled=True, sample_every=3)
+        raw = np.zeros((10, 20, 3), dtype=np.uint8)
+        processed = np.zeros((20, 40), dtype=np.uint8)
+
+        for i in range(7):
+            debugger.dump(raw, processed, str(i), [])
+
+        texts = [p.read_text(encoding="utf-8") for p in sorted((tmp_path / "debug").glob("*/ocr.txt"))]
+        assert texts == ["0", "3", "6"]
+        assert debugger.stats == {"written": 3, "skipped": 4, "dropped": 0}
+
+    def test_only_empty(self, tmp_path) -> None:
+        """only_empty이면 이벤트가 파싱된 프레임은 건너뛴다."""
+        from aion2meter.io.ocr_debugger import OcrDebugger
+
+        debugger = OcrDebugger(output_dir=tmp_path / "debug", enabled=True, only_empty=True)
+        raw = np.zeros((10, 20, 3), dtype=np.uint8)
+        processed = np.zeros((20, 40), dtype=np.uint8)
+        event = DamageEvent(timestamp=1.0, source="", target="몬스터", skill="검격", damage=1, hit_type=HitType.NORMAL)
+
+        debugger.dump(raw, processed, "hit", [event])
+        debugger.dump(raw, processed, "miss", [])
+
+        texts = [p.read_text(encoding="utf-8") for p in (tmp_path / "debug").glob("*/ocr.txt")]
+        assert texts == ["miss"]
+        assert debugger.skipped == 1
+
+    def test_background_writes_on_close(self, tmp_path) -> None:
+        """background이면 쓰기 스레드가 저장하고 close()가 남은 프레임을 모두 쓴다."""
+        from aion2meter.io.ocr_debugger import OcrDebugger
+
+        debugger = OcrDebugger(output_dir=tmp_path / "debug", enabled=True, background=True)
+        raw = np.zeros((10, 20, 3), dtype=np.uint8)
+        processed = np.zeros((20, 40), dtype=np.uint8)
+
+        for i in range(5):
+            debugger.dump(raw, processed, str(i), [], timestamp=float(i))
+        debugger.close()
+
+        assert debugger.written == 5
+        assert (tmp_path / "debug" / "frame_000005" / "frame.json").exists()
+
+    def test_background_drops_when_queue_full(self, tmp_path, monkeypatch) -> None:
+        """쓰기 큐가 가득 차면 기다리지 않고 버린 뒤 dropped로 센다."""
+        import threading
+
+        from aion2meter.io.ocr_debugger import OcrDebugger
+
+        gate = threading.Event()
+        debugger = OcrDebugger(
+            output_dir=tmp_path / "debug", enabled=True, background=True, max_queue_size=1,
+        )
+        original = debugger._write
+
+        def slow_write(*args):
+            gate.wait(2)
+            original(*args)
+
+        monkeypatch.setattr(debugger, "_write", slow_write)
+        raw = np.zeros((10, 20, 3), dtype=np.uint8)
+        processed = np.zeros((20, 40), dtype=np.uint8)
+
+        for i in range(5):
+            debugger.dump(raw, processed, str(i), [])
+        gate.set()
+        debugger.close()
+
+        assert debugger.dropped >= 3
+        assert debugger.written + debugger.dropped == 5
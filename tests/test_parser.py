@@ -304,3 +304,191 @@ class TestFuzzyFallback:
         text = "몬스터에게 대미지를 줬습니다"
         events = parser.parse(text, 1.0)
         assert events == []
+
+
+class TestTargetSplit:
+    """"에게" 분할 디스패치 테스트."""
+
+    def test_line_without_target_separator(self, parser: KoreanCombatParser):
+        assert parser.parse("검격을 사용해 1,234의 대미지를 줬습니다.", 1.0) == []
+
+    def test_later_separator_used_when_first_does_not_match(self, parser: KoreanCombatParser):
+        """앞쪽 "에게"에서 패턴이 맞지 않으면 뒤쪽 "에게"로 대상을 나눈다."""
+        text = "에게로 몬스터에게 검격을 사용해 100의 대미지를 줬습니다."
+        events = parser.parse(text, 1.0)
+        assert len(events) == 1
+        assert events[0].target == "에게로 몬스터"
+        assert events[0].skill == "검격"
+
+    def test_pattern_priority_over_separator_position(self, parser: KoreanCombatParser):
+        """패턴 우선순위가 "에게" 위치보다 앞선다: 뒤쪽의 추가 대미지가 앞쪽 fuzzy보다 우선."""
+        text = "적에게 3의 대미지 몬스터에게 추가로 50의 대미지를 줬습니다."
+        events = parser.parse(text, 1.0)
+        assert len(events) == 1
+        assert events[0].is_additional is True
+        assert events[0].damage == 50
+        assert events[0].target == "적에게 3의 대미지 몬스터"
+
+
+class TestLinePrefilter:
+    """정규식 전 키워드 필터와 줄 통계."""
+
+    def test_line_stats_count_each_stage(self, parser: KoreanCombatParser):
+        text = "\n".join([
+            "[파티] 안녕하세요",
+            "몬스터에게 말을 걸었습니다.",
+            "몬스터에게 대미지",
+            "몬스터에게 검격을 사용해 1,234의 대미지를 줬습니다.",
+            "",
+        ])
+        events = parser.parse(text, 1.0)
+        assert len(events) == 1
+        assert parser.line_stats == {
+            "lines": 4,
+            "rejected_no_target": 1,
+            "rejected_no_keyword": 1,
+            "unmatched": 1,
+            "parsed": 1,
+        }
+
+    def test_misspelled_keyword_passes_filter(self, parser: KoreanCombatParser):
+        """보정 전 오타(대머지)도 필터를 통과해 보정 후 파싱된다."""
+        events = parser.parse("몬스터에게 검격을 사용해 100의 대머지를 줬습니다.", 1.0)
+        assert len(events) == 1
+        assert parser.line_stats["rejected_no_keyword"] == 0
+
+    def test_reset_stats(self, parser: KoreanCombatParser):
+        parser.parse("잡담", 1.0)
+        parser.reset_stats()
+        assert parser.line_stats["lines"] == 0
+
+
+class TestUserCorrections:
+    """사용자 OCR 보정 사전."""
+
+    def test_user_correction_applied(self):
+        parser = KoreanCombatParser(corrections={"대미쥐": "대미지", "사옹해": "사용해"})
+        events = parser.parse("몬스터에게 검격을 사옹해 700의 대미쥐를 줬습니다.", 1.0)
+        assert len(events) == 1
+        assert events[0].damage == 700
+        assert parser.line_stats["rejected_no_keyword"] == 0
+
+    def test_user_correction_overrides_default(self):
+        parser = KoreanCombatParser(corrections={"대머지": "대미지를 크게"})
+        assert parser._fix_text("대머지") == "대미지를 크게"
+
+    def test_longer_typo_wins(self):
+        parser = KoreanCombatParser(corrections={"숨니": "습니", "빗나갔숨니다": "빗나갔습니다"})
+        assert parser._fix_text("빗나갔숨니다") == "빗나갔습니다"
+
+    def test_default_parser_unaffected(self):
+        KoreanCombatParser(corrections={"몬스터": "괴물"})
+        events = KoreanCombatParser().parse("몬스터에게 검격을 사용해 1의 대미지를 줬습니다.", 1.0)
+        assert events[0].target == "몬스터"
+
+
+class TestLineMemo:
+    """줄 텍스트 memo."""
+
+    _LINE = "몬스터에게 치명타 검격을 사용해 2,468의 대미지를 줬습니다."
+
+    def test_hit_restamps_timestamp(self, parser: KoreanCombatParser):
+        first = parser.parse(self._LINE, 1.0)
+        second = parser.parse(self._LINE, 2.5)
+        assert second[0].timestamp == 2.5
+        assert first[0].timestamp == 1.0
+        assert second[0] == DamageEvent(
+            timestamp=2.5, source="", target="몬스터", skill="검격", damage=2468,
+            hit_type=HitType.CRITICAL,
+        )
+        assert parser.memo_stats == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_rejected_lines_counted_on_hit(self, parser: KoreanCombatParser):
+        parser.parse("잡담\n잡담", 1.0)
+        assert parser.line_stats["rejected_no_target"] == 2
+        assert parser.memo_stats["hits"] == 1
+
+    def test_evicts_least_recently_used(self):
+        parser = KoreanCombatParser(memo_size=2)
+        parser.parse("a\nb", 1.0)
+        parser.parse("a", 1.0)
+        parser.parse("c", 1.0)
+        assert parser.memo_stats["evictions"] == 1
+        assert set(parser._memo) == {"a", "c"}
+
+    def test_garbled_number_counted_unmatched(self, parser: KoreanCombatParser):
+        """숫자를 변환할 수 없는 줄은 unmatched로 세고 memo에 남기며, 같은 프레임의 다른 줄은 살린다."""
+        garbled = "몬스터에게 검격을 사용해 1O2-의 대미지를 줬습니다."
+        events = parser.parse(f"{garbled}\n{self._LINE}", 1.0)
+        parser.parse(garbled, 2.0)
+        assert [e.damage for e in events] == [2468]
+        assert parser.line_stats["unmatched"] == 2
+        assert parser.memo_stats["hits"] == 1
+
+    def test_memo_disabled(self):
+        parser = KoreanCombatParser(memo_size=0)
+        parser.parse(self._LINE, 1.0)
+        events = parser.parse(self._LINE, 2.0)
+        assert events[0].timestamp == 2.0
+        assert parser.memo_stats == {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+
+
+class TestParseBatch:
+    """parse_batch 스트리밍 파싱."""
+
+    @staticmethod
+    def _line(damage: int) -> str:
+        return f"몬스터에게 검격을 사용해 {damage}의 대미지를 줬습니다."
+
+    def test_matches_parse(self, parser: KoreanCombatParser):
+        items = [(self._line(d), float(i)) for i, d in enumerate([10, 20, 30])]
+        items.insert(1, ("잡담", 0.5))
+        events = list(parser.parse_batch(items))
+        assert [e.damage for e in events] == [10, 20, 30]
+        assert [e.timestamp for e in events] == [0.0, 1.0, 2.0]
+        assert parser.line_stats["rejected_no_target"] == 1
+
+    def test_yields_in_timestamp_order(self, parser: KoreanCombatParser):
+        items = [
+            (self._line(1), 3.0),
+            (f"{self._line(2)}\n{self._line(3)}", 1.0),
+            (self._line(4), 2.0),
+            (self._line(5), 1.0),
+        ]
+        events = list(parser.parse_batch(items))
+        assert [(e.timestamp, e.damage) for e in events] == [
+            (1.0, 2), (1.0, 3), (1.0, 5), (2.0, 4), (3.0, 1),
+        ]
+
+    def test_streams_lazily(self, parser: KoreanCombatParser):
+        consumed: list[int] = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield self._line(i + 1), float(i)
+
+        gen = parser.parse_batch(items(), reorder_window=4)
+        first = next(gen)
+        assert first.damage == 1
+        assert len(consumed) == 5
+
+    def test_process_fan_out(self):
+        parser = KoreanCombatParser(corrections={"대미쥐": "대미지"})
+        items = [(self._line(i + 1).replace("대미지", "대미쥐"), float(i % 7)) for i in range(50)]
+        items.append(("잡담", 0.0))
+        expected = list(KoreanCombatParser(corrections={"대미쥐": "대미지"}).parse_batch(items))
+
+        events = list(parser.parse_batch(items, workers=2, chunk_size=8))
+
+        assert events == expected
+        assert len(events) == 50
+        assert parser.line_stats["parsed"] == 50
+        assert parser.line_stats["rejected_no_target"] == 1
+
+    def test_garbled_number_line_does_not_drop_frame(self, parser: KoreanCombatParser):
+        """숫자가 깨져 변환할 수 없는 줄은 unmatched로 세고, 같은 프레임의 다른 줄은 살린다."""
+        text = f"몬스터에게 검격을 사용해 1O2-의 대미지를 줬습니다.\n{self._line(7)}"
+        events = list(parser.parse_batch([(text, 1.0)]))
+        assert [e.damage for e in events] == [7]
+        assert parser.line_stats["unmatched"] == 1
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import queue
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
@@ -18,12 +19,25 @@ from aion2meter.models import (
     DpsSnapshot,
     HitType,
     OcrResult,
+    PipelineStats,
     ROI,
 )
-from aion2meter.ocr.engine_manager import OcrEngineManager
+from aion2meter.ocr.engine_manager import OcrDeadlineExceeded, OcrEngineManager
+from aion2meter.pipeline.metrics import PipelineMetrics
 from aion2meter.parser.combat_parser import KoreanCombatParser
-from aion2meter.pipeline.pipeline import CaptureWorker, DpsPipeline, OcrWorker
+from aion2meter.parser.event_dedup import EventDeduplicator
+from aion2meter.pipeline.pipeline import (
+    CaptureWorker,
+    DpsPipeline,
+    FrameWork,
+    OcrWorker,
+    OcrWorkerPool,
+    ParseWorker,
+    PreprocessWorker,
+    _ReorderBuffer,
+)
 from aion2meter.preprocess.image_proc import CombatLogPreprocessor
+from aion2meter.preprocess.line_segmenter import LineSegmenter
 
 
 @pytest.fixture
@@ -52,37 +66,50 @@ class TestCaptureWorker:
         worker.update_roi(new_roi)
         assert worker._roi == new_roi
 
+    def test_run_opens_and_closes_capturer(self, roi, sample_frame):
+        """run()은 캡처 세션을 열고, 루프 종료 시 닫는다."""
+        capturer = MagicMock()
+        worker = CaptureWorker(capturer=capturer, roi=roi, fps=1000)
 
-class TestOcrWorker:
-    def test_enqueue_and_dequeue(self, sample_frame):
-        preprocessor = MagicMock()
-        ocr_engine = MagicMock()
-        parser = MagicMock()
-        calculator = MagicMock()
+        def _capture(_roi):
+            worker.stop()
+            return sample_frame
 
-        worker = OcrWorker(
-            preprocessor=preprocessor,
-            ocr_engine=ocr_engine,
-            parser=parser,
-            calculator=calculator,
-            max_queue_size=2,
-        )
+        capturer.capture.side_effect = _capture
+        worker.run()
+
+        capturer.open.assert_called_once()
+        capturer.capture.assert_called_once_with(roi)
+        capturer.close.assert_called_once()
+
+
+    def test_run_uses_adaptive_rate(self, roi, sample_frame):
+        """rate를 주면 캡처 간격을 rate에서 받는다."""
+        capturer = MagicMock()
+        rate = MagicMock()
+        rate.interval.return_value = 10.0
+        worker = CaptureWorker(capturer=capturer, roi=roi, fps=1000, rate=rate)
+
+        def _sleep(seconds):
+            assert seconds > 1.0
+            worker.stop()
+
+        rate.sleep.side_effect = _sleep
+        capturer.capture.return_value = sample_frame
+        worker.run()
+
+        rate.interval.assert_called_once()
+        rate.sleep.assert_called_once()
+
+
+class TestPreprocessWorker:
+    def test_enqueue_and_dequeue(self, sample_frame):
+        worker = PreprocessWorker(preprocessor=MagicMock(), sink=MagicMock(), max_queue_size=2)
         worker.enqueue(sample_frame)
         assert worker._queue.qsize() == 1
 
     def test_enqueue_overflow_drops_oldest(self, sample_frame):
-        preprocessor = MagicMock()
-        ocr_engine = MagicMock()
-        parser = MagicMock()
-        calculator = MagicMock()
-
-        worker = OcrWorker(
-            preprocessor=preprocessor,
-            ocr_engine=ocr_engine,
-            parser=parser,
-            calculator=calculator,
-            max_queue_size=1,
-        )
+        worker = PreprocessWorker(preprocessor=MagicMock(), sink=MagicMock(), max_queue_size=1)
         worker.enqueue(sample_frame)
         # 큐가 꽉 찬 상태에서 추가 enqueue
         frame2 = CapturedFrame(
@@ -92,6 +119,351 @@ class TestOcrWorker:
         )
         worker.enqueue(frame2)
         assert worker._queue.qsize() == 1
+        assert worker._queue.get_nowait() is frame2
+        assert worker.dropped_count == 1
+
+    def test_records_only_changed_frames(self, sample_frame):
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.side_effect = [False, True]
+        preprocessor.process.return_value = np.zeros((20, 30), dtype=np.uint8)
+        recorder = MagicMock()
+
+        worker = PreprocessWorker(preprocessor=preprocessor, sink=MagicMock(), recorder=recorder)
+        worker._handle(sample_frame)
+        worker._handle(sample_frame)
+
+        recorder.record.assert_called_once_with(sample_frame.image, 1.0)
+
+    def test_forwards_processed_frame(self, sample_frame):
+        binary = np.zeros((20, 30), dtype=np.uint8)
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.return_value = False
+        preprocessor.process.return_value = binary
+        out: list[FrameWork] = []
+
+        worker = PreprocessWorker(preprocessor=preprocessor, sink=out.append)
+        worker._handle(sample_frame)
+
+        assert len(out) == 1
+        assert out[0].timestamp == sample_frame.timestamp
+        # 출력 링 슬롯이 아닌 자기 버퍼를 넘긴다: 느린 OCR 워커가 읽는 중에 덮어써지지 않도록
+        assert np.array_equal(out[0].ocr_input, binary)
+        assert not np.shares_memory(out[0].ocr_input, binary)
+        assert out[0].debug_raw is None
+
+    def test_duplicate_frame_not_forwarded(self, sample_frame):
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.return_value = True
+        sink = MagicMock()
+        on_activity = MagicMock()
+
+        worker = PreprocessWorker(preprocessor=preprocessor, sink=sink, on_activity=on_activity)
+        worker._handle(sample_frame)
+
+        preprocessor.process.assert_not_called()
+        sink.assert_not_called()
+        on_activity.assert_not_called()
+
+    def test_records_latency_and_duplicates(self, sample_frame):
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.side_effect = [True, False]
+        preprocessor.process.return_value = np.zeros((4, 4), dtype=np.uint8)
+        metrics = PipelineMetrics()
+
+        worker = PreprocessWorker(preprocessor=preprocessor, sink=MagicMock(), metrics=metrics)
+        worker._handle(sample_frame)
+        worker._handle(sample_frame)
+
+        assert metrics.duplicate_frames == 1
+        assert metrics.histograms["preprocess"].count == 1
+
+    def test_changed_frame_reports_activity(self, sample_frame):
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.return_value = False
+        preprocessor.process.return_value = np.zeros((4, 4), dtype=np.uint8)
+        on_activity = MagicMock()
+
+        worker = PreprocessWorker(preprocessor=preprocessor, sink=MagicMock(), on_activity=on_activity)
+        worker._handle(sample_frame)
+
+        on_activity.assert_called_once()
+
+    def test_debugger_gets_copies(self, sample_frame):
+        """디버그 이미지는 링 버퍼 재사용에 영향받지 않도록 복사본이다."""
+        binary = np.zeros((20, 30), dtype=np.uint8)
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.return_value = False
+        preprocessor.process.return_value = binary
+        out: list[FrameWork] = []
+
+        worker = PreprocessWorker(preprocessor=preprocessor, sink=out.append, debugger=MagicMock())
+        worker._handle(sample_frame)
+
+        assert out[0].debug_raw is not sample_frame.image
+        assert np.array_equal(out[0].debug_raw, sample_frame.image)
+        assert out[0].debug_processed is not binary
+
+    def test_incremental_ocr_skips_frame_without_new_lines(self, sample_frame):
+        """증분 OCR 모드에서 새 줄이 없는 프레임은 OCR 스테이지로 넘기지 않는다."""
+        binary = np.zeros((20, 30), dtype=np.uint8)
+        binary[2:10] = 255
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.return_value = False
+        sink = MagicMock()
+
+        worker = PreprocessWorker(
+            preprocessor=preprocessor,
+            sink=sink,
+            line_segmenter=LineSegmenter(),
+        )
+
+        def _process(frame):
+            if preprocessor.process.call_count == 1:
+                worker.enqueue(frame)
+            else:
+                worker.stop()
+            return binary
+
+        preprocessor.process.side_effect = _process
+        worker.enqueue(sample_frame)
+        worker.run()
+
+        assert preprocessor.process.call_count == 2
+        sink.assert_called_once()
+
+
+class TestOcrWorker:
+    def test_recognizes_and_forwards(self):
+        ocr_engine = MagicMock()
+        ocr_engine.recognize.return_value = OcrResult(text="abc", confidence=0.9, timestamp=0.0)
+        out: list[FrameWork] = []
+        binary = np.zeros((20, 30), dtype=np.uint8)
+
+        worker = OcrWorker(ocr_engine=ocr_engine, sink=out.append)
+        worker._handle(FrameWork(timestamp=1.0, ocr_input=binary))
+
+        ocr_engine.recognize.assert_called_once_with(binary)
+        assert out[0].text == "abc"
+        # 전처리 출력 링 슬롯 참조를 놓는다
+        assert out[0].ocr_input is None
+
+    def test_enqueue_applies_backpressure(self):
+        """큐가 차면 버리지 않고 자리가 날 때까지 기다린다."""
+        worker = OcrWorker(ocr_engine=MagicMock(), sink=MagicMock(), max_queue_size=1)
+        first = FrameWork(timestamp=1.0)
+        second = FrameWork(timestamp=2.0)
+        worker.enqueue(first)
+
+        timer = threading.Timer(0.05, worker._queue.get_nowait)
+        timer.start()
+        start = time.monotonic()
+        worker.enqueue(second)
+        timer.join()
+
+        assert time.monotonic() - start >= 0.04
+        assert worker._queue.get_nowait() is second
+        assert worker.dropped_count == 0
+
+    def test_enqueue_does_not_block_after_stop(self):
+        worker = OcrWorker(ocr_engine=MagicMock(), sink=MagicMock(), max_queue_size=1)
+        worker.enqueue(FrameWork(timestamp=1.0))
+        worker.stop()
+        worker.enqueue(FrameWork(timestamp=2.0))
+        assert worker.dropped_count == 1
+
+
+    def test_failed_recognize_still_forwards(self):
+        """OCR 예외에도 항목을 넘겨 순서 재조립이 멈추지 않게 한다."""
+        ocr_engine = MagicMock()
+        ocr_engine.recognize.side_effect = RuntimeError("boom")
+        out: list[FrameWork] = []
+
+        worker = OcrWorker(ocr_engine=ocr_engine, sink=out.append)
+        worker._handle(FrameWork(timestamp=1.0, seq=7, ocr_input=np.zeros((2, 2), np.uint8)))
+
+        assert out[0].seq == 7
+        assert out[0].text == ""
+
+    def test_failed_recognize_reports_discarded_lines(self):
+        """인식 결과를 버리면 on_discarded로 알려 줄 분할기가 그 줄을 다시 보내게 한다."""
+        ocr_engine = MagicMock()
+        ocr_engine.recognize.side_effect = RuntimeError("boom")
+        segmenter = LineSegmenter()
+        worker = OcrWorker(
+            ocr_engine=ocr_engine, sink=MagicMock(),
+            on_discarded=lambda work: segmenter.mark_unread(work.line_hashes),
+        )
+        image = np.zeros((30, 20), np.uint8)
+        image[5:15] = 255
+        processed = segmenter.extract_new(image)
+        worker._handle(FrameWork(timestamp=1.0, ocr_input=processed, line_hashes=segmenter.last_new_hashes))
+
+        assert segmenter.extract_new(image) is not None
+        assert segmenter.extract_new(image) is None
+
+    def test_failover_failure_resends_lines(self):
+        """failover 관리자가 예외 대신 failed 결과를 돌려줘도 그 줄들을 다시 보낸다."""
+        primary = MagicMock()
+        primary.recognize.side_effect = RuntimeError("boom")
+        segmenter = LineSegmenter()
+        out: list[FrameWork] = []
+        worker = OcrWorker(
+            ocr_engine=OcrEngineManager(primary=primary), sink=out.append,
+            on_discarded=lambda work: segmenter.mark_unread(work.line_hashes),
+        )
+        image = np.zeros((30, 20), np.uint8)
+        image[5:15] = 255
+        processed = segmenter.extract_new(image)
+        worker._handle(FrameWork(timestamp=1.0, ocr_input=processed, line_hashes=segmenter.last_new_hashes))
+
+        assert out[0].text == ""
+        assert segmenter.extract_new(image) is not None
+
+    def test_deadline_miss_reports_discarded_lines(self):
+        """best_confidence 시간 초과도 버려진 결과로 알린다."""
+        ocr_engine = MagicMock()
+        ocr_engine.recognize.side_effect = OcrDeadlineExceeded("late")
+        discarded: list[FrameWork] = []
+        out: list[FrameWork] = []
+
+        worker = OcrWorker(ocr_engine=ocr_engine, sink=out.append, on_discarded=discarded.append)
+        worker._handle(FrameWork(timestamp=1.0, ocr_input=np.zeros((2, 2), np.uint8), line_hashes=[1, 2]))
+
+        assert out[0].text == ""
+        assert discarded[0].line_hashes == [1, 2]
+
+
+class _DelayEngine:
+    """입력 픽셀 값(ms)만큼 지연한 뒤 그 값을 텍스트로 돌려주는 엔진."""
+
+    def recognize(self, image):
+        delay = int(image[0, 0])
+        time.sleep(delay / 1000)
+        return OcrResult(text=str(delay), confidence=1.0, timestamp=0.0)
+
+
+class TestOcrWorkerPool:
+    def test_reorder_buffer_emits_in_sequence(self):
+        out: list[FrameWork] = []
+        buf = _ReorderBuffer(out.append)
+        buf.push(FrameWork(timestamp=0.0, seq=1))
+        buf.push(FrameWork(timestamp=0.0, seq=2))
+        assert out == []
+        assert buf.pending_count == 2
+        buf.push(FrameWork(timestamp=0.0, seq=0))
+        assert [w.seq for w in out] == [0, 1, 2]
+        assert buf.pending_count == 0
+
+    def test_results_reassembled_in_frame_order(self):
+        """느린 프레임이 먼저 들어가도 결과는 순번 순서로 나온다."""
+        out: list[FrameWork] = []
+        done = threading.Event()
+
+        def _sink(work):
+            out.append(work)
+            if len(out) == 3:
+                done.set()
+
+        pool = OcrWorkerPool(ocr_engines=[_DelayEngine(), _DelayEngine()], sink=_sink, max_queue_size=3)
+        assert pool.size == 2
+        pool.start()
+        try:
+            for seq, delay in enumerate((80, 1, 1)):
+                image = np.full((2, 2), delay, dtype=np.uint8)
+                pool.enqueue(FrameWork(timestamp=float(seq), seq=seq, ocr_input=image))
+            assert done.wait(2.0)
+        finally:
+            pool.stop()
+            pool.wait(2000)
+
+        assert [w.seq for w in out] == [0, 1, 2]
+        assert [w.text for w in out] == ["80", "1", "1"]
+
+    def test_requires_engine(self):
+        with pytest.raises(ValueError):
+            OcrWorkerPool(ocr_engines=[], sink=MagicMock())
+
+    def test_preprocess_to_parse_forwards_every_frame(self, roi):
+        """전처리가 매긴 순번으로 재조립되어, 중복 프레임이 끼어도 모든 프레임이 파싱에 도달한다."""
+        preprocessor = MagicMock()
+        preprocessor.is_duplicate.side_effect = [False, True, False, False, True, False]
+        preprocessor.process.side_effect = [
+            np.full((2, 2), damage, dtype=np.uint8) for damage in (10, 20, 30, 40)
+        ]
+        engine = MagicMock()
+        engine.recognize.side_effect = lambda image: OcrResult(
+            text=f"몬스터에게 검격을 사용해 {int(image[0, 0])}의 대미지를 줬습니다.",
+            confidence=1.0,
+            timestamp=0.0,
+        )
+        calculator = RealtimeDpsCalculator()
+        parse_worker = ParseWorker(parser=KoreanCombatParser(), calculator=calculator)
+        pool = OcrWorkerPool(ocr_engines=[engine], sink=parse_worker.enqueue, max_queue_size=4)
+        preprocess = PreprocessWorker(preprocessor=preprocessor, sink=pool.enqueue)
+
+        parse_worker.start()
+        pool.start()
+        try:
+            image = np.zeros((50, 100, 3), dtype=np.uint8)
+            for i in range(6):
+                preprocess._handle(CapturedFrame(image=image, timestamp=float(i), roi=roi))
+            deadline = time.monotonic() + 2.0
+            while len(calculator.get_event_history()) < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            pool.stop()
+            pool.wait(2000)
+            parse_worker.stop()
+            parse_worker.wait(2000)
+
+        assert [e.damage for e in calculator.get_event_history()] == [10, 20, 30, 40]
+        assert pool._reorder.pending_count == 0
+
+
+class TestParseWorker:
+    def test_parses_and_emits_snapshot(self):
+        calculator = RealtimeDpsCalculator()
+        on_activity = MagicMock()
+        worker = ParseWorker(
+            parser=KoreanCombatParser(), calculator=calculator, on_activity=on_activity,
+        )
+        received: list = []
+        worker.dps_updated.connect(received.append)
+
+        worker._handle(FrameWork(timestamp=1.0, text="몬스터에게 검격을 사용해 1,234의 대미지를 줬습니다."))
+
+        assert len(received) == 1
+        assert received[0].total_damage == 1234
+        assert received[0].capture_timestamp == 1.0
+        on_activity.assert_called_once()
+        assert worker._metrics.histograms["parse"].count == 1
+        assert worker._metrics.histograms["calculate"].count == 1
+
+    def test_resent_full_frame_not_double_counted(self):
+        """증분 모드에서 정렬에 실패해 다시 들어온 줄은 세지 않고, 새 줄만 들어온 반복 타격은 센다."""
+        line = "몬스터에게 검격을 사용해 1,234의 대미지를 줬습니다."
+        calculator = RealtimeDpsCalculator()
+        worker = ParseWorker(
+            parser=KoreanCombatParser(), calculator=calculator, deduplicator=EventDeduplicator(),
+        )
+
+        worker._handle(FrameWork(timestamp=1.0, text=line))
+        worker._handle(FrameWork(timestamp=1.1, text=line, new_lines_only=True))
+        worker._handle(FrameWork(timestamp=1.2, text=f"{line}\n{line}"))
+
+        assert sum(e.damage for e in calculator.get_event_history()) == 2468
+
+    def test_empty_text_dumped_without_parse(self):
+        parser = MagicMock()
+        debugger = MagicMock()
+        raw = np.zeros((5, 5, 3), dtype=np.uint8)
+        processed = np.zeros((5, 5), dtype=np.uint8)
+
+        worker = ParseWorker(parser=parser, calculator=MagicMock(), debugger=debugger)
+        worker._handle(FrameWork(timestamp=1.0, text="  ", debug_raw=raw, debug_processed=processed))
+
+        parser.parse.assert_not_called()
+        debugger.dump.assert_called_once_with(raw, processed, "  ", [], timestamp=1.0)
 
 
 class TestDpsPipeline:
@@ -102,6 +474,48 @@ class TestDpsPipeline:
         pipeline = DpsPipeline(config=config, capturer=capturer, ocr_engine=ocr_engine)
         assert pipeline.is_running is False
 
+    def test_single_injected_engine_not_shared_across_workers(self):
+        """엔진 하나를 주입하면 ocr_workers와 상관없이 워커 하나만 쓴다 (관리자는 스레드 안전하지 않음)."""
+        ocr_engine = MagicMock()
+        pipeline = DpsPipeline(config=AppConfig(ocr_workers=3), capturer=MagicMock(), ocr_engine=ocr_engine)
+        assert pipeline._ocr_engines == [ocr_engine]
+
+    def test_injected_engine_list_one_per_worker(self):
+        engines = [MagicMock(), MagicMock(), MagicMock()]
+        pipeline = DpsPipeline(config=AppConfig(ocr_workers=1), capturer=MagicMock(), ocr_engine=engines)
+        assert pipeline._ocr_engines == engines
+
+    def test_ocr_workers_builds_engine_per_worker(self):
+        with patch("aion2meter.pipeline.pipeline.build_ocr_manager", side_effect=lambda c: MagicMock()):
+            pipeline = DpsPipeline(config=AppConfig(ocr_workers=3), capturer=MagicMock())
+        assert len(pipeline._ocr_engines) == 3
+        assert len({id(e) for e in pipeline._ocr_engines}) == 3
+
+    def test_pipeline_stats_snapshot(self):
+        pipeline = DpsPipeline(config=AppConfig(), capturer=MagicMock(), ocr_engine=MagicMock())
+        pipeline._metrics.record("ocr", 0.02)
+        pipeline._metrics.duplicate_frames = 2
+        received: list = []
+        pipeline.stats_updated.connect(received.append)
+
+        pipeline._emit_stats()
+
+        stats = received[0]
+        assert isinstance(stats, PipelineStats)
+        assert stats.stages["ocr"].count == 1
+        assert stats.duplicate_frames == 2
+        assert stats.dropped_frames == 0
+
+    def test_stop_closes_ocr_managers(self):
+        """정지하면 OCR 관리자의 best_confidence 스레드를 정리한다."""
+        managers = [MagicMock(spec=OcrEngineManager), MagicMock(spec=OcrEngineManager)]
+        pipeline = DpsPipeline(config=AppConfig(), capturer=MagicMock(), ocr_engine=managers)
+
+        pipeline.stop()
+
+        for manager in managers:
+            manager.close.assert_called_once()
+
     def test_reset_combat(self):
         config = AppConfig()
         capturer = MagicMock()
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import tracemalloc
+
+import cv2
 import numpy as np
+import pytest
 
-from aion2meter.models import CapturedFrame, ColorRange, PreprocessConfig, ROI
+from aion2meter.models import AppConfig, CapturedFrame, ColorRange, PreprocessConfig, ROI
 from aion2meter.preprocess.image_proc import CombatLogPreprocessor
 
 
@@ -89,6 +93,56 @@ class TestCombatLogPreprocessor:
         assert proc.is_duplicate(frame1) is False
         assert proc.is_duplicate(frame2) is False
 
+    def test_is_duplicate_detects_text_off_sample_points(self) -> None:
+        """샘플 지점이 아닌 곳의 텍스트 변화도 중복이 아니다."""
+        image1 = np.zeros((30, 60, 3), dtype=np.uint8)
+        image2 = image1.copy()
+        image2[5:12, 8:25] = 220
+        proc = CombatLogPreprocessor()
+
+        assert proc.is_duplicate(_make_frame(image1)) is False
+        assert proc.is_duplicate(_make_frame(image2)) is False
+        assert proc.last_change is not None
+        assert proc.last_change.changed_rows[5:12].all()
+
+
+def _reference_mask(image: np.ndarray, ranges: list[ColorRange]) -> np.ndarray:
+    """범위별 inRange + OR 결합 (기존 구현)."""
+    combined = np.zeros(image.shape[:2], dtype=np.uint8)
+    for cr in ranges:
+        mask = cv2.inRange(image, np.array(cr.lower, np.uint8), np.array(cr.upper, np.uint8))
+        combined = cv2.bitwise_or(combined, mask)
+    return combined
+
+
+class TestColorMask:
+    """단일 패스 색상 마스크 테스트."""
+
+    def test_matches_inrange_loop_default_ranges(self) -> None:
+        image = np.random.RandomState(0).randint(0, 256, (60, 90, 3), dtype=np.uint8)
+        proc = CombatLogPreprocessor()
+        ranges = AppConfig.default_color_ranges()
+        assert np.array_equal(proc._color_mask(image), _reference_mask(image, ranges))
+
+    def test_matches_inrange_loop_more_than_eight_ranges(self) -> None:
+        """범위가 8개를 넘어도 결과가 같다."""
+        rng = np.random.RandomState(1)
+        ranges = []
+        for i in range(11):
+            lo = rng.randint(0, 200, 3)
+            hi = lo + rng.randint(10, 56, 3)
+            ranges.append(ColorRange(f"r{i}", tuple(int(v) for v in lo), tuple(int(v) for v in hi)))
+        image = rng.randint(0, 256, (60, 90, 3), dtype=np.uint8)
+        proc = CombatLogPreprocessor(color_ranges=ranges)
+        assert np.array_equal(proc._color_mask(image), _reference_mask(image, ranges))
+
+    def test_set_color_ranges_rebuilds_lut(self) -> None:
+        image = np.full((4, 4, 3), 150, dtype=np.uint8)
+        proc = CombatLogPreprocessor(color_ranges=[ColorRange("a", (0, 0, 0), (10, 10, 10))])
+        assert not proc._color_mask(image).any()
+        proc.set_color_ranges([ColorRange("b", (100, 100, 100), (200, 200, 200))])
+        assert proc._color_mask(image).all()
+
 
 class TestPreprocessPipeline:
     """전처리 파이프라인 스텝 테스트."""
@@ -169,3 +223,144 @@ class TestPreprocessPipeline:
         result = proc_old.process(frame)
         assert result.shape == (20, 40)
         assert np.all(result == 255)
+
+
+class TestMaskBeforeUpscale:
+    """mask_before_upscale 모드 테스트."""
+
+    def test_output_shape_and_binary(self) -> None:
+        image = np.random.RandomState(0).randint(0, 256, (30, 60, 3), dtype=np.uint8)
+        proc = CombatLogPreprocessor(
+            preprocess_config=PreprocessConfig(mask_before_upscale=True, upscale_factor=3),
+        )
+        result = proc.process(_make_frame(image))
+        assert result.shape == (90, 180)
+        assert set(np.unique(result)) <= {0, 255}
+
+    def test_matches_upscale_first_without_filters(self) -> None:
+        """필터가 없으면 두 순서의 결과가 같다 (최근접 업스케일은 색상을 보존)."""
+        cr = ColorRange("test", (100, 100, 100), (200, 200, 200))
+        image = np.random.RandomState(2).randint(0, 256, (20, 40, 3), dtype=np.uint8)
+        frame = _make_frame(image)
+        base = PreprocessConfig(denoise=False, sharpen=False, cleanup_min_area=0)
+        mask_first = PreprocessConfig(
+            denoise=False, sharpen=False, cleanup_min_area=0, mask_before_upscale=True,
+        )
+
+        expected = CombatLogPreprocessor([cr], base).process(frame)
+        result = CombatLogPreprocessor([cr], mask_first).process(frame)
+        assert np.array_equal(result, expected)
+
+    def test_cleanup_area_scaled_to_native(self) -> None:
+        """cleanup_min_area는 업스케일 기준 면적으로 해석된다."""
+        cr = ColorRange("white", (200, 200, 200), (255, 255, 255))
+        image = np.zeros((30, 60, 3), dtype=np.uint8)
+        image[5:7, 5:7] = 220      # 원본 4px → 업스케일 16px
+        image[15:20, 20:25] = 220  # 원본 25px → 업스케일 100px
+        proc = CombatLogPreprocessor(
+            color_ranges=[cr],
+            preprocess_config=PreprocessConfig(
+                denoise=False, sharpen=False, cleanup_min_area=50, mask_before_upscale=True,
+            ),
+        )
+        result = proc.process(_make_frame(image))
+        assert not result[10:14, 10:14].any()
+        assert result[30:40, 40:50].all()
+
+
+class TestCleanup:
+    """_cleanup() 테스트."""
+
+    @staticmethod
+    def _reference(binary: np.ndarray, min_area: int) -> np.ndarray:
+        num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        result = np.zeros_like(binary)
+        for i in range(1, num_labels):
+            if stats[i, cv2.CC_STAT_AREA] >= min_area:
+                result[labels == i] = 255
+        return result
+
+    def test_matches_per_label_loop_on_noise(self) -> None:
+        rng = np.random.RandomState(3)
+        binary = np.where(rng.random((80, 120)) < 0.3, 255, 0).astype(np.uint8)
+        for min_area in (1, 3, 10, 50):
+            result = CombatLogPreprocessor._cleanup(binary, min_area)
+            assert np.array_equal(result, self._reference(binary, min_area))
+
+    def test_empty_image(self) -> None:
+        binary = np.zeros((10, 10), dtype=np.uint8)
+        result = CombatLogPreprocessor._cleanup(binary, 5)
+        assert result.dtype == np.uint8
+        assert not result.any()
+
+
+def _text_like_frame(seed: int = 0) -> CapturedFrame:
+    """전투 로그처럼 줄 단위 텍스트가 있는 프레임."""
+    rng = np.random.RandomState(seed)
+    image = np.full((120, 300, 3), 25, dtype=np.uint8)
+    for y in range(8, 120, 20):
+        image[y:y + 10, 10:290] = np.where(rng.random((10, 280, 1)) < 0.4, 220, 25)
+    return _make_frame(image)
+
+
+class TestScratchBuffers:
+    """scratch 버퍼 재사용 테스트."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            PreprocessConfig(),
+            PreprocessConfig(mask_before_upscale=True),
+            PreprocessConfig(cleanup_min_area=0),
+        ],
+    )
+    def test_steady_state_allocates_almost_nothing(self, config: PreprocessConfig) -> None:
+        """워밍업 후에는 컴포넌트 통계 정도(수 KB)만 할당한다."""
+        proc = CombatLogPreprocessor(preprocess_config=config)
+        frame = _text_like_frame()
+        for _ in range(3):
+            result = proc.process(frame)
+        assert result.nbytes > 100_000
+
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            for _ in range(5):
+                proc.process(frame)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak - base < 8 * 1024
+
+    def test_reused_buffers_give_same_result(self) -> None:
+        """버퍼를 재사용해도 새 인스턴스와 결과가 같다."""
+        frame_a, frame_b = _text_like_frame(1), _text_like_frame(2)
+        proc = CombatLogPreprocessor()
+        proc.process(frame_a)
+        result = proc.process(frame_b)
+        assert np.array_equal(result, CombatLogPreprocessor().process(frame_b))
+
+    def test_output_ring_keeps_recent_results(self) -> None:
+        """연속된 출력은 서로 다른 버퍼에 담긴다."""
+        proc = CombatLogPreprocessor()
+        first = proc.process(_text_like_frame(1))
+        snapshot = first.copy()
+        second = proc.process(_text_like_frame(2))
+        assert not np.shares_memory(first, second)
+        assert np.array_equal(first, snapshot)
+
+    def test_output_ring_size(self) -> None:
+        """output_ring개의 출력이 지나야 버퍼가 재사용된다."""
+        proc = CombatLogPreprocessor(output_ring=4)
+        outputs = [proc.process(_text_like_frame(i)) for i in range(5)]
+        for i in range(1, 4):
+            assert not np.shares_memory(outputs[0], outputs[i])
+        assert np.shares_memory(outputs[0], outputs[4])
+
+    def test_shape_change_reallocates(self) -> None:
+        proc = CombatLogPreprocessor()
+        proc.process(_text_like_frame())
+        small = _make_frame(np.zeros((10, 20, 3), dtype=np.uint8))
+        assert proc.process(small).shape == (20, 40)
@@ -0,0 +1,163 @@
+"""헤드리스 리플레이 단위 테스트."""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from aion2meter.io.ocr_debugger import OcrDebugger
+from aion2meter.models import AppConfig, OcrResult
+from aion2meter.pipeline.replay import RecordedFrame, ReplayRunner, iter_recorded_frames, main
+
+_LINE = "몬스터에게 검격을 사용해 {}의 대미지를 줬습니다."
+
+
+def _frame(value: int) -> np.ndarray:
+    """프레임마다 내용이 달라 중복 판정에 걸리지 않는 이미지."""
+    image = np.zeros((20, 40, 3), dtype=np.uint8)
+    image[:, : value % 40 + 1] = 255
+    return image
+
+
+@pytest.fixture
+def recorded_dir(tmp_path):
+    debugger = OcrDebugger(output_dir=tmp_path / "rec", enabled=True)
+    processed = np.zeros((20, 40), dtype=np.uint8)
+    for i, (ts, damage) in enumerate([(1.0, 100), (1.5, 200), (20.0, 300)]):
+        debugger.dump(_frame(i), processed, _LINE.format(damage), [], timestamp=ts)
+    return tmp_path / "rec"
+
+
+def _config() -> AppConfig:
+    return AppConfig(color_ranges=AppConfig.default_color_ranges(), idle_timeout=5.0)
+
+
+class TestIterRecordedFrames:
+    def test_reads_directory_in_order(self, recorded_dir) -> None:
+        frames = list(iter_recorded_frames(recorded_dir))
+        assert [f.timestamp for f in frames] == [1.0, 1.5, 20.0]
+        assert frames[0].image.shape == (20, 40, 3)
+        assert frames[1].ocr_text == _LINE.format(200)
+
+    def test_reads_zip(self, recorded_dir, tmp_path) -> None:
+        archive = tmp_path / "rec.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for path in recorded_dir.rglob("*"):
+                if path.is_file():
+                    zf.write(path, path.relative_to(tmp_path).as_posix())
+        frames = list(iter_recorded_frames(archive))
+        assert [f.timestamp for f in frames] == [1.0, 1.5, 20.0]
+        assert frames[2].image is not None
+
+    def test_falls_back_to_fps_without_timestamp(self, recorded_dir) -> None:
+        for frame_json in recorded_dir.glob("frame_*/frame.json"):
+            frame_json.unlink()
+        frames = list(iter_recorded_frames(recorded_dir, fps=4))
+        assert [f.timestamp for f in frames] == [0.0, 0.25, 0.5]
+
+    def test_falls_back_to_event_timestamp(self, recorded_dir) -> None:
+        frame_dir = recorded_dir / "frame_000002"
+        (frame_dir / "frame.json").unlink()
+        (frame_dir / "events.json").write_text(json.dumps([{"timestamp": 7.0}]), encoding="utf-8")
+        frames = list(iter_recorded_frames(recorded_dir))
+        assert frames[1].timestamp == 7.0
+
+
+class TestReplayRunner:
+    def test_recorded_text_sessions(self, recorded_dir) -> None:
+        """녹화 텍스트로 파싱하면 idle_timeout 기준으로 세션이 나뉜다."""
+        runner = ReplayRunner(_config(), use_recorded_text=True)
+        result = runner.run(iter_recorded_frames(recorded_dir))
+
+        assert result.frames == 3
+        assert result.ocr_calls == 0
+        assert result.events == 3
+        assert [s.total_damage for s in result.sessions] == [300, 300]
+        assert result.stages["parse"].count == 3
+
+    def test_ocr_engine_called_per_frame(self, recorded_dir) -> None:
+        engine = MagicMock()
+        engine.recognize.side_effect = [
+            OcrResult(text=_LINE.format(d), confidence=90.0, timestamp=0.0) for d in (10, 20, 30)
+        ]
+        config = _config()
+        config.ocr_incremental = False
+        runner = ReplayRunner(config, ocr_engine=engine)
+        result = runner.run(iter_recorded_frames(recorded_dir))
+
+        assert engine.recognize.call_count == 3
+        assert result.ocr_calls == 3
+        assert sum(s.total_damage for s in result.sessions) == 60
+        assert result.stages["preprocess"].count == 3
+        assert result.stages["ocr"].count == 3
+
+    def test_failed_ocr_marks_lines_unread(self) -> None:
+        """증분 모드에서 엔진이 실패하면 그 줄들을 줄 분할기에 다시 보내라고 알린다."""
+        engine = MagicMock()
+        engine.recognize.return_value = OcrResult(text="", confidence=0.0, timestamp=0.0, failed=True)
+        runner = ReplayRunner(_config(), ocr_engine=engine)
+        segmenter = MagicMock()
+        segmenter.extract_new.return_value = np.zeros((4, 4), dtype=np.uint8)
+        segmenter.last_new_hashes = [5]
+        runner._segmenter = segmenter
+
+        runner.run([RecordedFrame(timestamp=0.0, image=_frame(1))])
+
+        segmenter.mark_unread.assert_called_once_with([5])
+
+    def test_duplicate_frames_skip_ocr(self) -> None:
+        engine = MagicMock()
+        engine.recognize.return_value = OcrResult(text="", confidence=0.0, timestamp=0.0)
+        config = _config()
+        config.ocr_incremental = False
+        image = _frame(3)
+        frames = [RecordedFrame(timestamp=t, image=image.copy()) for t in (0.0, 0.1, 0.2)]
+
+        result = ReplayRunner(config, ocr_engine=engine).run(frames)
+
+        assert engine.recognize.call_count == 1
+        assert result.duplicate_frames == 2
+
+    def test_realtime_follows_recorded_clock(self, monkeypatch) -> None:
+        sleeps: list[float] = []
+        monkeypatch.setattr("aion2meter.pipeline.replay.time.sleep", sleeps.append)
+        frames = [RecordedFrame(timestamp=t, ocr_text="") for t in (10.0, 11.0, 13.0)]
+
+        ReplayRunner(_config(), use_recorded_text=True).run(frames, realtime=True, speed=2.0)
+
+        assert len(sleeps) == 2
+        assert sleeps[0] == pytest.approx(0.5, abs=0.05)
+        assert sleeps[1] == pytest.approx(1.5, abs=0.05)
+
+
+class TestReplayCli:
+    def test_main_writes_json(self, recorded_dir, tmp_path, capsys) -> None:
+        out = tmp_path / "result.json"
+        code = main([
+            str(recorded_dir), "--recorded-text", "--config", str(tmp_path / "none.toml"),
+            "--json", str(out),
+        ])
+        assert code == 0
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert data["frames"] == 3
+        assert len(data["sessions"]) == 2
+        assert "session 1" in capsys.readouterr().out
+
+
+def test_replay_reads_frame_recording(tmp_path) -> None:
+    from aion2meter.io.frame_recorder import FrameRecorder
+
+    path = tmp_path / "session.a2rec"
+    recorder = FrameRecorder(path)
+    for i in range(3):
+        recorder.record(_frame(i), 5.0 + i)
+    recorder.close()
+
+    frames = list(iter_recorded_frames(path))
+    assert [f.timestamp for f in frames] == [5.0, 6.0, 7.0]
+    np.testing.assert_array_equal(frames[2].image, _frame(2))
+    assert frames[0].ocr_text is None
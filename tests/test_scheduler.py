@@ -0,0 +1,96 @@
+"""deadline 스케줄러 단위 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from aion2meter.pipeline.scheduler import DeadlineScheduler
+
+
+class _FakeTime:
+    """sleep이 clock을 정확히(또는 overshoot만큼 더) 전진시키는 가짜 시계."""
+
+    def __init__(self, overshoot: float = 0.0) -> None:
+        self.now = 0.0
+        self.overshoot = overshoot
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds + self.overshoot
+
+
+def _scheduler(t: _FakeTime) -> DeadlineScheduler:
+    return DeadlineScheduler(sleep=t.sleep, clock=t.clock)
+
+
+class TestDeadlineScheduler:
+    """DeadlineScheduler 테스트."""
+
+    def test_no_drift_with_work_time(self) -> None:
+        """작업 시간이 있어도 틱은 격자 시각에 맞춰진다."""
+        t = _FakeTime()
+        sched = _scheduler(t)
+        ticks = []
+        for _ in range(5):
+            ticks.append(t.now)
+            t.now += 0.03  # 작업
+            sched.wait(0.1)
+        ticks.append(t.now)
+        assert ticks[1:] == pytest.approx([0.13, 0.23, 0.33, 0.43, 0.53])
+
+    def test_sleep_overshoot_does_not_accumulate(self) -> None:
+        t = _FakeTime(overshoot=0.004)
+        sched = _scheduler(t)
+        for _ in range(10):
+            sched.wait(0.1)
+        # 격자(0.1 * 10)에서 overshoot 한 번만큼만 벗어난다
+        assert t.now == pytest.approx(1.004)
+        assert sched.stats()["jitter_max_ms"] == pytest.approx(4.0)
+        assert sched.missed_deadlines == 0
+
+    def test_missed_deadline_skips_to_next_grid_point(self) -> None:
+        t = _FakeTime()
+        sched = _scheduler(t)
+        sched.wait(0.1)  # 틱 @0.1, 다음 deadline 0.2
+        t.now += 0.25  # 0.35: 0.2, 0.3을 놓침
+        sched.wait(0.1)
+        assert t.now == pytest.approx(0.35)  # 대기 없이 바로
+        assert sched.missed_deadlines == 1
+        assert sched.skipped_ticks == 1
+        sched.wait(0.1)
+        assert t.now == pytest.approx(0.4)
+
+    def test_interval_change_rebases_from_last_tick(self) -> None:
+        t = _FakeTime()
+        sched = _scheduler(t)
+        sched.wait(0.1)  # @0.1
+        sched.wait(0.5)  # 직전 틱 0.1 + 0.5
+        assert t.now == pytest.approx(0.6)
+
+    def test_early_wake_restarts_grid(self) -> None:
+        t = _FakeTime()
+
+        def _interrupted(seconds: float) -> bool:
+            t.now += seconds / 2
+            return True
+
+        sched = DeadlineScheduler(sleep=_interrupted, clock=t.clock)
+        sched.wait(1.0)
+        assert t.now == pytest.approx(0.5)
+        assert sched.stats()["jitter_max_ms"] == 0.0
+        sched.wait(0.1)  # 새 격자: 0.5 + 0.1, 다시 절반만 잔다
+        assert t.now == pytest.approx(0.55)
+
+    def test_stats_counts(self) -> None:
+        t = _FakeTime()
+        sched = _scheduler(t)
+        for _ in range(3):
+            sched.wait(0.1)
+        stats = sched.stats()
+        assert stats["ticks"] == 3
+        assert stats["missed_deadlines"] == 0
+        assert stats["jitter_p50_ms"] == pytest.approx(0.0)
@@ -305,3 +305,26 @@ class TestSessionTag:
         sessions = repo.list_sessions()
         assert len(sessions) == 1
         assert sessions[0]["tag"] == ""
+
+
+class TestSessionLatency:
+    """캡처→표시 지연 요약 저장 검증."""
+
+    def test_save_and_get_latency(self, repo: SessionRepository) -> None:
+        latency = {"count": 10, "p50_ms": 120.0, "p95_ms": 180.0, "p99_ms": 210.0, "max_ms": 250.0}
+        sid = repo.save_session(_sample_events(), _sample_snapshot(), latency=latency)
+        row = repo.get_session_latency(sid)
+        assert row is not None
+        assert row["sample_count"] == 10
+        assert row["p95_ms"] == 180.0
+        assert row["max_ms"] == 250.0
+
+    def test_no_samples_not_stored(self, repo: SessionRepository) -> None:
+        sid = repo.save_session(_sample_events(), _sample_snapshot(), latency={"count": 0})
+        assert repo.get_session_latency(sid) is None
+
+    def test_deleted_with_session(self, repo: SessionRepository) -> None:
+        latency = {"count": 1, "p50_ms": 1.0, "p95_ms": 1.0, "p99_ms": 1.0, "max_ms": 1.0}
+        sid = repo.save_session(_sample_events(), _sample_snapshot(), latency=latency)
+        repo.delete_session(sid)
+        assert repo.get_session_latency(sid) is None